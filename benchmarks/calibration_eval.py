@@ -85,15 +85,9 @@ def run_calibration_benchmark():
     
     # Extract per-sample max discrepancy
     # The wrapper returns aggregated diagnostics. We need per-sample.
-    # Fortunately, our wrapper puts 'per_sample' list in the aggregate dict/object.
-    
-    # diag_agg is a ResLikDiagnostics object. 
-    # Check wrapper implementation:
-    # if is_batch: ... "per_sample": diagnostics_list ...
-    # And diagnostics_obj = wrap_diagnostics(agg_dict)
-    # So diag_agg.per_sample_details should be the list.
-    
-    discrepancies = [d["max_discrepancy"] for d in diag_agg.per_sample_details]
+    # Batch diagnostics carry per-sample values column-wise, so the
+    # discrepancy column can be used directly (no per-sample dicts).
+    discrepancies = diag_agg.discrepancy_values
     
     # 4. Compute Correlation
     rho, p_val = spearmanr(discrepancies, errors)
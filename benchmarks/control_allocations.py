@@ -0,0 +1,117 @@
+"""
+# ResLik Performance Benchmark
+Purpose: Measure memory retained per control decision by the diagnostics and control-signal objects.
+Non-goals: This is NOT a behavioral or accuracy benchmark.
+"""
+
+"""
+Benchmark: Allocations per Decision.
+
+Hypothesis:
+Per-tick loops create one diagnostics object, one control signal and one
+execution decision per step. Slotted objects drop the per-instance `__dict__`,
+and `evaluate(..., out=signal)` reuses one signal (and its `gate_summary` dict)
+for the whole loop. Memory retained per decision should
+shrink accordingly, and drop to zero for the reused signal.
+
+Metrics:
+- Blocks/decision: Traced allocations still alive per decision (tracemalloc).
+- Bytes/decision: Traced bytes still alive per decision.
+- us/decision: Mean wall time per decision.
+
+Output:
+Tabulated allocations for the previous dataclass-based objects and the slotted ones.
+"""
+
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+import numpy as np
+from reslik.diagnostics import ResLikDiagnostics, SummaryStats
+from reslik.control_surface import ControlSurface, ControlAction
+from reslik.control_policy import ExecutionDecision
+
+# Reference implementations: the previous dict-backed containers
+
+@dataclass
+class LegacyDiagnostics:
+    mean_gate_value: float
+    max_discrepancy: float
+    per_sample_details: Optional[List[Dict[str, float]]] = None
+
+@dataclass
+class LegacySignal:
+    reliability_score: float
+    mean_discrepancy: float
+    max_discrepancy: float
+    gate_summary: Dict[str, float]
+    recommended_action: ControlAction
+
+class LegacyDecision:
+    def __init__(self, action_id: str, confidence: float, metadata: Dict[str, Any] = None):
+        self.action_id = action_id
+        self.confidence = confidence
+        self.metadata = metadata or {}
+
+def legacy_step(surface, gate, disc, stats):
+    diag = LegacyDiagnostics(mean_gate_value=gate, max_discrepancy=disc)
+    summary = {"mean": gate}
+    summary.update(min=stats.min, max=stats.max, std=stats.std)
+    action = ControlAction.PROCEED if gate > surface.r_high else ControlAction.DEFER
+    signal = LegacySignal(gate, stats.mean, disc, summary, action)
+    return diag, signal, LegacyDecision(signal.recommended_action.name, signal.reliability_score)
+
+def slotted_step(surface, gate, disc, stats):
+    diag = ResLikDiagnostics(mean_gate_value=gate, max_discrepancy=disc,
+                             gate_stats=stats, discrepancy_stats=stats)
+    signal = surface.evaluate(diag)
+    return diag, signal, ExecutionDecision(signal.recommended_action.name, signal.reliability_score)
+
+def reused_step(surface, diag, signal):
+    surface.evaluate(diag, out=signal)
+    return signal
+
+def measure(step, args, n):
+    """Run `step` n times keeping every result alive; return blocks, bytes and us per call."""
+    kept = [None] * n
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for i in range(n):
+        kept[i] = step(*args)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    diff = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in diff)
+    size = sum(stat.size_diff for stat in diff)
+
+    start = time.perf_counter()
+    for i in range(n):
+        kept[i] = step(*args)
+    elapsed = time.perf_counter() - start
+    return blocks / n, size / n, 1e6 * elapsed / n
+
+def run_control_allocations():
+    print("=== Benchmark: Allocations per Decision ===")
+
+    n = 20000
+    np.random.seed(42)
+    stats = SummaryStats.from_values(np.random.uniform(0.5, 1.0, 64).astype(np.float32))
+    surface = ControlSurface()
+    diag = ResLikDiagnostics(mean_gate_value=0.9, max_discrepancy=1.0,
+                             gate_stats=stats, discrepancy_stats=stats)
+
+    print(f"{'Objects':<28} | {'Blocks/decision':<15} | {'Bytes/decision':<14} | {'us/decision':<11}")
+    print("-" * 78)
+
+    rows = [
+        ("Dataclass (previous)", legacy_step, (surface, 0.9, 1.0, stats)),
+        ("Slotted", slotted_step, (surface, 0.9, 1.0, stats)),
+        ("Slotted, reused signal", reused_step, (surface, diag, surface.evaluate(diag))),
+    ]
+    for name, step, args in rows:
+        blocks, size, us = measure(step, args, n)
+        print(f"{name:<28} | {blocks:<15.2f} | {size:<14.1f} | {us:<11.2f}")
+
+if __name__ == "__main__":
+    run_control_allocations()
@@ -0,0 +1,69 @@
+"""
+# ResLik Performance Benchmark
+Purpose: Measure how SharedMemoryExecutor throughput scales with the number of worker processes.
+Non-goals: This is NOT a behavioral or accuracy benchmark.
+"""
+
+"""
+Benchmark: Shared-Memory Process Pool Scaling.
+
+Hypothesis:
+Workers gate disjoint row ranges of a shared-memory batch in place and only
+return two small summaries. The input is filled into a batch from
+`SharedMemoryExecutor.empty()` and the outputs are returned as shared mappings,
+so no matrix is copied on either side and the work is embarrassingly parallel.
+Throughput should grow close to linearly with the number of workers, up to the
+number of physical cores.
+
+Metrics:
+- Seconds: Best wall time of one call (pool already started).
+- Rows/s: Throughput.
+- Speedup: Relative to the single-process ResLikUnit call.
+- Identical: Whether outputs equal the single-process outputs bit for bit.
+
+Output:
+Tabulated timings per worker count. Run against an optimized (Release) build
+of `_core` on a machine with several cores.
+"""
+
+import os
+import time
+import numpy as np
+from reslik import ResLikUnit
+from reslik.parallel import SharedMemoryExecutor
+
+def best_time(fn, repeats=3):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def run_process_pool_scaling():
+    print("=== Benchmark: Shared-Memory Process Pool Scaling ===")
+    print(f"CPU count: {os.cpu_count()}")
+
+    n_samples, input_dim, latent_dim = 200000, 256, 128
+    np.random.seed(42)
+    data = np.random.normal(0, 1, (n_samples, input_dim)).astype(np.float32)
+    unit = ResLikUnit(input_dim, latent_dim)
+
+    baseline, (expected, _) = best_time(lambda: unit(data))
+
+    print(f"{'Workers':<8} | {'Seconds':<8} | {'Rows/s':<10} | {'Speedup':<8} | {'Identical':<9}")
+    print("-" * 55)
+    print(f"{'in-proc':<8} | {baseline:<8.3f} | {n_samples / baseline:<10.0f} | {1.0:<8.2f} | {'yes':<9}")
+
+    for n_workers in [1, 2, 4, 8]:
+        with SharedMemoryExecutor(unit, n_workers=n_workers) as pool:
+            pool(data[:1024])  # start the workers
+            batch = pool.empty(n_samples)
+            batch[:] = data
+            elapsed, (outputs, _) = best_time(lambda: pool(batch))
+        identical = "yes" if np.array_equal(outputs, expected) else "no"
+        print(f"{n_workers:<8} | {elapsed:<8.3f} | {n_samples / elapsed:<10.0f} | "
+              f"{baseline / elapsed:<8.2f} | {identical:<9}")
+
+if __name__ == "__main__":
+    run_process_pool_scaling()
@@ -0,0 +1,91 @@
+"""
+# ResLik Performance Benchmark
+Purpose: Compare per-call latency of the native sensor kernels with the previous pure-NumPy sensors.
+Non-goals: This is NOT a behavioral or accuracy benchmark.
+"""
+
+"""
+Benchmark: Sensor Per-Call Latency.
+
+Hypothesis:
+For the small vectors typical in robotics (d = 2 to 16), the NumPy sensors
+spend their time in array construction, norm calls and dict building rather
+than arithmetic. The native kernels in `_core.sensors` should cut per-call
+latency by a large factor while returning the same values.
+
+Metrics:
+- NumPy us/call: Reference implementation (previous pure-NumPy sensor code).
+- Native us/call: AgreementSensor.evaluate / TemporalConsistencySensor.update.
+- Speedup: NumPy / Native.
+
+Output:
+Tabulated latencies per sensor and dimension. Run against an optimized
+(Release) build of `_core`; unoptimized builds inflate the binding overhead.
+"""
+
+import time
+import numpy as np
+from reslik.sensors.agreement_sensor import AgreementSensor
+from reslik.sensors.temporal_consistency import TemporalConsistencySensor
+
+def numpy_agreement(z1, z2, epsilon=1e-6):
+    z1 = np.array(z1, dtype=np.float32)
+    z2 = np.array(z2, dtype=np.float32)
+    agreement = np.dot(z1, z2) / ((np.linalg.norm(z1) * np.linalg.norm(z2)) + epsilon)
+    agreement = np.clip(agreement, -1.0, 1.0)
+    return {
+        "agreement": float(agreement),
+        "disagreement": float(1.0 - agreement),
+        "agreement_consistency": float((1.0 + agreement) / 2.0)
+    }
+
+class NumpyTemporal:
+    def __init__(self, alpha=1.0, epsilon=1e-6):
+        self.alpha = alpha
+        self.epsilon = epsilon
+        self._prev_z = None
+
+    def update(self, z_t):
+        z_t = np.array(z_t, dtype=np.float32)
+        if self._prev_z is None:
+            self._prev_z = z_t.copy()
+            return {"temporal_drift": 0.0, "temporal_consistency": 1.0}
+        drift = np.linalg.norm(z_t - self._prev_z) / (np.linalg.norm(self._prev_z) + self.epsilon)
+        consistency = np.exp(-self.alpha * drift)
+        self._prev_z = z_t.copy()
+        return {"temporal_drift": float(drift), "temporal_consistency": float(consistency)}
+
+def time_calls(fn, args, repeats=3):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for a in args:
+            fn(*a)
+        best = min(best, time.perf_counter() - start)
+    return 1e6 * best / len(args)
+
+def run_sensor_latency():
+    print("=== Benchmark: Sensor Per-Call Latency ===")
+
+    n_calls = 20000
+    np.random.seed(42)
+
+    print(f"{'Sensor':<12} | {'d':<4} | {'NumPy us/call':<14} | {'Native us/call':<15} | {'Speedup':<8}")
+    print("-" * 66)
+
+    for d in [2, 4, 8, 16]:
+        Z1 = np.random.normal(0, 1, (n_calls, d)).astype(np.float32)
+        Z2 = Z1 + np.random.normal(0, 0.1, (n_calls, d)).astype(np.float32)
+        pairs = list(zip(Z1, Z2))
+
+        native = time_calls(AgreementSensor().evaluate, pairs)
+        reference = time_calls(numpy_agreement, pairs)
+        print(f"{'Agreement':<12} | {d:<4} | {reference:<14.2f} | {native:<15.2f} | {reference / native:<8.1f}")
+
+        steps = [(z,) for z in np.cumsum(Z2, axis=0)]
+        native = time_calls(TemporalConsistencySensor().update, steps)
+        reference = time_calls(NumpyTemporal().update, steps)
+        print(f"{'Temporal':<12} | {d:<4} | {reference:<14.2f} | {native:<15.2f} | {reference / native:<8.1f}")
+
+if __name__ == "__main__":
+    run_sensor_latency()
@@ -0,0 +1,55 @@
+"""
+# ResLik Performance Benchmark
+Purpose: Show that peak memory of ResLikUnit.stream depends on chunk size, not dataset size.
+Non-goals: This is NOT a behavioral or accuracy benchmark.
+"""
+
+"""
+Benchmark: Streaming Peak Memory.
+
+Hypothesis:
+`ResLikUnit.stream` pulls one chunk at a time and keeps only merged
+aggregates between chunks. With chunks generated on the fly, peak traced
+memory should stay flat as the number of samples grows, while a single
+full-batch call grows linearly.
+
+Metrics:
+- Peak MiB (stream): Peak traced allocation while streaming all chunks.
+- Peak MiB (full): Peak traced allocation for one full-batch call (input included).
+
+Output:
+Tabulated peak memory for increasing dataset sizes at a fixed chunk size.
+"""
+
+import tracemalloc
+import numpy as np
+from reslik import ResLikUnit
+
+def generate_chunks(n_samples, chunk_size, dim, seed=42):
+    rng = np.random.default_rng(seed)
+    for start in range(0, n_samples, chunk_size):
+        yield rng.standard_normal((min(chunk_size, n_samples - start), dim), dtype=np.float32)
+
+def traced_peak(fn):
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20
+
+def run_stream_memory():
+    print("=== Benchmark: Streaming Peak Memory ===")
+
+    dim, latent, chunk_size = 128, 64, 4096
+    unit = ResLikUnit(dim, latent)
+
+    print(f"{'Samples':<10} | {'Peak MiB (stream)':<18} | {'Peak MiB (full)':<16}")
+    print("-" * 50)
+
+    for n_samples in [16384, 65536, 262144]:
+        streamed = traced_peak(lambda: unit.stream(generate_chunks(n_samples, chunk_size, dim)).run())
+        full = traced_peak(lambda: unit(np.concatenate(list(generate_chunks(n_samples, chunk_size, dim)))))
+        print(f"{n_samples:<10} | {streamed:<18.2f} | {full:<16.2f}")
+
+if __name__ == "__main__":
+    run_stream_memory()
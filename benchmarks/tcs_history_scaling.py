@@ -0,0 +1,63 @@
+"""
+# ResLik Performance Benchmark
+Purpose: Show that multi-lag TCS update cost does not depend on history length k.
+Non-goals: This is NOT a behavioral or accuracy benchmark.
+"""
+
+"""
+Benchmark: Multi-Lag TCS History Scaling.
+
+Hypothesis:
+MultiLagTemporalConsistencySensor keeps the last k representations in a
+preallocated ring buffer with cached norms and a running window sum. An update
+touches only the configured lags and the window mean, so its cost should stay
+flat as k (the largest lag / window) grows.
+
+Metrics:
+- us/update: Mean wall time per update after warm-up (ring buffer full).
+- Peak alloc: Peak traced Python allocation per update (tracemalloc).
+
+Output:
+Tabulated timings for increasing history lengths.
+"""
+
+import time
+import tracemalloc
+import numpy as np
+from reslik.sensors.temporal_consistency import MultiLagTemporalConsistencySensor
+
+def run_history_scaling():
+    print("=== Benchmark: Multi-Lag TCS History Scaling ===")
+
+    dim = 64
+    n_steps = 20000
+
+    np.random.seed(42)
+    stream = np.cumsum(np.random.normal(0, 0.01, (n_steps, dim)), axis=0).astype(np.float32)
+
+    print(f"{'History k':<10} | {'us/update':<10} | {'Peak alloc (B)':<14}")
+    print("-" * 42)
+
+    for k in [10, 100, 1000, 10000]:
+        sensor = MultiLagTemporalConsistencySensor(dim, lags=(1, 10, k), window=k)
+
+        # Warm-up: fill the ring buffer so every lag is active
+        for z in stream[:k]:
+            sensor.update(z)
+
+        timed = stream[k:k + 5000]
+        start = time.perf_counter()
+        for z in timed:
+            sensor.update(z)
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        for z in timed[:100]:
+            sensor.update(z)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"{k:<10} | {1e6 * elapsed / len(timed):<10.2f} | {peak:<14}")
+
+if __name__ == "__main__":
+    run_history_scaling()
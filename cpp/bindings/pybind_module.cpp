@@ -1,37 +1,313 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/numpy.h>
+#include <algorithm>
+#include <optional>
+#include <vector>
+#include <string>
 #include "reslik/reslik_unit.hpp"
 #include "reslik/diagnostics.hpp"
+#include "reslik/reference_stats.hpp"
+#include "reslik/normalization.hpp"
+#include "reslik/dtype.hpp"
+#include "reslik/sensors.hpp"
 
 namespace py = pybind11;
 
+// Inputs: C-contiguous float32 arrays are used in place; anything else is cast once.
+using FloatArray = py::array_t<float, py::array::c_style | py::array::forcecast>;
+// Outputs: must already be C-contiguous float32 (no silent copy that would drop results).
+using OutArray = py::array_t<float, py::array::c_style>;
+
+// Element types with native batch kernels
+enum class KernelDType { Float32, Float64, Float16 };
+
+static std::optional<KernelDType> kernel_dtype(const py::dtype& dt) {
+    if (dt.equal(py::dtype::of<float>())) return KernelDType::Float32;
+    if (dt.equal(py::dtype::of<double>())) return KernelDType::Float64;
+    if (dt.equal(py::dtype("float16"))) return KernelDType::Float16;
+    return std::nullopt;
+}
+
+// Call fn with a value of the C++ element type matching `type`
+template <typename Fn>
+static void dispatch_dtype(KernelDType type, Fn&& fn) {
+    switch (type) {
+        case KernelDType::Float32: fn(float{}); break;
+        case KernelDType::Float64: fn(double{}); break;
+        case KernelDType::Float16: fn(reslik::float16_t{}); break;
+    }
+}
+
+// Python type for normalization::NonFiniteInputError (subclass of ValueError)
+static PyObject* non_finite_input_error = nullptr;
+
+// Shape of an array as Python prints it, e.g. "(3,)" or "(2, 3)"
+static std::string shape_str(const py::array& a) {
+    return py::str(a.attr("shape")).cast<std::string>();
+}
+
 PYBIND11_MODULE(_core, m) {
     m.doc() = "ResLik C++ Core";
 
+    // NonFiniteInputError -> ValueError subclass carrying the offending `row`
+    non_finite_input_error = PyErr_NewException("reslik._core.NonFiniteInputError", PyExc_ValueError, nullptr);
+    m.attr("NonFiniteInputError") = py::handle(non_finite_input_error);
+    py::register_exception_translator([](std::exception_ptr p) {
+        try {
+            if (p) std::rethrow_exception(p);
+        } catch (const reslik::normalization::NonFiniteInputError& e) {
+            py::object err = py::reinterpret_borrow<py::object>(non_finite_input_error)(e.what());
+            err.attr("row") = e.row();
+            PyErr_SetObject(non_finite_input_error, err.ptr());
+        }
+    });
+
     // Bind DiagnosticReport struct
     py::class_<reslik::diagnostics::DiagnosticReport>(m, "DiagnosticReport")
         .def_readonly("mean_gate_value", &reslik::diagnostics::DiagnosticReport::mean_gate_value)
         .def_readonly("max_discrepancy", &reslik::diagnostics::DiagnosticReport::max_discrepancy)
         .def_readonly("collapsed_features", &reslik::diagnostics::DiagnosticReport::collapsed_features);
 
+    // Bind streaming gate/discrepancy aggregates filled by forward_batch
+    py::class_<reslik::diagnostics::RunningSummary>(m, "RunningSummary")
+        .def(py::init<>())
+        .def_readonly("count", &reslik::diagnostics::RunningSummary::count)
+        .def_readonly("sum", &reslik::diagnostics::RunningSummary::sum)
+        .def_readonly("sum_sq", &reslik::diagnostics::RunningSummary::sum_sq)
+        .def_readonly("min", &reslik::diagnostics::RunningSummary::min)
+        .def_readonly("max", &reslik::diagnostics::RunningSummary::max)
+        .def("mean", &reslik::diagnostics::RunningSummary::mean)
+        .def("variance", &reslik::diagnostics::RunningSummary::variance);
+
+    py::class_<reslik::diagnostics::BatchSummary>(m, "BatchSummary")
+        .def(py::init<>())
+        .def_readonly("gate", &reslik::diagnostics::BatchSummary::gate)
+        .def_readonly("discrepancy", &reslik::diagnostics::BatchSummary::discrepancy);
+
+    // Bind ReferenceStats (mergeable streaming reference accumulator)
+    py::class_<reslik::reference::ReferenceStats>(m, "ReferenceStats")
+        .def(py::init([](uint64_t count, double mean, double m2) {
+            return reslik::reference::ReferenceStats{count, mean, m2};
+        }), py::arg("count") = 0, py::arg("mean") = 0.0, py::arg("m2") = 0.0)
+        .def_readwrite("count", &reslik::reference::ReferenceStats::count)
+        .def_readwrite("mean", &reslik::reference::ReferenceStats::mean)
+        .def_readwrite("m2", &reslik::reference::ReferenceStats::m2)
+        .def("update", [](reslik::reference::ReferenceStats& self, py::array data) {
+            // float64 values are accumulated as given; anything else is cast to float32
+            if (data.dtype().equal(py::dtype::of<double>())) {
+                using DoubleArray = py::array_t<double, py::array::c_style | py::array::forcecast>;
+                DoubleArray values(data);
+                const double* ptr = values.data();
+                const size_t n = static_cast<size_t>(values.size());
+                py::gil_scoped_release release;
+                self.update(ptr, n);
+            } else {
+                FloatArray values(data);
+                const float* ptr = values.data();
+                const size_t n = static_cast<size_t>(values.size());
+                py::gil_scoped_release release;
+                self.update(ptr, n);
+            }
+        }, py::arg("data"), "Fold all values of `data` into the accumulator (float32 or float64).")
+        .def("merge", &reslik::reference::ReferenceStats::merge, py::arg("other"),
+             "Combine another partial state into this one.")
+        .def("variance", &reslik::reference::ReferenceStats::variance)
+        .def("stddev", &reslik::reference::ReferenceStats::stddev);
+
+    // Bind GatingParams (per-call reference stats and gating parameters)
+    py::class_<reslik::GatingParams>(m, "GatingParams")
+        .def(py::init([](float mu_ref, float sigma_ref, float lambda, float tau) {
+            return reslik::GatingParams{mu_ref, sigma_ref, lambda, tau};
+        }), py::arg("mu_ref") = 0.0f, py::arg("sigma_ref") = 1.0f,
+            py::arg("lambda_") = 1.0f, py::arg("tau") = 0.0f)
+        .def_readwrite("mu_ref", &reslik::GatingParams::mu_ref)
+        .def_readwrite("sigma_ref", &reslik::GatingParams::sigma_ref)
+        .def_readwrite("lambda_", &reslik::GatingParams::lambda)
+        .def_readwrite("tau", &reslik::GatingParams::tau);
+
     py::class_<reslik::ResLikUnit>(m, "ResLikUnit")
         .def(py::init<int, int>(), py::arg("input_dim"), py::arg("latent_dim"))
-        .def("forward", [](reslik::ResLikUnit& self, const std::vector<float>& input) -> py::array_t<float> {
-            std::vector<float> out = self.forward(input);
-            
-            // Create a numpy array of the same size
-            auto result = py::array_t<float>(out.size());
-            py::buffer_info buf = result.request();
-            float* ptr = static_cast<float*>(buf.ptr);
-
-            // Copy data
-            if (!out.empty()) {
-                std::memcpy(ptr, out.data(), out.size() * sizeof(float));
+        .def("forward", [](reslik::ResLikUnit& self, FloatArray input,
+                           std::optional<OutArray> out) -> OutArray {
+            if (input.ndim() != 1 || input.shape(0) != self.input_dim()) {
+                throw std::invalid_argument(
+                    "forward expects a 1D array of length " + std::to_string(self.input_dim()));
+            }
+            const py::ssize_t h = self.latent_dim();
+            OutArray result = out ? *out : OutArray(h);
+            if (result.ndim() != 1 || result.shape(0) != h) {
+                throw std::invalid_argument(
+                    "out must be a float32 array of shape (" + std::to_string(h) + ",)");
             }
 
+            // Kernel reads the NumPy buffer and writes the result in place
+            self.forward(input.data(), result.mutable_data());
             return result;
-        }, py::arg("input"), "Apply ResLik gating to a single input vector.")
+        }, py::arg("input"), py::arg("out").noconvert() = py::none(),
+           "Apply ResLik gating to a single input vector. "
+           "If `out` is given (C-contiguous float32), the result is written into it.")
+        .def("forward_batch", [](reslik::ResLikUnit& self, py::array input,
+                                 std::optional<py::array> out, int n_threads,
+                                 std::optional<reslik::GatingParams> params,
+                                 std::optional<py::dtype> out_dtype,
+                                 reslik::diagnostics::BatchSummary* summary) {
+            // float32/float64/float16 C-contiguous inputs are used in place;
+            // anything else is cast once to float32.
+            std::optional<KernelDType> in_type = kernel_dtype(input.dtype());
+            if (!in_type || !(input.flags() & py::array::c_style)) {
+                input = FloatArray(input);
+                in_type = KernelDType::Float32;
+            }
+            if (input.ndim() != 2 || input.shape(1) != self.input_dim()) {
+                throw std::invalid_argument(
+                    "forward_batch expects a 2D array of shape (n_samples, " +
+                    std::to_string(self.input_dim()) + ")");
+            }
+            const py::ssize_t n = input.shape(0);
+            const py::ssize_t h = self.latent_dim();
+
+            py::array output;
+            if (out) {
+                output = *out;
+                if (!(output.flags() & py::array::c_style) || !output.writeable()) {
+                    throw std::invalid_argument("out must be a writeable, C-contiguous array");
+                }
+                if (out_dtype && !output.dtype().equal(*out_dtype)) {
+                    throw std::invalid_argument("out dtype does not match out_dtype");
+                }
+            } else {
+                output = py::array(out_dtype ? *out_dtype : py::dtype::of<float>(),
+                                   std::vector<py::ssize_t>{n, h});
+            }
+            std::optional<KernelDType> out_type = kernel_dtype(output.dtype());
+            if (!out_type) {
+                throw std::invalid_argument("out dtype must be float32, float64 or float16");
+            }
+            if (output.ndim() != 2 || output.shape(0) != n || output.shape(1) != h) {
+                throw std::invalid_argument(
+                    "out must be an array of shape (" + std::to_string(n) + ", " +
+                    std::to_string(h) + ")");
+            }
+            py::array_t<float> gates(n);
+            py::array_t<float> discrepancies(n);
+
+            const void* in_ptr = input.data();
+            void* out_ptr = output.mutable_data();
+            float* gate_ptr = gates.mutable_data();
+            float* disc_ptr = discrepancies.mutable_data();
+
+            dispatch_dtype(*in_type, [&](auto in_tag) {
+                dispatch_dtype(*out_type, [&](auto out_tag) {
+                    using In = decltype(in_tag);
+                    using Out = decltype(out_tag);
+                    const In* x = static_cast<const In*>(in_ptr);
+                    Out* y = static_cast<Out*>(out_ptr);
+
+                    if (params) {
+                        // Stateless: unit state and get_diagnostics() are left untouched, so the
+                        // GIL can be released. Buffers stay referenced by the arrays above.
+                        py::gil_scoped_release release;
+                        self.forward_batch(x, static_cast<size_t>(n), y, gate_ptr, disc_ptr,
+                                           *params, n_threads, summary);
+                    } else {
+                        // Stateful: writes last_report, so the GIL stays held to serialize callers
+                        self.forward_batch(x, static_cast<size_t>(n), y, gate_ptr, disc_ptr,
+                                           n_threads, summary);
+                    }
+                });
+            });
+
+            return py::make_tuple(output, gates, discrepancies);
+        }, py::arg("input"), py::arg("out").noconvert() = py::none(), py::arg("n_threads") = 1,
+           py::arg("params") = py::none(), py::arg("out_dtype") = py::none(),
+           py::arg("summary") = nullptr,
+           "Apply ResLik gating to a (n_samples, input_dim) batch. "
+           "Splits rows across n_threads workers (0 = all cores). "
+           "If `params` (GatingParams) is given, the call is stateless and reentrant and "
+           "releases the GIL; otherwise the parameters from the set_* methods are used, "
+           "get_diagnostics() is updated and the GIL is held (not safe to share across "
+           "threads that also call the set_* methods). "
+           "float32, float64 and float16 inputs are read natively; the output dtype "
+           "follows `out`, else `out_dtype` (default float32). "
+           "If `summary` (BatchSummary) is given, it receives gate/discrepancy aggregates. "
+           "Returns (output, gates, discrepancies).")
+        .def("forward_csr", [](const reslik::ResLikUnit& self, py::array data, py::array indices,
+                               py::array indptr, const reslik::GatingParams& params,
+                               std::optional<OutArray> out, int n_threads,
+                               reslik::diagnostics::BatchSummary* summary) {
+            // float32/float64 values and int32/int64 indices are used in place;
+            // anything else is cast once (values to float32, indices to int64).
+            const bool wide_values = data.dtype().equal(py::dtype::of<double>());
+            if (!wide_values) {
+                data = FloatArray(data);
+            } else if (!(data.flags() & py::array::c_style)) {
+                data = py::array_t<double, py::array::c_style | py::array::forcecast>(data);
+            }
+            const bool narrow_index = indices.dtype().equal(py::dtype::of<int32_t>()) &&
+                                      indptr.dtype().equal(py::dtype::of<int32_t>()) &&
+                                      (indices.flags() & py::array::c_style) &&
+                                      (indptr.flags() & py::array::c_style);
+            if (!narrow_index) {
+                using IndexArray = py::array_t<int64_t, py::array::c_style | py::array::forcecast>;
+                indices = IndexArray(indices);
+                indptr = IndexArray(indptr);
+            }
+            if (data.ndim() != 1 || indices.ndim() != 1 || indptr.ndim() != 1 ||
+                indptr.size() < 1 || data.size() != indices.size()) {
+                throw std::invalid_argument(
+                    "forward_csr expects 1D data and indices of equal length and a non-empty 1D indptr. "
+                    "Got shapes " + shape_str(data) + ", " + shape_str(indices) + " and " + shape_str(indptr));
+            }
+            const py::ssize_t n = indptr.size() - 1;
+            const py::ssize_t h = self.latent_dim();
+            const py::ssize_t nnz = data.size();
+
+            OutArray output = out ? *out : OutArray(std::vector<py::ssize_t>{n, h});
+            if (!output.writeable() || output.ndim() != 2 || output.shape(0) != n || output.shape(1) != h) {
+                throw std::invalid_argument(
+                    "out must be a writeable float32 array of shape (" + std::to_string(n) + ", " +
+                    std::to_string(h) + ")");
+            }
+            py::array_t<float> gates(n);
+            py::array_t<float> discrepancies(n);
+
+            auto run = [&](auto value_tag, auto index_tag) {
+                using In = decltype(value_tag);
+                using Index = decltype(index_tag);
+                const In* values = static_cast<const In*>(data.data());
+                const Index* cols = static_cast<const Index*>(indices.data());
+                const Index* ptr = static_cast<const Index*>(indptr.data());
+                // indptr must address the data/indices buffers
+                if (ptr[n] > nnz) {
+                    throw std::invalid_argument(
+                        "forward_csr: indptr[-1] (" + std::to_string(ptr[n]) +
+                        ") exceeds the number of stored values (" + std::to_string(nnz) + ")");
+                }
+                float* y = output.mutable_data();
+                float* gate_ptr = gates.mutable_data();
+                float* disc_ptr = discrepancies.mutable_data();
+
+                py::gil_scoped_release release;
+                self.forward_csr(values, cols, ptr, static_cast<size_t>(n), y, gate_ptr, disc_ptr,
+                                 params, n_threads, summary);
+            };
+            if (wide_values) {
+                narrow_index ? run(double{}, int32_t{}) : run(double{}, int64_t{});
+            } else {
+                narrow_index ? run(float{}, int32_t{}) : run(float{}, int64_t{});
+            }
+
+            return py::make_tuple(output, gates, discrepancies);
+        }, py::arg("data"), py::arg("indices"), py::arg("indptr"), py::arg("params"),
+           py::arg("out").noconvert() = py::none(), py::arg("n_threads") = 1,
+           py::arg("summary") = nullptr,
+           "Apply ResLik gating to a CSR batch (data, indices, indptr) of shape "
+           "(len(indptr) - 1, input_dim). Stateless; cost scales with the number of nonzeros. "
+           "Column indices must be strictly increasing within each row. "
+           "Returns (output, gates, discrepancies) like forward_batch (float32 output).")
+        .def_property_readonly("input_dim", &reslik::ResLikUnit::input_dim)
+        .def_property_readonly("latent_dim", &reslik::ResLikUnit::latent_dim)
         .def("set_reference_stats", &reslik::ResLikUnit::set_reference_stats, 
              py::arg("mu_ref"), py::arg("sigma_ref"), 
              "Set reference statistics for discrepancy calculation.")
@@ -41,6 +317,208 @@ PYBIND11_MODULE(_core, m) {
              "Set the discrepancy dead-zone threshold.")
         .def("get_diagnostics", &reslik::ResLikUnit::get_diagnostics, 
              "Get the diagnostics from the last forward pass.")
-        .def("update_stats", &reslik::ResLikUnit::update_stats, 
-             "Update internal running statistics (not yet implemented).");
-}
\ No newline at end of file
+        .def("update_stats", [](reslik::ResLikUnit& self, py::array batch) {
+            if (batch.ndim() != 2 || batch.shape(1) != self.input_dim()) {
+                throw std::invalid_argument(
+                    "update_stats expects a 2D array of shape (n_samples, " +
+                    std::to_string(self.input_dim()) + ")");
+            }
+            const size_t n = static_cast<size_t>(batch.shape(0));
+            // float64 values are accumulated as given; anything else is cast to float32
+            if (batch.dtype().equal(py::dtype::of<double>())) {
+                using DoubleArray = py::array_t<double, py::array::c_style | py::array::forcecast>;
+                DoubleArray values(batch);
+                const double* ptr = values.data();
+                py::gil_scoped_release release;
+                self.update_stats(ptr, n);
+            } else {
+                FloatArray values(batch);
+                const float* ptr = values.data();
+                py::gil_scoped_release release;
+                self.update_stats(ptr, n);
+            }
+        }, py::arg("batch"),
+           "Fold a (n_samples, input_dim) float32 or float64 batch into the running "
+           "reference statistics.")
+        .def("reference_stats", &reslik::ResLikUnit::reference_stats,
+             "Copy of the running reference statistics.")
+        .def("load_reference_stats", &reslik::ResLikUnit::load_reference_stats, py::arg("stats"),
+             "Replace the running reference statistics (e.g. with merged shard states).")
+        .def("reset_stats", &reslik::ResLikUnit::reset_stats,
+             "Discard the running reference statistics.");
+
+    // Sensor kernels (Agreement Sensor, Temporal Consistency Sensor)
+    py::module_ sensors = m.def_submodule("sensors", "Native RLCS sensor kernels");
+
+    sensors.def("l2_norm", [](FloatArray z) {
+        return reslik::sensors::l2_norm(z.data(), static_cast<size_t>(z.size()));
+    }, py::arg("z"), "L2 norm of a vector, accumulated in double precision.");
+
+    sensors.def("agreement", [](FloatArray z1, FloatArray z2, float epsilon) {
+        if (z1.ndim() != 1 || z2.ndim() != 1) {
+            throw py::value_error("Inputs must be 1D arrays. Got shapes " + shape_str(z1) +
+                                  " and " + shape_str(z2) + ".");
+        }
+        if (z1.shape(0) != z2.shape(0)) {
+            throw py::value_error("Input shapes must match. Got " + shape_str(z1) +
+                                  " and " + shape_str(z2) + ".");
+        }
+        const auto s = reslik::sensors::agreement(z1.data(), z2.data(),
+                                                  static_cast<size_t>(z1.shape(0)), epsilon);
+        return py::make_tuple(s.agreement, s.disagreement, s.consistency);
+    }, py::arg("z1"), py::arg("z2"), py::arg("epsilon"),
+       "Agreement of two 1D vectors. Returns (agreement, disagreement, consistency).");
+
+    sensors.def("agreement_batch", [](FloatArray Z1, FloatArray Z2, float epsilon,
+                                      OutArray agreement, OutArray disagreement, OutArray consistency) {
+        if (Z1.ndim() != 2 || Z2.ndim() != 2) {
+            throw py::value_error("Inputs must be 2D arrays (N, d). Got shapes " + shape_str(Z1) +
+                                  " and " + shape_str(Z2) + ".");
+        }
+        if (Z1.shape(0) != Z2.shape(0) || Z1.shape(1) != Z2.shape(1)) {
+            throw py::value_error("Input shapes must match. Got " + shape_str(Z1) +
+                                  " and " + shape_str(Z2) + ".");
+        }
+        const py::ssize_t n = Z1.shape(0);
+        if (agreement.size() != n || disagreement.size() != n || consistency.size() != n) {
+            throw py::value_error("Output arrays must have " + std::to_string(n) + " elements.");
+        }
+        const float* a = Z1.data();
+        const float* b = Z2.data();
+        float* ag = agreement.mutable_data();
+        float* dis = disagreement.mutable_data();
+        float* con = consistency.mutable_data();
+        const size_t d = static_cast<size_t>(Z1.shape(1));
+        py::gil_scoped_release release;
+        reslik::sensors::agreement_batch(a, b, static_cast<size_t>(n), d, epsilon, ag, dis, con);
+    }, py::arg("Z1"), py::arg("Z2"), py::arg("epsilon"),
+       py::arg("agreement").noconvert(), py::arg("disagreement").noconvert(),
+       py::arg("consistency").noconvert(),
+       "Row-wise agreement of two (N, d) matrices, written into three float32 (N,) arrays.");
+
+    sensors.def("temporal_update", [](FloatArray z, OutArray prev, double prev_norm,
+                                      float alpha, float epsilon) {
+        if (z.ndim() != 1) {
+            throw py::value_error("Input z_t must be 1D, got shape " + shape_str(z));
+        }
+        if (prev.ndim() != 1 || prev.shape(0) != z.shape(0)) {
+            throw py::value_error("Input z_t has shape " + shape_str(z) +
+                                  " but the previous representation has shape " + shape_str(prev));
+        }
+        const size_t d = static_cast<size_t>(z.shape(0));
+        const auto s = reslik::sensors::temporal_step(z.data(), prev.data(), prev_norm, d,
+                                                      alpha, epsilon);
+        std::copy(z.data(), z.data() + d, prev.mutable_data());
+        const double norm = reslik::sensors::l2_norm(z.data(), d);
+        return py::make_tuple(s.drift, s.consistency, norm);
+    }, py::arg("z"), py::arg("prev").noconvert(), py::arg("prev_norm"),
+       py::arg("alpha"), py::arg("epsilon"),
+       "One streaming TCS step. Overwrites `prev` with `z` and returns "
+       "(drift, consistency, norm of z).");
+
+    sensors.def("temporal_sequence", [](FloatArray Z, float alpha, float epsilon) {
+        if (Z.ndim() != 2 && Z.ndim() != 3) {
+            throw py::value_error("Input must be (T, d) or (B, T, d), got shape " + shape_str(Z));
+        }
+        std::vector<py::ssize_t> shape(Z.shape(), Z.shape() + Z.ndim() - 1);
+        py::array_t<float> drift(shape);
+        py::array_t<float> consistency(shape);
+
+        const size_t batches = Z.ndim() == 3 ? static_cast<size_t>(Z.shape(0)) : 1;
+        const size_t T = static_cast<size_t>(Z.shape(Z.ndim() - 2));
+        const size_t d = static_cast<size_t>(Z.shape(Z.ndim() - 1));
+        const float* z = Z.data();
+        float* dr = drift.mutable_data();
+        float* co = consistency.mutable_data();
+        {
+            py::gil_scoped_release release;
+            for (size_t b = 0; b < batches; ++b) {
+                reslik::sensors::temporal_sequence(z + b * T * d, T, d, alpha, epsilon,
+                                                   dr + b * T, co + b * T);
+            }
+        }
+        return py::make_tuple(drift, consistency);
+    }, py::arg("Z"), py::arg("alpha"), py::arg("epsilon"),
+       "Drift and consistency series of (T, d) or (B, T, d) trajectories.");
+
+    sensors.def("temporal_update_slots", [](FloatArray Z, py::array_t<int64_t, py::array::c_style | py::array::forcecast> slots,
+                                            py::array_t<bool, py::array::c_style | py::array::forcecast> is_new,
+                                            OutArray state,
+                                            py::array_t<double, py::array::c_style> state_norm,
+                                            float alpha, float epsilon) {
+        if (Z.ndim() != 2 || state.ndim() != 2 || Z.shape(1) != state.shape(1)) {
+            throw py::value_error("Z must have shape (M, d) matching the (S, d) state, got " +
+                                  shape_str(Z) + " and " + shape_str(state));
+        }
+        const py::ssize_t m = Z.shape(0);
+        if (slots.size() != m || is_new.size() != m || state_norm.size() != state.shape(0)) {
+            throw py::value_error("slots/is_new must have M elements and state_norm S elements.");
+        }
+        const int64_t* sl = slots.data();
+        for (py::ssize_t i = 0; i < m; ++i) {
+            if (sl[i] < 0 || sl[i] >= state.shape(0)) {
+                throw py::index_error("Slot " + std::to_string(sl[i]) + " is out of range.");
+            }
+        }
+
+        py::array_t<float> drift(m);
+        py::array_t<float> consistency(m);
+        const float* z = Z.data();
+        const bool* nw = is_new.data();
+        float* st = state.mutable_data();
+        double* sn = state_norm.mutable_data();
+        float* dr = drift.mutable_data();
+        float* co = consistency.mutable_data();
+        {
+            py::gil_scoped_release release;
+            reslik::sensors::temporal_update_slots(z, static_cast<size_t>(m),
+                                                   static_cast<size_t>(Z.shape(1)), sl, nw,
+                                                   st, sn, alpha, epsilon, dr, co);
+        }
+        return py::make_tuple(drift, consistency);
+    }, py::arg("Z"), py::arg("slots"), py::arg("is_new"), py::arg("state").noconvert(),
+       py::arg("state_norm").noconvert(), py::arg("alpha"), py::arg("epsilon"),
+       "Streaming TCS steps for M streams stored by slot in an (S, d) state. "
+       "Updates `state` and `state_norm` in place and returns (drift, consistency).");
+
+    sensors.def("temporal_multi_lag", [](FloatArray z, OutArray ring,
+                                         py::array_t<double, py::array::c_style> ring_norm,
+                                         size_t head, uint64_t count,
+                                         py::array_t<int64_t, py::array::c_style> lags,
+                                         py::array_t<double, py::array::c_style> window_sum,
+                                         size_t window, float alpha, float epsilon,
+                                         py::array_t<double, py::array::c_style> out) {
+        if (ring.ndim() != 2 || z.ndim() != 1 || z.shape(0) != ring.shape(1)) {
+            throw py::value_error("z must have shape (d,) matching the (k, d) ring, got " +
+                                  shape_str(z) + " and " + shape_str(ring));
+        }
+        const size_t k = static_cast<size_t>(ring.shape(0));
+        const size_t d = static_cast<size_t>(ring.shape(1));
+        const size_t n_lags = static_cast<size_t>(lags.size());
+        if (static_cast<size_t>(ring_norm.size()) != k || static_cast<size_t>(window_sum.size()) != d ||
+            out.ndim() != 2 || out.shape(0) != 2 || static_cast<size_t>(out.shape(1)) != n_lags + 1) {
+            throw py::value_error("ring_norm must have k elements, window_sum d elements and out "
+                                  "shape (2, n_lags + 1).");
+        }
+        const int64_t* lg = lags.data();
+        for (size_t l = 0; l < n_lags; ++l) {
+            if (lg[l] < 1 || static_cast<size_t>(lg[l]) > k) {
+                throw py::value_error("Lag " + std::to_string(lg[l]) + " is outside [1, " +
+                                      std::to_string(k) + "].");
+            }
+        }
+        if (head >= k || window < 1 || window > k) {
+            throw py::value_error("head must be < k and window in [1, k].");
+        }
+        double* o = out.mutable_data();
+        reslik::sensors::temporal_multi_lag_step(z.data(), d, ring.mutable_data(),
+                                                 ring_norm.mutable_data(), k, head, count, lg,
+                                                 n_lags, window_sum.mutable_data(), window,
+                                                 alpha, epsilon, o, o + n_lags + 1);
+    }, py::arg("z"), py::arg("ring").noconvert(), py::arg("ring_norm").noconvert(),
+       py::arg("head"), py::arg("count"), py::arg("lags").noconvert(),
+       py::arg("window_sum").noconvert(), py::arg("window"), py::arg("alpha"),
+       py::arg("epsilon"), py::arg("out").noconvert(),
+       "One multi-lag TCS step. Writes drifts and consistencies into the (2, n_lags + 1) "
+       "`out` and updates `ring`, `ring_norm` and `window_sum` in place.");
+}
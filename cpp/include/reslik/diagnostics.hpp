@@ -1,5 +1,9 @@
 #pragma once
 
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <limits>
 #include <string>
 #include <map>
 #include <vector>
@@ -16,6 +20,71 @@ struct DiagnosticReport {
     std::vector<int> collapsed_features;
 };
 
+/**
+ * @brief Per-sample diagnostics returned alongside a stateless forward pass.
+ */
+struct SampleDiagnostics {
+    float gate;
+    float discrepancy;
+};
+
+/**
+ * @brief Streaming aggregate of one per-sample diagnostic.
+ *
+ * count, sum, sum of squares, min and max are enough to report mean, spread
+ * and range in O(1) without keeping the per-sample values. Partial summaries
+ * from independent row ranges combine with merge().
+ */
+struct RunningSummary {
+    uint64_t count = 0;
+    double sum = 0.0;
+    double sum_sq = 0.0;
+    float min = std::numeric_limits<float>::infinity();
+    float max = -std::numeric_limits<float>::infinity();
+
+    void add(float v) {
+        ++count;
+        sum += v;
+        sum_sq += static_cast<double>(v) * v;
+        min = std::min(min, v);
+        max = std::max(max, v);
+    }
+
+    void merge(const RunningSummary& other) {
+        count += other.count;
+        sum += other.sum;
+        sum_sq += other.sum_sq;
+        min = std::min(min, other.min);
+        max = std::max(max, other.max);
+    }
+
+    double mean() const {
+        return count > 0 ? sum / static_cast<double>(count) : 0.0;
+    }
+
+    /**
+     * @brief Population variance (0 if empty).
+     */
+    double variance() const {
+        if (count == 0) return 0.0;
+        const double m = mean();
+        return std::max(0.0, sum_sq / static_cast<double>(count) - m * m);
+    }
+};
+
+/**
+ * @brief Gate and discrepancy summaries accumulated during a batched forward pass.
+ */
+struct BatchSummary {
+    RunningSummary gate;
+    RunningSummary discrepancy;
+
+    void merge(const BatchSummary& other) {
+        gate.merge(other.gate);
+        discrepancy.merge(other.discrepancy);
+    }
+};
+
 /**
  * @brief Compute the discrepancy score for a feature embedding.
  * Equation: C_i = |mu_hat_i - mu_ref_i| / (sigma_ref_i + epsilon)
@@ -33,6 +102,38 @@ float compute_discrepancy(
     float epsilon = 1e-8f
 );
 
+/**
+ * @brief Pointer overload of compute_discrepancy for rows inside a batch buffer.
+ * Instantiated for float, double and float16_t embeddings (see dtype.hpp).
+ *
+ * @param z Pointer to `n` embedding values.
+ * @param n Embedding length.
+ */
+template <typename T>
+float compute_discrepancy(
+    const T* z,
+    size_t n,
+    float mu_ref,
+    float sigma_ref,
+    float epsilon = 1e-8f
+);
+
+/**
+ * @brief Discrepancy of an embedding from its precomputed sum.
+ *
+ * `sum` is the double-precision sum of all `n` values. compute_discrepancy(z, n, ...)
+ * equals discrepancy_from_sum<T>(sum of z, n, ...), so a sparse row that sums only
+ * its nonzeros gets the same score as its dense form.
+ */
+template <typename T>
+float discrepancy_from_sum(
+    double sum,
+    size_t n,
+    float mu_ref,
+    float sigma_ref,
+    float epsilon = 1e-8f
+);
+
 /**
  * @brief Get the latest diagnostic report.
  * 
@@ -0,0 +1,118 @@
+#pragma once
+
+#include <cstdint>
+#include <cstring>
+
+namespace reslik {
+
+/**
+ * @brief IEEE 754 binary16 storage type (bit-compatible with numpy.float16).
+ * Arithmetic is never done in half precision; values are widened on load.
+ */
+struct float16_t {
+    uint16_t bits;
+};
+
+/**
+ * @brief Convert binary16 bits to float (exact).
+ */
+inline float half_to_float(uint16_t h) {
+    uint32_t sign = static_cast<uint32_t>(h & 0x8000u) << 16;
+    uint32_t exp = (h >> 10) & 0x1Fu;
+    uint32_t mant = h & 0x3FFu;
+    uint32_t bits;
+
+    if (exp == 0) {
+        if (mant == 0) {
+            bits = sign; // +-0
+        } else {
+            // Subnormal: renormalize into a float normal
+            exp = 127 - 15 + 1;
+            while ((mant & 0x400u) == 0) {
+                mant <<= 1;
+                --exp;
+            }
+            mant &= 0x3FFu;
+            bits = sign | (exp << 23) | (mant << 13);
+        }
+    } else if (exp == 0x1F) {
+        bits = sign | 0x7F800000u | (mant << 13); // Inf / NaN
+    } else {
+        bits = sign | ((exp + 127 - 15) << 23) | (mant << 13);
+    }
+
+    float f;
+    std::memcpy(&f, &bits, sizeof(f));
+    return f;
+}
+
+/**
+ * @brief Convert float to binary16 bits, rounding to nearest even (as numpy does).
+ */
+inline uint16_t float_to_half(float f) {
+    uint32_t x;
+    std::memcpy(&x, &f, sizeof(x));
+    uint16_t sign = static_cast<uint16_t>((x >> 16) & 0x8000u);
+    uint32_t exp = (x >> 23) & 0xFFu;
+    uint32_t mant = x & 0x7FFFFFu;
+
+    if (exp == 0xFF) {
+        return sign | 0x7C00u | (mant ? 0x200u : 0u); // Inf / quiet NaN
+    }
+
+    int32_t e = static_cast<int32_t>(exp) - 127 + 15;
+    if (e >= 0x1F) {
+        return sign | 0x7C00u; // Overflow -> Inf
+    }
+
+    if (e <= 0) {
+        if (e < -10) {
+            return sign; // Underflow -> +-0
+        }
+        // Subnormal half: shift the full 24-bit significand into place
+        uint32_t m = mant | 0x800000u;
+        uint32_t shift = static_cast<uint32_t>(14 - e);
+        uint32_t h = m >> shift;
+        uint32_t rem = m & ((1u << shift) - 1u);
+        uint32_t halfway = 1u << (shift - 1);
+        if (rem > halfway || (rem == halfway && (h & 1u))) {
+            ++h;
+        }
+        return static_cast<uint16_t>(sign | h);
+    }
+
+    uint32_t h = (static_cast<uint32_t>(e) << 10) | (mant >> 13);
+    uint32_t rem = mant & 0x1FFFu;
+    if (rem > 0x1000u || (rem == 0x1000u && (h & 1u))) {
+        ++h; // May carry into the exponent, which is the correct rounding (up to Inf)
+    }
+    return static_cast<uint16_t>(sign | h);
+}
+
+/**
+ * @brief Precision used for per-row arithmetic on inputs of type T.
+ * float and half inputs compute in float (identical to the original float32
+ * path); double inputs stay in double. Row sums always accumulate in double.
+ */
+template <typename T> struct compute_type { using type = float; };
+template <> struct compute_type<double> { using type = double; };
+
+/**
+ * @brief Widen a stored value to the compute type.
+ */
+template <typename C, typename T>
+inline C load_as(T v) { return static_cast<C>(v); }
+
+template <typename C>
+inline C load_as(float16_t v) { return static_cast<C>(half_to_float(v.bits)); }
+
+/**
+ * @brief Narrow a float result to the storage type.
+ */
+template <typename T>
+inline T store_as(float v) { return static_cast<T>(v); }
+
+template <>
+inline float16_t store_as<float16_t>(float v) { return float16_t{float_to_half(v)}; }
+
+} // namespace reslik
@@ -1,5 +1,6 @@
 #pragma once
 
+#include <cstddef>
 #include <vector>
 
 namespace reslik {
@@ -28,6 +29,11 @@ float softplus(float x);
  */
 float compute_learned_scale(const std::vector<float>& z_tilde, const std::vector<float>& u);
 
+/**
+ * @brief Pointer overload of compute_learned_scale. Both buffers hold `n` values.
+ */
+float compute_learned_scale(const float* z_tilde, const float* u, size_t n);
+
 /**
  * @brief Compute the multiplicative gate values.
  * 
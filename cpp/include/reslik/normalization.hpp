@@ -2,6 +2,7 @@
 
 #include <vector>
 #include <string>
+#include <stdexcept>
 
 namespace reslik {
 namespace normalization {
@@ -16,6 +17,19 @@ struct MatrixView {
     size_t cols;
 };
 
+/**
+ * @brief Raised when a row of the input contains NaN or Inf.
+ * Carries the index of the first offending row.
+ */
+class NonFiniteInputError : public std::invalid_argument {
+public:
+    NonFiniteInputError(const std::string& context, size_t row);
+    size_t row() const { return row_; }
+
+private:
+    size_t row_;
+};
+
 /**
  * @brief Checks if the matrix contains any NaNs or Infinities.
  * @throws std::runtime_error if invalid values are found.
@@ -41,8 +55,31 @@ void validate_stddev(const std::vector<float>& stddev, const std::string& contex
  * @param input Input matrix of shape (n_features, embedding_dim)
  * @param epsilon Stability constant.
  * @return std::vector<float> Normalized data in row-major order.
+ * @throws NonFiniteInputError if a row contains NaN or Inf.
  */
 std::vector<float> standardize_per_feature(const MatrixView& input, float epsilon = 1e-8f);
 
+/**
+ * @brief Standardizes a single row into a caller-provided buffer.
+ * Same math as standardize_per_feature, without allocating.
+ *
+ * Finiteness is checked on the fly: a NaN or Inf anywhere in the row makes the
+ * (double precision) row sum non-finite, so no separate validation pass is needed.
+ * Only then is the row scanned element by element, to tell NaN/Inf apart from
+ * finite float64 values whose sums overflow; the latter are standardized after
+ * dividing the row by its largest magnitude.
+ *
+ * Instantiated for float, double and float16_t inputs (see dtype.hpp). Sums
+ * accumulate in double; double inputs are also centered and scaled in double.
+ *
+ * @param row Pointer to `cols` input values.
+ * @param cols Row length.
+ * @param out Pointer to `cols` output values (may not alias `row`).
+ * @param epsilon Stability constant.
+ * @return bool False if the row contains NaN or Inf (`out` is then left unspecified).
+ */
+template <typename T>
+bool standardize_row(const T* row, size_t cols, float* out, float epsilon = 1e-8f);
+
 } // namespace normalization
 } // namespace reslik
@@ -0,0 +1,60 @@
+#pragma once
+
+#include <cstddef>
+#include <vector>
+
+namespace reslik {
+namespace projection {
+
+/**
+ * @brief Rows per tile in project_rows_blocked.
+ * A tile of standardized inputs is multiplied against one cached block of W1^T.
+ */
+constexpr size_t kRowTile = 16;
+
+/**
+ * @brief Latent columns per tile in project_rows_blocked.
+ */
+constexpr size_t kColTile = 64;
+
+/**
+ * @brief Transpose W1 from (h, d) to (d, h) row-major.
+ * The blocked kernel reads W1^T so its inner loop runs over contiguous latent columns.
+ */
+std::vector<float> transpose(const std::vector<float>& W1, size_t h, size_t d);
+
+/**
+ * @brief Reference affine projection, one matrix-vector product per row.
+ * Equation: F[n, i] = b1[i] + sum_j W1[i, j] * Z[n, j]  (theory.md Step 2, before GELU)
+ *
+ * @param W1 Weights of shape (h, d).
+ * @param b1 Bias of length h.
+ * @param Z Standardized inputs of shape (n, d).
+ * @param F Output of shape (n, h).
+ */
+void project_rows_scalar(
+    const float* W1, const float* b1, const float* Z,
+    size_t n, size_t d, size_t h, float* F
+);
+
+/**
+ * @brief Cache-blocked affine projection for a batch (GEMM: F = Z * W1^T + b1).
+ *
+ * Rows are processed in tiles of kRowTile and latent columns in tiles of
+ * kColTile, so each block of W1^T is reused across a tile of rows while it is
+ * in cache. The inner loop is a contiguous axpy over latent columns and
+ * vectorizes. For every output element the sum over j runs in the same order
+ * as project_rows_scalar.
+ *
+ * @param W1T Transposed weights of shape (d, h) (see transpose()).
+ * @param b1 Bias of length h.
+ * @param Z Standardized inputs of shape (n, d).
+ * @param F Output of shape (n, h).
+ */
+void project_rows_blocked(
+    const float* W1T, const float* b1, const float* Z,
+    size_t n, size_t d, size_t h, float* F
+);
+
+} // namespace projection
+} // namespace reslik
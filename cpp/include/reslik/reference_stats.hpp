@@ -0,0 +1,55 @@
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+
+namespace reslik {
+namespace reference {
+
+/**
+ * @brief Mergeable streaming accumulator for the reference statistics.
+ *
+ * Tracks count, mean and sum of squared deviations (M2) of every embedding
+ * value seen. Treating mu_ref and sigma_ref as the moments of the pooled
+ * per-element distribution is a design choice of this accumulator; theory.md
+ * Step 4 only requires two reference scalars. Chunks are folded in with
+ * Welford / Chan updates, so memory is O(1) regardless of how many batches are
+ * seen, and partial states from independent workers combine with merge().
+ */
+struct ReferenceStats {
+    uint64_t count = 0;
+    double mean = 0.0;
+    double m2 = 0.0;
+
+    /**
+     * @brief Fold a chunk of values into the accumulator.
+     *
+     * @param data Pointer to `n` values (e.g. a row-major batch).
+     * @param n Number of values.
+     * @throws std::invalid_argument if a value is NaN or Inf.
+     */
+    void update(const float* data, size_t n);
+
+    /**
+     * @brief Fold a chunk of double-precision values into the accumulator.
+     */
+    void update(const double* data, size_t n);
+
+    /**
+     * @brief Combine another partial state into this one (Chan et al.).
+     */
+    void merge(const ReferenceStats& other);
+
+    /**
+     * @brief Population variance of all values seen (0 if count < 2).
+     */
+    double variance() const;
+
+    /**
+     * @brief Population standard deviation of all values seen.
+     */
+    double stddev() const;
+};
+
+} // namespace reference
+} // namespace reslik
@@ -3,9 +3,24 @@
 #include <vector>
 #include <memory>
 #include "reslik/diagnostics.hpp"
+#include "reslik/reference_stats.hpp"
+#include "reslik/dtype.hpp"
 
 namespace reslik {
 
+/**
+ * @brief Reference statistics and gating sensitivity for a forward pass.
+ *
+ * Passing these explicitly (instead of through the set_* methods) keeps the
+ * call free of shared mutable state, so one unit can serve many threads.
+ */
+struct GatingParams {
+    float mu_ref = 0.0f;     // Reference mean (Step 4)
+    float sigma_ref = 1.0f;  // Reference standard deviation, clamped to >= 1e-8 (Step 4)
+    float lambda = 1.0f;     // Gating sensitivity (Step 5)
+    float tau = 0.0f;        // Dead-zone threshold, clamped to >= 0 (Step 5)
+};
+
 /**
  * @brief Main Residual Likelihood Unit.
  * 
@@ -29,6 +44,138 @@ public:
      */
     std::vector<float> forward(const std::vector<float>& input);
 
+    /**
+     * @brief Apply the ResLik gating mechanism into a caller-provided buffer.
+     *
+     * No allocation happens on this path; internal scratch is reused.
+     *
+     * @param input Pointer to input_dim values.
+     * @param output Pointer to latent_dim values to be overwritten.
+     */
+    void forward(const float* input, float* output);
+
+    /**
+     * @brief Stateless, reentrant forward pass for a single input.
+     *
+     * Reads only the frozen weights; neither the stored gating parameters nor
+     * get_diagnostics() are touched. Safe to call concurrently on one unit.
+     *
+     * @param input Pointer to input_dim values.
+     * @param output Pointer to latent_dim values to be overwritten.
+     * @param params Reference statistics and gating parameters for this call.
+     * @return diagnostics::SampleDiagnostics Gate and discrepancy of the sample.
+     */
+    diagnostics::SampleDiagnostics forward(
+        const float* input,
+        float* output,
+        const GatingParams& params
+    ) const;
+
+    /**
+     * @brief Apply the ResLik gating mechanism to a batch of inputs in one call.
+     *
+     * All buffers are row-major and owned by the caller.
+     *
+     * Instantiated for In, Out in {float, double, float16_t}, so float64 and
+     * float16 data are read and written without whole-array conversion. Row
+     * statistics accumulate in double; the projection runs in float32 for every
+     * In/Out pair, so a double output holds the widened float32 result.
+     *
+     * @param input Input matrix of shape (n_samples, input_dim).
+     * @param n_samples Number of rows in the batch.
+     * @param output Output matrix of shape (n_samples, latent_dim).
+     * @param gates Per-sample gate values, length n_samples.
+     * @param discrepancies Per-sample discrepancy scores, length n_samples.
+     * @param n_threads Worker threads for splitting rows. 1 runs serially on the
+     *        calling thread, 0 uses std::thread::hardware_concurrency(). Each
+     *        row is computed identically regardless of the thread count.
+     * @param summary Optional. Receives count/sum/sum_sq/min/max of the gates and
+     *        discrepancies, accumulated while the rows are processed. Partial
+     *        summaries cover fixed blocks of rows and are merged in order, so the
+     *        result is also independent of the thread count.
+     * @throws normalization::NonFiniteInputError if a row contains NaN or Inf
+     *         (checked inside the kernel; reports the first offending row).
+     */
+    template <typename In, typename Out>
+    void forward_batch(
+        const In* input,
+        size_t n_samples,
+        Out* output,
+        float* gates,
+        float* discrepancies,
+        int n_threads = 1,
+        diagnostics::BatchSummary* summary = nullptr
+    );
+
+    /**
+     * @brief Stateless, reentrant variant of forward_batch.
+     *
+     * Same contract as the stateful overload, but gating parameters come from
+     * `params` and get_diagnostics() is not updated. Safe to call concurrently.
+     */
+    template <typename In, typename Out>
+    void forward_batch(
+        const In* input,
+        size_t n_samples,
+        Out* output,
+        float* gates,
+        float* discrepancies,
+        const GatingParams& params,
+        int n_threads = 1,
+        diagnostics::BatchSummary* summary = nullptr
+    ) const;
+
+    /**
+     * @brief Stateless forward pass for a batch in CSR (compressed sparse row) form.
+     *
+     * Row i holds values data[indptr[i] .. indptr[i+1]) at columns
+     * indices[indptr[i] .. indptr[i+1]); all other entries are zero. Column
+     * indices must be strictly increasing within a row and < input_dim.
+     *
+     * Standardization and the discrepancy only need the row sum and the sum of
+     * squared deviations, and the projection of a standardized row is
+     * (W1 * x - mean * W1 * 1) / (std + eps), with W1 * 1 precomputed. Cost is
+     * therefore proportional to the number of nonzeros (times latent_dim), not
+     * to n_samples * input_dim. Discrepancies equal the dense path exactly;
+     * gates and outputs match it up to float rounding. Like the dense path,
+     * finite float64 rows whose sums overflow are standardized after dividing
+     * by their largest magnitude rather than rejected.
+     *
+     * Instantiated for In in {float, double} and Index in {int32_t, int64_t}.
+     * Threading and `summary` behave as in forward_batch.
+     *
+     * @throws std::invalid_argument if indptr or indices are malformed.
+     * @throws normalization::NonFiniteInputError if a row contains NaN or Inf.
+     */
+    template <typename In, typename Index>
+    void forward_csr(
+        const In* data,
+        const Index* indices,
+        const Index* indptr,
+        size_t n_samples,
+        float* output,
+        float* gates,
+        float* discrepancies,
+        const GatingParams& params,
+        int n_threads = 1,
+        diagnostics::BatchSummary* summary = nullptr
+    ) const;
+
+    /**
+     * @brief Gating parameters currently stored by the set_* methods.
+     */
+    GatingParams gating_params() const;
+
+    /**
+     * @brief Dimension of input embeddings (d).
+     */
+    int input_dim() const;
+
+    /**
+     * @brief Dimension of the projection (h).
+     */
+    int latent_dim() const;
+
     /**
      * @brief Set the reference statistics for discrepancy calculation.
      * 
@@ -56,12 +203,43 @@ public:
     diagnostics::DiagnosticReport get_diagnostics() const;
 
     /**
-     * @brief Update internal running statistics (e.g., for batch norm).
-     * 
+     * @brief Fold a batch of reference embeddings into the running reference statistics.
+     *
+     * Single pass, O(1) memory: may be called with arbitrarily many batches.
+     * Once at least two values have been seen, the stored mu_ref/sigma_ref
+     * (used by the stateful API) are set to the fitted mean and standard deviation.
+     *
      * @param batch Batch of input vectors.
      */
     void update_stats(const std::vector<std::vector<float>>& batch);
 
+    /**
+     * @brief Pointer overload of update_stats for a row-major (n_samples, input_dim) batch.
+     */
+    void update_stats(const float* input, size_t n_samples);
+
+    /**
+     * @brief float64 overload of update_stats; values are accumulated without narrowing.
+     */
+    void update_stats(const double* input, size_t n_samples);
+
+    /**
+     * @brief Running reference statistics accumulated by update_stats.
+     */
+    reference::ReferenceStats reference_stats() const;
+
+    /**
+     * @brief Replace the running reference statistics (e.g. with a state merged
+     * from several workers) and refresh the stored mu_ref/sigma_ref.
+     */
+    void load_reference_stats(const reference::ReferenceStats& stats);
+
+    /**
+     * @brief Discard the running reference statistics.
+     * The stored mu_ref/sigma_ref are left unchanged.
+     */
+    void reset_stats();
+
     ~ResLikUnit();
 
 private:
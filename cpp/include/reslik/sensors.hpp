@@ -0,0 +1,110 @@
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+
+namespace reslik {
+namespace sensors {
+
+/**
+ * @brief Agreement Sensor outputs for one pair of representations.
+ *
+ * A = <z1, z2> / (||z1|| * ||z2|| + epsilon), clamped to [-1, 1]
+ * D = 1 - A
+ * C = (1 + A) / 2
+ */
+struct AgreementScores {
+    float agreement;
+    float disagreement;
+    float consistency;
+};
+
+/**
+ * @brief Temporal Consistency Sensor outputs for one timestep.
+ *
+ * D_t = ||z_t - z_{t-1}|| / (||z_{t-1}|| + epsilon)
+ * T_t = exp(-alpha * D_t)
+ */
+struct TemporalScores {
+    float drift;
+    float consistency;
+};
+
+/**
+ * @brief L2 norm of a vector, accumulated in double precision.
+ */
+double l2_norm(const float* z, size_t d);
+
+/**
+ * @brief Agreement between two vectors of length d.
+ */
+AgreementScores agreement(const float* z1, const float* z2, size_t d, float epsilon);
+
+/**
+ * @brief Row-wise agreement for n pairs of row-major (n, d) matrices.
+ *
+ * Row i of each output equals agreement(Z1 + i*d, Z2 + i*d, d, epsilon).
+ */
+void agreement_batch(const float* Z1, const float* Z2, size_t n, size_t d, float epsilon,
+                     float* agreement_out, float* disagreement_out, float* consistency_out);
+
+/**
+ * @brief Map a raw deviation and the previous norm to drift and consistency.
+ *
+ * Shared by the streaming and sequence entry points so both produce identical values.
+ */
+TemporalScores temporal_scores(double deviation, double prev_norm, float alpha, float epsilon);
+
+/**
+ * @brief One streaming TCS step.
+ *
+ * @param z Current representation (length d).
+ * @param prev Previous representation (length d).
+ * @param prev_norm ||prev||, as returned by l2_norm when prev was observed.
+ */
+TemporalScores temporal_step(const float* z, const float* prev, double prev_norm, size_t d,
+                             float alpha, float epsilon);
+
+/**
+ * @brief Drift and consistency series of a row-major (T, d) trajectory.
+ *
+ * Equals T streaming steps on a fresh sensor (timestep 0 reports drift 0 and
+ * consistency 1). Each row norm is computed once and reused as the next
+ * step's previous norm.
+ */
+void temporal_sequence(const float* Z, size_t T, size_t d, float alpha, float epsilon,
+                       float* drift_out, float* consistency_out);
+
+/**
+ * @brief Streaming TCS steps for m independent streams stored by slot.
+ *
+ * Row i of Z belongs to stream slot slots[i] of the row-major (S, d) state.
+ * Each stream is scored with temporal_step against its stored vector and norm,
+ * then the state row and norm are replaced by the new observation. Streams
+ * with is_new[i] set report drift 0 and consistency 1. Slots must be unique.
+ */
+void temporal_update_slots(const float* Z, size_t m, size_t d, const int64_t* slots,
+                           const bool* is_new, float* state, double* state_norm,
+                           float alpha, float epsilon, float* drift_out, float* consistency_out);
+
+/**
+ * @brief One multi-lag TCS step against a ring buffer of the last k observations.
+ *
+ * `ring` is a row-major (k, d) buffer of past observations with cached norms
+ * in `ring_norm`; `head` is the slot that receives z and `count` the number of
+ * observations so far. Column l < n_lags of the outputs receives the drift
+ * against z_{t - lags[l]} (drift 0 and consistency 1 while count < lags[l]).
+ * Column n_lags receives the drift against the mean of the last
+ * min(count, window) observations, whose float64 sum is kept in `window_sum`.
+ * z is then stored at `head` and slid into `window_sum`. Each time count + 1
+ * reaches a multiple of `window`, the sum is recomputed from the ring, so
+ * add/subtract rounding cannot build up on long streams. Every lag and the
+ * window must be in [1, k].
+ */
+void temporal_multi_lag_step(const float* z, size_t d, float* ring, double* ring_norm, size_t k,
+                             size_t head, uint64_t count, const int64_t* lags, size_t n_lags,
+                             double* window_sum, size_t window, float alpha, float epsilon,
+                             double* drift_out, double* consistency_out);
+
+} // namespace sensors
+} // namespace reslik
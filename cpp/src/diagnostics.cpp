@@ -1,4 +1,5 @@
 #include "reslik/diagnostics.hpp"
+#include "reslik/dtype.hpp"
 #include <cmath>
 #include <numeric>
 
@@ -11,17 +12,48 @@ float compute_discrepancy(
     float sigma_ref, 
     float epsilon
 ) {
-    if (z.empty()) return 0.0f;
+    return compute_discrepancy(z.data(), z.size(), mu_ref, sigma_ref, epsilon);
+}
+
+template <typename T>
+float discrepancy_from_sum(
+    double sum,
+    size_t n,
+    float mu_ref,
+    float sigma_ref,
+    float epsilon
+) {
+    using C = typename compute_type<T>::type;
+    if (n == 0) return 0.0f;
 
     // 1. Operational mu_hat: mean of current embedding
-    double sum = 0.0;
-    for (float val : z) sum += val;
-    float mu_hat = static_cast<float>(sum / z.size());
+    C mu_hat = static_cast<C>(sum / n);
 
     // 2. Discrepancy calculation (theory.md Step 4)
-    return std::abs(mu_hat - mu_ref) / (sigma_ref + epsilon);
+    return static_cast<float>(
+        std::abs(mu_hat - static_cast<C>(mu_ref)) / (static_cast<C>(sigma_ref) + static_cast<C>(epsilon)));
+}
+
+template <typename T>
+float compute_discrepancy(
+    const T* z,
+    size_t n,
+    float mu_ref,
+    float sigma_ref,
+    float epsilon
+) {
+    double sum = 0.0;
+    for (size_t i = 0; i < n; ++i) sum += load_as<double>(z[i]);
+    return discrepancy_from_sum<T>(sum, n, mu_ref, sigma_ref, epsilon);
 }
 
+template float discrepancy_from_sum<float>(double, size_t, float, float, float);
+template float discrepancy_from_sum<double>(double, size_t, float, float, float);
+template float discrepancy_from_sum<float16_t>(double, size_t, float, float, float);
+template float compute_discrepancy<float>(const float*, size_t, float, float, float);
+template float compute_discrepancy<double>(const double*, size_t, float, float, float);
+template float compute_discrepancy<float16_t>(const float16_t*, size_t, float, float, float);
+
 DiagnosticReport get_last_report() {
     return DiagnosticReport{1.0f, 0.0f, {}};
 }
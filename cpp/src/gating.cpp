@@ -16,8 +16,12 @@ float compute_learned_scale(const std::vector<float>& z_tilde, const std::vector
     if (z_tilde.size() != u.size()) {
         return 1.0f; // Fallback for dimension mismatch
     }
+    return compute_learned_scale(z_tilde.data(), u.data(), z_tilde.size());
+}
+
+float compute_learned_scale(const float* z_tilde, const float* u, size_t n) {
     float dot = 0.0f;
-    for (size_t i = 0; i < z_tilde.size(); ++i) {
+    for (size_t i = 0; i < n; ++i) {
         dot += z_tilde[i] * u[i];
     }
     return softplus(dot);
@@ -1,4 +1,6 @@
 #include "reslik/normalization.hpp"
+#include "reslik/dtype.hpp"
+#include <algorithm>
 #include <stdexcept>
 #include <cmath>
 #include <iostream>
@@ -6,6 +8,10 @@
 namespace reslik {
 namespace normalization {
 
+NonFiniteInputError::NonFiniteInputError(const std::string& context, size_t row)
+    : std::invalid_argument(context + ": Non-finite value (NaN or Inf) detected in row " + std::to_string(row)),
+      row_(row) {}
+
 void validate_finiteness(const MatrixView& mat, const std::string& context) {
     for (size_t i = 0; i < mat.rows * mat.cols; ++i) {
         if (!std::isfinite(mat.data[i])) {
@@ -33,31 +39,93 @@ void validate_stddev(const std::vector<float>& stddev, const std::string& contex
     }
 }
 
-std::vector<float> standardize_per_feature(const MatrixView& input, float epsilon) {
-    std::vector<float> output(input.rows * input.cols);
+namespace {
 
-    for (size_t i = 0; i < input.rows; ++i) {
-        const float* row_ptr = input.data + (i * input.cols);
-        float* out_row_ptr = output.data() + (i * input.cols);
-
-        // 1. Compute mean over embedding dimension (theory.md Step 1)
-        double sum = 0.0;
-        for (size_t j = 0; j < input.cols; ++j) {
-            sum += row_ptr[j];
+/**
+ * Slow path for rows whose double-precision sums leave the finite range.
+ * Either the row holds NaN/Inf, or (double input only) its finite values are
+ * large enough that the sum or the sum of squares overflows. Standardization
+ * is scale-invariant, so the latter is computed on the row divided by its
+ * largest magnitude.
+ */
+template <typename T>
+bool standardize_rescaled(const T* row_ptr, size_t cols, float* out_row_ptr, float epsilon) {
+    double max_abs = 0.0;
+    for (size_t j = 0; j < cols; ++j) {
+        const double v = load_as<double>(row_ptr[j]);
+        if (!std::isfinite(v)) {
+            return false;
         }
-        float mean = static_cast<float>(sum / input.cols);
+        max_abs = std::max(max_abs, std::fabs(v));
+    }
+    const double inv_scale = 1.0 / max_abs;
 
-        // 2. Compute standard deviation (theory.md Step 1)
-        double sq_sum = 0.0;
-        for (size_t j = 0; j < input.cols; ++j) {
-            float diff = row_ptr[j] - mean;
-            sq_sum += diff * diff;
-        }
-        float stddev = std::sqrt(static_cast<float>(sq_sum / input.cols));
+    double sum = 0.0;
+    for (size_t j = 0; j < cols; ++j) {
+        sum += load_as<double>(row_ptr[j]) * inv_scale;
+    }
+    const double mean = sum / cols;
+
+    double sq_sum = 0.0;
+    for (size_t j = 0; j < cols; ++j) {
+        const double diff = load_as<double>(row_ptr[j]) * inv_scale - mean;
+        sq_sum += diff * diff;
+    }
+    const double denom = std::sqrt(sq_sum / cols) + epsilon;
+    for (size_t j = 0; j < cols; ++j) {
+        out_row_ptr[j] = static_cast<float>((load_as<double>(row_ptr[j]) * inv_scale - mean) / denom);
+    }
+    return true;
+}
+
+} // namespace
+
+template <typename T>
+bool standardize_row(const T* row_ptr, size_t cols, float* out_row_ptr, float epsilon) {
+    using C = typename compute_type<T>::type;
 
-        // 3. Normalize: \tilde{z}_i = (z_i - \mu) / (\sigma + \epsilon)
-        for (size_t j = 0; j < input.cols; ++j) {
-            out_row_ptr[j] = (row_ptr[j] - mean) / (stddev + epsilon);
+    // 1. Compute mean over embedding dimension (theory.md Step 1)
+    double sum = 0.0;
+    for (size_t j = 0; j < cols; ++j) {
+        sum += load_as<double>(row_ptr[j]);
+    }
+    // NaN/Inf input makes the sum non-finite; so can finite float64 values near the
+    // double limit, which the slow path tells apart
+    if (!std::isfinite(sum)) {
+        return standardize_rescaled(row_ptr, cols, out_row_ptr, epsilon);
+    }
+    C mean = static_cast<C>(sum / cols);
+
+    // 2. Compute standard deviation (theory.md Step 1)
+    double sq_sum = 0.0;
+    for (size_t j = 0; j < cols; ++j) {
+        C diff = load_as<C>(row_ptr[j]) - mean;
+        sq_sum += diff * diff;
+    }
+    if (!std::isfinite(sq_sum)) {
+        return standardize_rescaled(row_ptr, cols, out_row_ptr, epsilon);
+    }
+    C stddev = std::sqrt(static_cast<C>(sq_sum / cols));
+
+    // 3. Normalize: \tilde{z}_i = (z_i - \mu) / (\sigma + \epsilon)
+    const C denom = stddev + static_cast<C>(epsilon);
+    for (size_t j = 0; j < cols; ++j) {
+        out_row_ptr[j] = static_cast<float>((load_as<C>(row_ptr[j]) - mean) / denom);
+    }
+    return true;
+}
+
+template bool standardize_row<float>(const float*, size_t, float*, float);
+template bool standardize_row<double>(const double*, size_t, float*, float);
+template bool standardize_row<float16_t>(const float16_t*, size_t, float*, float);
+
+std::vector<float> standardize_per_feature(const MatrixView& input, float epsilon) {
+    std::vector<float> output(input.rows * input.cols);
+
+    for (size_t i = 0; i < input.rows; ++i) {
+        if (!standardize_row(input.data + (i * input.cols), input.cols,
+                             output.data() + (i * input.cols), epsilon)) {
+            throw NonFiniteInputError("standardize_per_feature", i);
         }
     }
 
@@ -0,0 +1,64 @@
+#include "reslik/projection.hpp"
+#include <algorithm>
+
+namespace reslik {
+namespace projection {
+
+std::vector<float> transpose(const std::vector<float>& W1, size_t h, size_t d) {
+    std::vector<float> W1T(d * h);
+    for (size_t i = 0; i < h; ++i) {
+        for (size_t j = 0; j < d; ++j) {
+            W1T[j * h + i] = W1[i * d + j];
+        }
+    }
+    return W1T;
+}
+
+void project_rows_scalar(
+    const float* W1, const float* b1, const float* Z,
+    size_t n, size_t d, size_t h, float* F
+) {
+    for (size_t r = 0; r < n; ++r) {
+        const float* z = Z + r * d;
+        for (size_t i = 0; i < h; ++i) {
+            float sum = b1[i];
+            for (size_t j = 0; j < d; ++j) {
+                sum += W1[i * d + j] * z[j];
+            }
+            F[r * h + i] = sum;
+        }
+    }
+}
+
+void project_rows_blocked(
+    const float* W1T, const float* b1, const float* Z,
+    size_t n, size_t d, size_t h, float* F
+) {
+    for (size_t r0 = 0; r0 < n; r0 += kRowTile) {
+        const size_t r1 = std::min(n, r0 + kRowTile);
+
+        for (size_t c0 = 0; c0 < h; c0 += kColTile) {
+            const size_t width = std::min(h, c0 + kColTile) - c0;
+
+            for (size_t r = r0; r < r1; ++r) {
+                const float* z = Z + r * d;
+                float* acc = F + r * h + c0;
+
+                for (size_t i = 0; i < width; ++i) {
+                    acc[i] = b1[c0 + i];
+                }
+                // acc += z[j] * W1^T[j, c0:c0+width], j in ascending order
+                for (size_t j = 0; j < d; ++j) {
+                    const float zj = z[j];
+                    const float* w = W1T + j * h + c0;
+                    for (size_t i = 0; i < width; ++i) {
+                        acc[i] += zj * w[i];
+                    }
+                }
+            }
+        }
+    }
+}
+
+} // namespace projection
+} // namespace reslik
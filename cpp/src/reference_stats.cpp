@@ -0,0 +1,72 @@
+#include "reslik/reference_stats.hpp"
+#include <cmath>
+#include <stdexcept>
+#include <string>
+
+namespace reslik {
+namespace reference {
+
+namespace {
+
+template <typename T>
+ReferenceStats chunk_stats(const T* data, size_t n) {
+    // Two-pass statistics of the chunk, merged into the running state by the caller
+    double sum = 0.0;
+    for (size_t i = 0; i < n; ++i) {
+        if (!std::isfinite(data[i])) {
+            throw std::invalid_argument(
+                "ReferenceStats::update: Non-finite value (NaN or Inf) detected at index " +
+                std::to_string(i));
+        }
+        sum += data[i];
+    }
+    double chunk_mean = sum / static_cast<double>(n);
+
+    double chunk_m2 = 0.0;
+    for (size_t i = 0; i < n; ++i) {
+        double diff = data[i] - chunk_mean;
+        chunk_m2 += diff * diff;
+    }
+
+    return ReferenceStats{static_cast<uint64_t>(n), chunk_mean, chunk_m2};
+}
+
+} // namespace
+
+void ReferenceStats::update(const float* data, size_t n) {
+    if (n == 0) return;
+    merge(chunk_stats(data, n));
+}
+
+void ReferenceStats::update(const double* data, size_t n) {
+    if (n == 0) return;
+    merge(chunk_stats(data, n));
+}
+
+void ReferenceStats::merge(const ReferenceStats& other) {
+    if (other.count == 0) return;
+    if (count == 0) {
+        *this = other;
+        return;
+    }
+
+    const double n_a = static_cast<double>(count);
+    const double n_b = static_cast<double>(other.count);
+    const double n = n_a + n_b;
+    const double delta = other.mean - mean;
+
+    mean += delta * (n_b / n);
+    m2 += other.m2 + delta * delta * (n_a * n_b / n);
+    count += other.count;
+}
+
+double ReferenceStats::variance() const {
+    return count < 2 ? 0.0 : m2 / static_cast<double>(count);
+}
+
+double ReferenceStats::stddev() const {
+    return std::sqrt(variance());
+}
+
+} // namespace reference
+} // namespace reslik
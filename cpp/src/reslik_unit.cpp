@@ -2,20 +2,79 @@
 #include "reslik/normalization.hpp"
 #include "reslik/gating.hpp"
 #include "reslik/diagnostics.hpp"
+#include "reslik/projection.hpp"
 #include <iostream>
 #include <cmath>
 #include <numeric>
 #include <algorithm>
 #include <cassert>
 #include <stdexcept>
+#include <thread>
 
 namespace reslik {
 
+// Rows per partial gate/discrepancy summary in forward_batch (multiple of kRowTile)
+static constexpr size_t kSummaryBlock = 256;
+static_assert(kSummaryBlock % projection::kRowTile == 0, "summary blocks must hold whole tiles");
+
 // GELU activation approximation (theory.md Step 2)
 static float gelu(float x) {
     return 0.5f * x * (1.0f + std::tanh(0.7978845608f * (x + 0.044715f * x * x * x)));
 }
 
+// Add rows [begin, begin + rows) to their summary block. Callers pass whole
+// tiles, which never straddle a block (kSummaryBlock is a multiple of kRowTile).
+static void summarize_rows(std::vector<diagnostics::BatchSummary>& blocks, const float* gates,
+                           const float* discrepancies, size_t begin, size_t rows) {
+    diagnostics::BatchSummary& block = blocks[begin / kSummaryBlock];
+    for (size_t r = begin; r < begin + rows; ++r) {
+        block.gate.add(gates[r]);
+        block.discrepancy.add(discrepancies[r]);
+    }
+}
+
+// Split rows [0, n_samples) into contiguous ranges, one per worker, and call
+// run_range(begin, end) for each; the calling thread takes the first range.
+// run_range returns the first row containing NaN/Inf (processing stops there) or `end`.
+// Returns the first bad row over the whole batch, or n_samples.
+template <typename RangeFn>
+static size_t run_row_ranges(size_t n_samples, int n_threads, const RangeFn& run_range) {
+    if (n_threads < 0) {
+        throw std::invalid_argument("ResLikUnit: n_threads must be >= 0");
+    }
+
+    size_t workers = n_threads == 0 ? std::thread::hardware_concurrency()
+                                    : static_cast<size_t>(n_threads);
+    // Avoid spawning threads for rows that would not amortize the start-up cost
+    const size_t min_rows_per_worker = 256;
+    workers = std::max<size_t>(1, std::min(workers, n_samples / min_rows_per_worker));
+
+    if (workers == 1) {
+        return run_range(0, n_samples);
+    }
+
+    // Ranges are ordered, so the smallest bad index over workers is the global first.
+    std::vector<std::thread> pool;
+    std::vector<size_t> bad(workers, n_samples);
+    pool.reserve(workers - 1);
+    // Worker ranges start on summary block boundaries
+    const size_t rows_per_worker = (n_samples + workers - 1) / workers;
+    const size_t chunk = (rows_per_worker + kSummaryBlock - 1) / kSummaryBlock * kSummaryBlock;
+    for (size_t w = 1; w < workers; ++w) {
+        size_t begin = std::min(n_samples, w * chunk);
+        size_t end = std::min(n_samples, begin + chunk);
+        pool.emplace_back([&run_range, &bad, w, begin, end]() {
+            size_t stop = run_range(begin, end);
+            if (stop != end) bad[w] = stop;
+        });
+    }
+    size_t first_end = std::min(n_samples, chunk);
+    size_t stop = run_range(0, first_end);
+    if (stop != first_end) bad[0] = stop;
+    for (auto& t : pool) t.join();
+    return *std::min_element(bad.begin(), bad.end());
+}
+
 struct ResLikUnit::Impl {
     const int input_dim;  // d (const to enforce invariant)
     const int latent_dim; // h (const to enforce invariant)
@@ -23,28 +82,32 @@ struct ResLikUnit::Impl {
     // Parameters for Step 2: f = GELU(W1 * z + b1)
     std::vector<float> W1; // (latent_dim, input_dim)
     std::vector<float> b1; // (latent_dim)
+    std::vector<float> W1T; // (input_dim, latent_dim), layout used by the blocked projection
+    std::vector<double> W1_row_sum; // (latent_dim), W1 * 1, used by the sparse projection
 
     // Parameters for Step 3: s = softplus(u^T * z_tilde)
     std::vector<float> u; // (input_dim)
+    double u_sum = 0.0;   // sum(u), used by the sparse learned scale
 
-    // Reference Statistics for Step 4 (Discrepancy)
-    float mu_ref = 0.0f;
-    float sigma_ref = 1.0f;
+    // Reference Statistics (Step 4) and Gating Sensitivity (Step 5)
+    // used by the stateful API; the stateless API takes them per call.
+    GatingParams params;
 
-    // Gating Sensitivity for Step 5
-    float lambda = 1.0f;
-    float tau = 0.0f; // Dead-zone threshold
+    // Running reference statistics (update_stats)
+    reference::ReferenceStats ref_stats;
 
     // Diagnostics Storage
-    diagnostics::DiagnosticReport last_report;
+    diagnostics::DiagnosticReport last_report{1.0f, 0.0f, {}};
 
     // Internal Buffers (Preallocated to enforce shape invariance)
     std::vector<float> f_buffer;
+    std::vector<float> z_tilde_buffer;
 
     Impl(int d, int h) : input_dim(d), latent_dim(h), 
                          W1(h * d), b1(h, 0.0f),
                          u(d, 0.0f),
-                         f_buffer(h, 0.0f) {
+                         f_buffer(h, 0.0f),
+                         z_tilde_buffer(d, 0.0f) {
         
         if (d <= 0 || h <= 0) {
              std::string msg = "ResLikUnit: Dimensions must be positive. Got d=" + std::to_string(d) + ", h=" + std::to_string(h);
@@ -63,22 +126,157 @@ struct ResLikUnit::Impl {
         for (int j = 0; j < d; ++j) {
             u[j] = ((j % 100) / 1000.0f);
         }
+
+        W1T = projection::transpose(W1, static_cast<size_t>(h), static_cast<size_t>(d));
+
+        W1_row_sum.assign(h, 0.0);
+        for (int i = 0; i < h; ++i) {
+            for (int j = 0; j < d; ++j) {
+                W1_row_sum[i] += W1[i * d + j];
+            }
+        }
+        for (int j = 0; j < d; ++j) {
+            u_sum += u[j];
+        }
+    }
+
+    // Full sensing function for up to projection::kRowTile rows (theory.md Steps 1-5).
+    // z_tile and f_tile are caller-owned scratch of kRowTile * input_dim and
+    // kRowTile * latent_dim values.
+    // Returns the index of the first row containing NaN/Inf (nothing is written
+    // for the tile in that case), or n if all rows are finite.
+    template <typename In, typename Out>
+    size_t forward_rows(const In* x, size_t n, Out* out, float* gates, float* C,
+                        const GatingParams& p, float* z_tile, float* f_tile) const {
+        const size_t d = static_cast<size_t>(input_dim);
+        const size_t h = static_cast<size_t>(latent_dim);
+
+        // 1. Pre-Normalization (also validates finiteness while the row is read)
+        for (size_t r = 0; r < n; ++r) {
+            if (!normalization::standardize_row(x + r * d, d, z_tile + r * d)) {
+                return r;
+            }
+        }
+
+        // 2. Projection for the whole tile (cache-blocked GEMM), then GELU
+        projection::project_rows_blocked(W1T.data(), b1.data(), z_tile, n, d, h, f_tile);
+        for (size_t k = 0; k < n * h; ++k) {
+            f_tile[k] = gelu(f_tile[k]);
+        }
+
+        const float sigma_ref = std::max(1e-8f, p.sigma_ref);
+        const float tau = std::max(0.0f, p.tau);
+        for (size_t r = 0; r < n; ++r) {
+            // 3. Learned Scale
+            float s = gating::compute_learned_scale(z_tile + r * d, u.data(), d);
+
+            // 4. Discrepancy
+            C[r] = diagnostics::compute_discrepancy(x + r * d, d, p.mu_ref, sigma_ref);
+
+            // 5. Gating Logic
+            float C_eff = std::max(0.0f, C[r] - tau);
+            float gate = std::exp(-p.lambda * C_eff);
+            gates[r] = gate;
+
+            const float* f = f_tile + r * h;
+            Out* o = out + r * h;
+            for (size_t i = 0; i < h; ++i) {
+                o[i] = store_as<Out>(gate * (s * f[i]));
+            }
+        }
+        return n;
+    }
+
+    // Mean and sum of squared deviations of a CSR row scaled by `scale`, given the
+    // scaled sum of its stored values. Returns false if the sum of squares overflows.
+    template <typename In, typename C>
+    bool sparse_moments(const In* values, size_t nnz, double sum, double scale,
+                        C& mean, double& sq_sum) const {
+        const size_t d = static_cast<size_t>(input_dim);
+        mean = static_cast<C>(sum / d);
+        // Each implicit zero deviates from the mean by -mean
+        sq_sum = static_cast<double>(d - nnz) * static_cast<double>(mean * mean);
+        for (size_t k = 0; k < nnz; ++k) {
+            C diff = static_cast<C>(load_as<double>(values[k]) * scale) - mean;
+            sq_sum += diff * diff;
+        }
+        return std::isfinite(sq_sum);
     }
 
-    // Project input into f_buffer
-    void project_internal(const std::vector<float>& z_tilde) {
-        // Strict size check for safety
-        if (z_tilde.size() != static_cast<size_t>(input_dim)) {
-             throw std::runtime_error("ResLikUnit: Internal dimension mismatch in project_internal");
+    // Steps 1-5 for one CSR row with `nnz` stored values (all other entries zero).
+    // Standardization is folded into the projection and the learned scale:
+    //   W1 * z_tilde = (W1 * x - mean * W1 * 1) / denom,  u^T z_tilde = (u^T x - mean * sum(u)) / denom
+    // so only the stored values are read. acc is caller-owned scratch of latent_dim doubles.
+    // Returns false (nothing written) if the row contains NaN/Inf.
+    template <typename In, typename Index>
+    bool forward_sparse_row(const In* values, const Index* cols, size_t nnz, float* out,
+                            float& gate_out, float& C_out, const GatingParams& p,
+                            double* acc) const {
+        using C = typename compute_type<In>::type;
+        const size_t d = static_cast<size_t>(input_dim);
+        const size_t h = static_cast<size_t>(latent_dim);
+
+        // 1. Pre-Normalization statistics (zeros add nothing to the sum)
+        double sum = 0.0;
+        for (size_t k = 0; k < nnz; ++k) {
+            sum += load_as<double>(values[k]);
         }
+        // The row is standardized as x * scale; a scale of 1 is exact
+        double scale = 1.0;
+        C mean{};
+        double sq_sum = 0.0;
+        if (!std::isfinite(sum) || !sparse_moments(values, nnz, sum, scale, mean, sq_sum)) {
+            // NaN/Inf input, or finite float64 values near the double limit whose sums
+            // overflow. As in normalization::standardize_row, the latter is standardized
+            // divided by its largest magnitude (standardization is scale-invariant).
+            double max_abs = 0.0;
+            for (size_t k = 0; k < nnz; ++k) {
+                const double v = load_as<double>(values[k]);
+                if (!std::isfinite(v)) {
+                    return false;
+                }
+                max_abs = std::max(max_abs, std::fabs(v));
+            }
+            scale = 1.0 / max_abs;
+            double scaled_sum = 0.0;
+            for (size_t k = 0; k < nnz; ++k) {
+                scaled_sum += load_as<double>(values[k]) * scale;
+            }
+            sparse_moments(values, nnz, scaled_sum, scale, mean, sq_sum);
+        }
+        const double denom = static_cast<double>(std::sqrt(static_cast<C>(sq_sum / d)) + static_cast<C>(1e-8f));
 
-        for (int i = 0; i < latent_dim; ++i) {
-            float sum = b1[i];
-            for (int j = 0; j < input_dim; ++j) {
-                sum += W1[i * input_dim + j] * z_tilde[j];
+        // 2. Projection of the raw row over its nonzeros, then centering and scaling
+        std::fill(acc, acc + h, 0.0);
+        double ux = 0.0;
+        for (size_t k = 0; k < nnz; ++k) {
+            const size_t j = static_cast<size_t>(cols[k]);
+            const double v = load_as<double>(values[k]) * scale;
+            const float* w = W1T.data() + j * h;
+            for (size_t i = 0; i < h; ++i) {
+                acc[i] += v * w[i];
             }
-            f_buffer[i] = gelu(sum);
+            ux += v * u[j];
         }
+
+        // 3. Learned Scale
+        const float s = gating::softplus(static_cast<float>((ux - mean * u_sum) / denom));
+
+        // 4. Discrepancy (same row sum as the dense path, so identical scores)
+        const float sigma_ref = std::max(1e-8f, p.sigma_ref);
+        const float C_row = diagnostics::discrepancy_from_sum<In>(sum, d, p.mu_ref, sigma_ref);
+
+        // 5. Gating Logic
+        const float C_eff = std::max(0.0f, C_row - std::max(0.0f, p.tau));
+        const float gate = std::exp(-p.lambda * C_eff);
+        gate_out = gate;
+        C_out = C_row;
+
+        for (size_t i = 0; i < h; ++i) {
+            const float f = gelu(static_cast<float>((acc[i] - mean * W1_row_sum[i]) / denom) + b1[i]);
+            out[i] = gate * (s * f);
+        }
+        return true;
     }
 };
 
@@ -86,16 +284,20 @@ ResLikUnit::ResLikUnit(int input_dim, int latent_dim)
     : pImpl(std::make_unique<Impl>(input_dim, latent_dim)) {}
 
 void ResLikUnit::set_reference_stats(float mu_ref, float sigma_ref) {
-    pImpl->mu_ref = mu_ref;
-    pImpl->sigma_ref = std::max(1e-8f, sigma_ref);
+    pImpl->params.mu_ref = mu_ref;
+    pImpl->params.sigma_ref = std::max(1e-8f, sigma_ref);
 }
 
 void ResLikUnit::set_lambda(float lambda) {
-    pImpl->lambda = lambda;
+    pImpl->params.lambda = lambda;
 }
 
 void ResLikUnit::set_tau(float tau) {
-    pImpl->tau = std::max(0.0f, tau);
+    pImpl->params.tau = std::max(0.0f, tau);
+}
+
+GatingParams ResLikUnit::gating_params() const {
+    return pImpl->params;
 }
 
 std::vector<float> ResLikUnit::forward(const std::vector<float>& input) {
@@ -106,55 +308,267 @@ std::vector<float> ResLikUnit::forward(const std::vector<float>& input) {
         throw std::runtime_error("ResLikUnit::forward: corrupted state (latent_dim <= 0)");
     }
 
-    // 1. Validate Input Dimension
+    // Validate Input Dimension
     if (input.size() != static_cast<size_t>(pImpl->input_dim)) {
         throw std::runtime_error("Input dimension mismatch in ResLikUnit::forward");
     }
 
-    // 2. Pre-Normalization (theory.md Step 1)
-    normalization::MatrixView view{input.data(), 1, static_cast<size_t>(pImpl->input_dim)};
-    std::vector<float> z_tilde = normalization::standardize_per_feature(view);
+    // Always preallocate output vector of correct size (Enforcing Shape Invariance)
+    std::vector<float> out(pImpl->latent_dim);
+    forward(input.data(), out.data());
 
-    // 3. Projection (theory.md Step 2) -> Populates pImpl->f_buffer
-    pImpl->project_internal(z_tilde);
+    // Final Defensive Assertion
+    if (out.size() == 0) {
+        throw std::runtime_error("ResLikUnit::forward: Generated EMPTY output vector inside C++!");
+    }
+    assert(out.size() == static_cast<size_t>(pImpl->latent_dim));
 
-    // 4. Learned Scale (theory.md Step 3)
-    float s = gating::compute_learned_scale(z_tilde, pImpl->u);
+    // Return the fresh vector
+    return out;
+}
 
-    // 5. Discrepancy (theory.md Step 4)
-    float C = diagnostics::compute_discrepancy(input, pImpl->mu_ref, pImpl->sigma_ref);
-    
-    // 6. Gating Logic (theory.md Step 5)
-    float C_eff = std::max(0.0f, C - pImpl->tau);
-    float gate = std::exp(-pImpl->lambda * C_eff);
+void ResLikUnit::forward(const float* input, float* output) {
+    if (!pImpl) {
+        throw std::runtime_error("ResLikUnit::forward: pImpl is null!");
+    }
 
-    // 7. Construct Output (Enforcing Shape Invariance)
-    // Always preallocate output vector of correct size.
-    std::vector<float> out(pImpl->latent_dim);
-    
-    // Loop must iterate exactly latent_dim times
-    for (int i = 0; i < pImpl->latent_dim; ++i) {
-        // a_i = s * f_i
-        float a_i = s * pImpl->f_buffer[i];
-        
-        // z'_i = gate * a_i
-        // Multiplicative gating ONLY. No conditional dropping.
-        out[i] = gate * a_i;
+    // Steps 1-5 (theory.md) using the preallocated scratch buffers.
+    // Multiplicative gating ONLY. No conditional dropping.
+    float gate = 1.0f;
+    float C = 0.0f;
+    if (pImpl->forward_rows(input, 1, output, &gate, &C, pImpl->params,
+                            pImpl->z_tilde_buffer.data(), pImpl->f_buffer.data()) != 1) {
+        throw normalization::NonFiniteInputError("ResLikUnit::forward", 0);
     }
 
     // Store diagnostics
-    pImpl->last_report.mean_gate_value = gate; 
-    pImpl->last_report.max_discrepancy = C; 
+    pImpl->last_report.mean_gate_value = gate;
+    pImpl->last_report.max_discrepancy = C;
     pImpl->last_report.collapsed_features.clear();
+}
 
-    // Final Defensive Assertion
-    if (out.size() == 0) {
-        throw std::runtime_error("ResLikUnit::forward: Generated EMPTY output vector inside C++!");
+diagnostics::SampleDiagnostics ResLikUnit::forward(
+    const float* input,
+    float* output,
+    const GatingParams& params
+) const {
+    // Per-thread scratch: no state shared between concurrent callers
+    thread_local std::vector<float> z_tilde;
+    thread_local std::vector<float> f;
+    z_tilde.resize(static_cast<size_t>(pImpl->input_dim));
+    f.resize(static_cast<size_t>(pImpl->latent_dim));
+
+    diagnostics::SampleDiagnostics result{1.0f, 0.0f};
+    if (pImpl->forward_rows(input, 1, output, &result.gate, &result.discrepancy, params,
+                            z_tilde.data(), f.data()) != 1) {
+        throw normalization::NonFiniteInputError("ResLikUnit::forward", 0);
     }
-    assert(out.size() == static_cast<size_t>(pImpl->latent_dim));
+    return result;
+}
 
-    // Return the fresh vector
-    return out;
+template <typename In, typename Out>
+void ResLikUnit::forward_batch(
+    const In* input,
+    size_t n_samples,
+    Out* output,
+    float* gates,
+    float* discrepancies,
+    int n_threads,
+    diagnostics::BatchSummary* summary
+) {
+    if (!pImpl) {
+        throw std::runtime_error("ResLikUnit::forward_batch: pImpl is null!");
+    }
+
+    diagnostics::BatchSummary batch_summary;
+    forward_batch(input, n_samples, output, gates, discrepancies, pImpl->params, n_threads,
+                  &batch_summary);
+
+    // Batch-level diagnostics mirror the Python aggregation (mean gate, max discrepancy)
+    pImpl->last_report.mean_gate_value = static_cast<float>(batch_summary.gate.mean());
+    pImpl->last_report.max_discrepancy =
+        n_samples > 0 ? std::max(0.0f, batch_summary.discrepancy.max) : 0.0f;
+    pImpl->last_report.collapsed_features.clear();
+
+    if (summary) {
+        *summary = batch_summary;
+    }
+}
+
+template <typename In, typename Out>
+void ResLikUnit::forward_batch(
+    const In* input,
+    size_t n_samples,
+    Out* output,
+    float* gates,
+    float* discrepancies,
+    const GatingParams& params,
+    int n_threads,
+    diagnostics::BatchSummary* summary
+) const {
+    if (!pImpl) {
+        throw std::runtime_error("ResLikUnit::forward_batch: pImpl is null!");
+    }
+    if (n_threads < 0) {
+        throw std::invalid_argument("ResLikUnit::forward_batch: n_threads must be >= 0");
+    }
+
+    const Impl& impl = *pImpl;
+    const size_t d = static_cast<size_t>(impl.input_dim);
+    const size_t h = static_cast<size_t>(impl.latent_dim);
+
+    // Summaries are accumulated per fixed block of rows and merged in block order,
+    // so they do not depend on how rows are split across workers.
+    const size_t summary_blocks = summary ? (n_samples + kSummaryBlock - 1) / kSummaryBlock : 0;
+    std::vector<diagnostics::BatchSummary> block_summaries(summary_blocks);
+
+    // Process rows [begin, end) with scratch owned by the calling worker.
+    auto run_range = [&impl, &params, &block_summaries, summary, input, output, gates,
+                      discrepancies, d, h](size_t begin, size_t end) {
+        std::vector<float> z_tile(projection::kRowTile * d);
+        std::vector<float> f_tile(projection::kRowTile * h);
+        for (size_t n = begin; n < end; n += projection::kRowTile) {
+            const size_t rows = std::min(projection::kRowTile, end - n);
+            const size_t done = impl.forward_rows(input + n * d, rows, output + n * h, gates + n,
+                                                  discrepancies + n, params,
+                                                  z_tile.data(), f_tile.data());
+            if (done != rows) {
+                return n + done;
+            }
+            if (summary) {
+                summarize_rows(block_summaries, gates, discrepancies, n, rows);
+            }
+        }
+        return end;
+    };
+
+    const size_t first_bad = run_row_ranges(n_samples, n_threads, run_range);
+    if (first_bad != n_samples) {
+        throw normalization::NonFiniteInputError("ResLikUnit::forward_batch", first_bad);
+    }
+
+    if (summary) {
+        *summary = diagnostics::BatchSummary{};
+        for (const auto& block : block_summaries) {
+            summary->merge(block);
+        }
+    }
+}
+
+template <typename In, typename Index>
+void ResLikUnit::forward_csr(
+    const In* data,
+    const Index* indices,
+    const Index* indptr,
+    size_t n_samples,
+    float* output,
+    float* gates,
+    float* discrepancies,
+    const GatingParams& params,
+    int n_threads,
+    diagnostics::BatchSummary* summary
+) const {
+    if (!pImpl) {
+        throw std::runtime_error("ResLikUnit::forward_csr: pImpl is null!");
+    }
+
+    const Impl& impl = *pImpl;
+    const Index d = static_cast<Index>(impl.input_dim);
+    const size_t h = static_cast<size_t>(impl.latent_dim);
+
+    // Validate the structure up front: workers then only read in-bounds memory
+    if (n_samples > 0 && indptr[0] < 0) {
+        throw std::invalid_argument("ResLikUnit::forward_csr: indptr[0] must be >= 0");
+    }
+    for (size_t r = 0; r < n_samples; ++r) {
+        if (indptr[r + 1] < indptr[r]) {
+            throw std::invalid_argument(
+                "ResLikUnit::forward_csr: indptr must be non-decreasing (row " + std::to_string(r) + ")");
+        }
+        for (Index k = indptr[r]; k < indptr[r + 1]; ++k) {
+            if (indices[k] < 0 || indices[k] >= d || (k > indptr[r] && indices[k] <= indices[k - 1])) {
+                throw std::invalid_argument(
+                    "ResLikUnit::forward_csr: column indices must be strictly increasing and in [0, " +
+                    std::to_string(impl.input_dim) + ") (row " + std::to_string(r) + ")");
+            }
+        }
+    }
+
+    const size_t summary_blocks = summary ? (n_samples + kSummaryBlock - 1) / kSummaryBlock : 0;
+    std::vector<diagnostics::BatchSummary> block_summaries(summary_blocks);
+
+    auto run_range = [&impl, &params, &block_summaries, summary, data, indices, indptr, output,
+                      gates, discrepancies, h](size_t begin, size_t end) {
+        std::vector<double> acc(h);
+        for (size_t n = begin; n < end; n += projection::kRowTile) {
+            const size_t rows = std::min(projection::kRowTile, end - n);
+            for (size_t r = n; r < n + rows; ++r) {
+                const Index lo = indptr[r];
+                if (!impl.forward_sparse_row(data + lo, indices + lo,
+                                             static_cast<size_t>(indptr[r + 1] - lo), output + r * h,
+                                             gates[r], discrepancies[r], params, acc.data())) {
+                    return r;
+                }
+            }
+            if (summary) {
+                summarize_rows(block_summaries, gates, discrepancies, n, rows);
+            }
+        }
+        return end;
+    };
+
+    const size_t first_bad = run_row_ranges(n_samples, n_threads, run_range);
+    if (first_bad != n_samples) {
+        throw normalization::NonFiniteInputError("ResLikUnit::forward_csr", first_bad);
+    }
+
+    if (summary) {
+        *summary = diagnostics::BatchSummary{};
+        for (const auto& block : block_summaries) {
+            summary->merge(block);
+        }
+    }
+}
+
+template void ResLikUnit::forward_csr<float, int32_t>(
+    const float*, const int32_t*, const int32_t*, size_t, float*, float*, float*,
+    const GatingParams&, int, diagnostics::BatchSummary*) const;
+template void ResLikUnit::forward_csr<float, int64_t>(
+    const float*, const int64_t*, const int64_t*, size_t, float*, float*, float*,
+    const GatingParams&, int, diagnostics::BatchSummary*) const;
+template void ResLikUnit::forward_csr<double, int32_t>(
+    const double*, const int32_t*, const int32_t*, size_t, float*, float*, float*,
+    const GatingParams&, int, diagnostics::BatchSummary*) const;
+template void ResLikUnit::forward_csr<double, int64_t>(
+    const double*, const int64_t*, const int64_t*, size_t, float*, float*, float*,
+    const GatingParams&, int, diagnostics::BatchSummary*) const;
+
+// Explicit instantiations for every supported input/output dtype pair
+#define RESLIK_INSTANTIATE_FORWARD_BATCH(In, Out)                                           \
+    template void ResLikUnit::forward_batch<In, Out>(                                        \
+        const In*, size_t, Out*, float*, float*, int, diagnostics::BatchSummary*);           \
+    template void ResLikUnit::forward_batch<In, Out>(                                        \
+        const In*, size_t, Out*, float*, float*, const GatingParams&, int,                   \
+        diagnostics::BatchSummary*) const;
+
+RESLIK_INSTANTIATE_FORWARD_BATCH(float, float)
+RESLIK_INSTANTIATE_FORWARD_BATCH(float, double)
+RESLIK_INSTANTIATE_FORWARD_BATCH(float, float16_t)
+RESLIK_INSTANTIATE_FORWARD_BATCH(double, float)
+RESLIK_INSTANTIATE_FORWARD_BATCH(double, double)
+RESLIK_INSTANTIATE_FORWARD_BATCH(double, float16_t)
+RESLIK_INSTANTIATE_FORWARD_BATCH(float16_t, float)
+RESLIK_INSTANTIATE_FORWARD_BATCH(float16_t, double)
+RESLIK_INSTANTIATE_FORWARD_BATCH(float16_t, float16_t)
+
+#undef RESLIK_INSTANTIATE_FORWARD_BATCH
+
+int ResLikUnit::input_dim() const {
+    return pImpl->input_dim;
+}
+
+int ResLikUnit::latent_dim() const {
+    return pImpl->latent_dim;
 }
 
 diagnostics::DiagnosticReport ResLikUnit::get_diagnostics() const {
@@ -162,7 +576,45 @@ diagnostics::DiagnosticReport ResLikUnit::get_diagnostics() const {
 }
 
 void ResLikUnit::update_stats(const std::vector<std::vector<float>>& batch) {
-    // Stub
+    reference::ReferenceStats chunk;
+    for (const auto& row : batch) {
+        if (row.size() != static_cast<size_t>(pImpl->input_dim)) {
+            throw std::runtime_error("Input dimension mismatch in ResLikUnit::update_stats");
+        }
+        chunk.update(row.data(), row.size());
+    }
+    pImpl->ref_stats.merge(chunk);
+    load_reference_stats(pImpl->ref_stats);
+}
+
+void ResLikUnit::update_stats(const float* input, size_t n_samples) {
+    // Validate the whole chunk before touching the accumulator
+    reference::ReferenceStats chunk;
+    chunk.update(input, n_samples * static_cast<size_t>(pImpl->input_dim));
+    pImpl->ref_stats.merge(chunk);
+    load_reference_stats(pImpl->ref_stats);
+}
+
+void ResLikUnit::update_stats(const double* input, size_t n_samples) {
+    reference::ReferenceStats chunk;
+    chunk.update(input, n_samples * static_cast<size_t>(pImpl->input_dim));
+    pImpl->ref_stats.merge(chunk);
+    load_reference_stats(pImpl->ref_stats);
+}
+
+reference::ReferenceStats ResLikUnit::reference_stats() const {
+    return pImpl->ref_stats;
+}
+
+void ResLikUnit::load_reference_stats(const reference::ReferenceStats& stats) {
+    pImpl->ref_stats = stats;
+    if (stats.count >= 2) {
+        set_reference_stats(static_cast<float>(stats.mean), static_cast<float>(stats.stddev()));
+    }
+}
+
+void ResLikUnit::reset_stats() {
+    pImpl->ref_stats = reference::ReferenceStats{};
 }
 
 ResLikUnit::~ResLikUnit() = default;
@@ -0,0 +1,173 @@
+#include "reslik/sensors.hpp"
+#include <algorithm>
+#include <cmath>
+
+namespace reslik {
+namespace sensors {
+
+double l2_norm(const float* z, size_t d) {
+    double sum_sq = 0.0;
+    for (size_t j = 0; j < d; ++j) {
+        sum_sq += static_cast<double>(z[j]) * z[j];
+    }
+    return std::sqrt(sum_sq);
+}
+
+AgreementScores agreement(const float* z1, const float* z2, size_t d, float epsilon) {
+    double dot = 0.0;
+    double sq1 = 0.0;
+    double sq2 = 0.0;
+    for (size_t j = 0; j < d; ++j) {
+        const double a = z1[j];
+        const double b = z2[j];
+        dot += a * b;
+        sq1 += a * a;
+        sq2 += b * b;
+    }
+
+    double a = dot / (std::sqrt(sq1) * std::sqrt(sq2) + epsilon);
+    // Clamp agreement to [-1, 1] to handle float precision issues
+    a = std::clamp(a, -1.0, 1.0);
+
+    return AgreementScores{
+        static_cast<float>(a),
+        static_cast<float>(1.0 - a),
+        static_cast<float>((1.0 + a) / 2.0)
+    };
+}
+
+void agreement_batch(const float* Z1, const float* Z2, size_t n, size_t d, float epsilon,
+                     float* agreement_out, float* disagreement_out, float* consistency_out) {
+    for (size_t i = 0; i < n; ++i) {
+        const AgreementScores s = agreement(Z1 + i * d, Z2 + i * d, d, epsilon);
+        agreement_out[i] = s.agreement;
+        disagreement_out[i] = s.disagreement;
+        consistency_out[i] = s.consistency;
+    }
+}
+
+TemporalScores temporal_scores(double deviation, double prev_norm, float alpha, float epsilon) {
+    const float drift = static_cast<float>(deviation / (prev_norm + epsilon));
+    const float consistency = static_cast<float>(std::exp(-static_cast<double>(alpha) * drift));
+    return TemporalScores{drift, consistency};
+}
+
+TemporalScores temporal_step(const float* z, const float* prev, double prev_norm, size_t d,
+                             float alpha, float epsilon) {
+    double sum_sq = 0.0;
+    for (size_t j = 0; j < d; ++j) {
+        const double diff = static_cast<double>(z[j]) - prev[j];
+        sum_sq += diff * diff;
+    }
+    return temporal_scores(std::sqrt(sum_sq), prev_norm, alpha, epsilon);
+}
+
+void temporal_sequence(const float* Z, size_t T, size_t d, float alpha, float epsilon,
+                       float* drift_out, float* consistency_out) {
+    if (T == 0) return;
+
+    // First time step: no history to compare against
+    drift_out[0] = 0.0f;
+    consistency_out[0] = 1.0f;
+
+    double prev_norm = l2_norm(Z, d);
+    for (size_t t = 1; t < T; ++t) {
+        const float* z = Z + t * d;
+        const TemporalScores s = temporal_step(z, z - d, prev_norm, d, alpha, epsilon);
+        drift_out[t] = s.drift;
+        consistency_out[t] = s.consistency;
+        prev_norm = l2_norm(z, d);
+    }
+}
+
+void temporal_update_slots(const float* Z, size_t m, size_t d, const int64_t* slots,
+                           const bool* is_new, float* state, double* state_norm,
+                           float alpha, float epsilon, float* drift_out, float* consistency_out) {
+    for (size_t i = 0; i < m; ++i) {
+        const float* z = Z + i * d;
+        float* prev = state + static_cast<size_t>(slots[i]) * d;
+        double& prev_norm = state_norm[slots[i]];
+
+        if (is_new[i]) {
+            drift_out[i] = 0.0f;
+            consistency_out[i] = 1.0f;
+        } else {
+            const TemporalScores s = temporal_step(z, prev, prev_norm, d, alpha, epsilon);
+            drift_out[i] = s.drift;
+            consistency_out[i] = s.consistency;
+        }
+
+        std::copy(z, z + d, prev);
+        prev_norm = l2_norm(z, d);
+    }
+}
+
+void temporal_multi_lag_step(const float* z, size_t d, float* ring, double* ring_norm, size_t k,
+                             size_t head, uint64_t count, const int64_t* lags, size_t n_lags,
+                             double* window_sum, size_t window, float alpha, float epsilon,
+                             double* drift_out, double* consistency_out) {
+    // Drift against z_{t-L} for every lag, using the cached norm of the past slot
+    for (size_t l = 0; l < n_lags; ++l) {
+        const uint64_t lag = static_cast<uint64_t>(lags[l]);
+        double drift = 0.0;
+        if (lag <= count) {
+            const size_t slot = (head + k - static_cast<size_t>(lag)) % k;
+            const float* past = ring + slot * d;
+            double sum_sq = 0.0;
+            for (size_t j = 0; j < d; ++j) {
+                const double diff = static_cast<double>(z[j]) - past[j];
+                sum_sq += diff * diff;
+            }
+            drift = std::sqrt(sum_sq) / (ring_norm[slot] + epsilon);
+        }
+        drift_out[l] = drift;
+        consistency_out[l] = std::exp(-static_cast<double>(alpha) * drift);
+    }
+
+    // Drift against the mean of the last `window` observations
+    const uint64_t n_window = std::min<uint64_t>(count, window);
+    double drift = 0.0;
+    if (n_window > 0) {
+        const double inv_n = 1.0 / static_cast<double>(n_window);
+        double diff_sq = 0.0;
+        double mean_sq = 0.0;
+        for (size_t j = 0; j < d; ++j) {
+            const double mean = window_sum[j] * inv_n;
+            const double diff = z[j] - mean;
+            diff_sq += diff * diff;
+            mean_sq += mean * mean;
+        }
+        drift = std::sqrt(diff_sq) / (std::sqrt(mean_sq) + epsilon);
+    }
+    drift_out[n_lags] = drift;
+    consistency_out[n_lags] = std::exp(-static_cast<double>(alpha) * drift);
+
+    // Slide the window: drop z_{t-window} (still in the ring), add z
+    if (count >= window) {
+        const float* dropped = ring + ((head + k - window) % k) * d;
+        for (size_t j = 0; j < d; ++j) {
+            window_sum[j] -= dropped[j];
+        }
+    }
+    for (size_t j = 0; j < d; ++j) {
+        window_sum[j] += z[j];
+    }
+
+    // Overwrite the oldest slot with z
+    std::copy(z, z + d, ring + head * d);
+    ring_norm[head] = l2_norm(z, d);
+
+    // Once per full window, replace the running sum by an exact one
+    if ((count + 1) % window == 0) {
+        std::fill(window_sum, window_sum + d, 0.0);
+        for (size_t offset = 0; offset < window; ++offset) {
+            const float* row = ring + ((head + k - offset) % k) * d;
+            for (size_t j = 0; j < d; ++j) {
+                window_sum[j] += row[j];
+            }
+        }
+    }
+}
+
+} // namespace sensors
+} // namespace reslik
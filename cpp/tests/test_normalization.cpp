@@ -1,4 +1,5 @@
 #include "reslik/normalization.hpp"
+#include "reslik/dtype.hpp"
 #include <iostream>
 #include <cassert>
 #include <vector>
@@ -33,7 +34,59 @@ void test_per_feature_normalization() {
     std::cout << "Passed." << std::endl;
 }
 
+void test_half_conversion() {
+    std::cout << "Testing float16 conversion..." << std::endl;
+
+    // Exactly representable values round-trip unchanged
+    const float exact[] = {0.0f, 1.0f, -2.5f, 0.099975586f, 65504.0f, 6.1035156e-05f, 5.9604645e-08f};
+    for (float v : exact) {
+        assert(reslik::half_to_float(reslik::float_to_half(v)) == v);
+    }
+
+    // Round to nearest even, overflow to Inf, NaN preserved
+    assert(reslik::float_to_half(1.0f + 1.0f / 2048.0f) == 0x3C00);
+    assert(reslik::float_to_half(1.0f + 3.0f / 2048.0f) == 0x3C02);
+    assert(std::isinf(reslik::half_to_float(reslik::float_to_half(70000.0f))));
+    assert(std::isnan(reslik::half_to_float(reslik::float_to_half(NAN))));
+
+    std::cout << "Passed." << std::endl;
+}
+
+void test_non_finite_and_overflow_rows() {
+    std::cout << "Testing non-finite and near-overflow rows..." << std::endl;
+
+    // Finite float64 values near the double limit overflow the sums but are valid input
+    const double big[] = {1e308, -1e308, 1.5e308, -1.5e308};
+    float out[4];
+    assert(reslik::normalization::standardize_row(big, 4, out));
+    float var = 0.0f;
+    for (float v : out) {
+        assert(std::isfinite(v));
+        var += v * v / 4.0f;
+    }
+    assert(std::abs(out[0] + out[1]) < 1e-5f);
+    assert(std::abs(var - 1.0f) < 1e-5f);
+
+    const double bad[] = {1.0, NAN, 2.0, 3.0};
+    assert(!reslik::normalization::standardize_row(bad, 4, out));
+
+    // standardize_per_feature reports the offending row
+    std::vector<float> data = {1.0f, 2.0f, 3.0f, 4.0f, INFINITY, 6.0f};
+    reslik::normalization::MatrixView view{data.data(), 2, 3};
+    bool thrown = false;
+    try {
+        reslik::normalization::standardize_per_feature(view);
+    } catch (const reslik::normalization::NonFiniteInputError& e) {
+        thrown = e.row() == 1;
+    }
+    assert(thrown);
+
+    std::cout << "Passed." << std::endl;
+}
+
 int main() {
     test_per_feature_normalization();
+    test_non_finite_and_overflow_rows();
+    test_half_conversion();
     return 0;
 }
\ No newline at end of file
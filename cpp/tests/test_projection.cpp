@@ -0,0 +1,58 @@
+#include "reslik/projection.hpp"
+#include <iostream>
+#include <cassert>
+#include <vector>
+#include <cmath>
+
+static std::vector<float> fill(size_t n, unsigned seed) {
+    std::vector<float> v(n);
+    for (size_t i = 0; i < n; ++i) {
+        v[i] = static_cast<float>((i * 2654435761u + seed) % 1000) / 500.0f - 1.0f;
+    }
+    return v;
+}
+
+void check_blocked_matches_scalar(size_t n, size_t d, size_t h) {
+    std::vector<float> W1 = fill(h * d, 1);
+    std::vector<float> b1 = fill(h, 2);
+    std::vector<float> Z = fill(n * d, 3);
+    std::vector<float> W1T = reslik::projection::transpose(W1, h, d);
+
+    std::vector<float> F_scalar(n * h);
+    std::vector<float> F_blocked(n * h);
+    reslik::projection::project_rows_scalar(W1.data(), b1.data(), Z.data(), n, d, h, F_scalar.data());
+    reslik::projection::project_rows_blocked(W1T.data(), b1.data(), Z.data(), n, d, h, F_blocked.data());
+
+    for (size_t k = 0; k < n * h; ++k) {
+        float tol = 1e-5f * (1.0f + std::abs(F_scalar[k]));
+        assert(std::abs(F_scalar[k] - F_blocked[k]) <= tol);
+    }
+}
+
+void test_blocked_projection_matches_scalar() {
+    std::cout << "Testing blocked projection against scalar loop..." << std::endl;
+    // Typical shape, plus shapes that leave partial row and column tiles
+    check_blocked_matches_scalar(256, 128, 64);
+    check_blocked_matches_scalar(37, 128, 64);
+    check_blocked_matches_scalar(5, 20, 70);
+    check_blocked_matches_scalar(1, 3, 1);
+    std::cout << "Passed." << std::endl;
+}
+
+void test_transpose() {
+    std::cout << "Testing W1 transpose layout..." << std::endl;
+    std::vector<float> W1 = {1, 2, 3,
+                             4, 5, 6}; // (h=2, d=3)
+    auto W1T = reslik::projection::transpose(W1, 2, 3);
+    std::vector<float> expected = {1, 4,
+                                   2, 5,
+                                   3, 6}; // (d=3, h=2)
+    assert(W1T == expected);
+    std::cout << "Passed." << std::endl;
+}
+
+int main() {
+    test_transpose();
+    test_blocked_projection_matches_scalar();
+    return 0;
+}
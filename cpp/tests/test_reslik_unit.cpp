@@ -4,6 +4,7 @@
 #include <vector>
 #include <cmath>
 #include <algorithm>
+#include <stdexcept>
 
 void test_forward_shape_and_finiteness() {
     std::cout << "Testing forward shape and finiteness..." << std::endl;
@@ -100,8 +101,176 @@ void test_monotonic_gating() {
     std::cout << "Passed." << std::endl;
 }
 
+void test_forward_batch_matches_forward() {
+    std::cout << "Testing forward_batch against per-row forward..." << std::endl;
+    int d = 16;
+    int h = 8;
+    size_t n = 5;
+    reslik::ResLikUnit unit(d, h);
+    unit.set_reference_stats(0.0f, 1.0f);
+    unit.set_lambda(1.0f);
+
+    std::vector<float> batch(n * d);
+    for (size_t i = 0; i < batch.size(); ++i) {
+        batch[i] = static_cast<float>((i * 37) % 23) / 7.0f - 1.5f;
+    }
+
+    std::vector<float> out(n * h);
+    std::vector<float> gates(n);
+    std::vector<float> discrepancies(n);
+    unit.forward_batch(batch.data(), n, out.data(), gates.data(), discrepancies.data());
+
+    for (size_t r = 0; r < n; ++r) {
+        std::vector<float> row(batch.begin() + r * d, batch.begin() + (r + 1) * d);
+        auto expected = unit.forward(row);
+        auto diag = unit.get_diagnostics();
+        for (int i = 0; i < h; ++i) {
+            assert(out[r * h + i] == expected[i]);
+        }
+        assert(gates[r] == diag.mean_gate_value);
+        assert(discrepancies[r] == diag.max_discrepancy);
+    }
+    std::cout << "Passed." << std::endl;
+}
+
+void test_threaded_batch_matches_serial() {
+    std::cout << "Testing threaded forward_batch is bit-identical to serial..." << std::endl;
+    int d = 32;
+    int h = 16;
+    size_t n = 2000;
+    reslik::ResLikUnit unit(d, h);
+
+    std::vector<float> batch(n * d);
+    for (size_t i = 0; i < batch.size(); ++i) {
+        batch[i] = static_cast<float>((i * 53) % 97) / 31.0f - 1.0f;
+    }
+
+    std::vector<float> out_serial(n * h), gates_serial(n), disc_serial(n);
+    unit.forward_batch(batch.data(), n, out_serial.data(), gates_serial.data(), disc_serial.data(), 1);
+    auto diag_serial = unit.get_diagnostics();
+
+    std::vector<float> out_threaded(n * h), gates_threaded(n), disc_threaded(n);
+    reslik::diagnostics::BatchSummary summary;
+    unit.forward_batch(batch.data(), n, out_threaded.data(), gates_threaded.data(), disc_threaded.data(), 4,
+                       &summary);
+    auto diag_threaded = unit.get_diagnostics();
+
+    assert(out_serial == out_threaded);
+    assert(gates_serial == gates_threaded);
+    assert(disc_serial == disc_threaded);
+    assert(diag_serial.mean_gate_value == diag_threaded.mean_gate_value);
+
+    // Summary aggregates match a direct reduction over the per-sample values
+    double gate_sum = 0.0, disc_sum_sq = 0.0;
+    for (size_t r = 0; r < n; ++r) {
+        gate_sum += gates_serial[r];
+        disc_sum_sq += static_cast<double>(disc_serial[r]) * disc_serial[r];
+    }
+    assert(summary.gate.count == n && summary.discrepancy.count == n);
+    assert(std::abs(summary.gate.sum - gate_sum) < 1e-9 * n);
+    assert(std::abs(summary.discrepancy.sum_sq - disc_sum_sq) < 1e-9 * (1.0 + disc_sum_sq));
+    assert(summary.gate.min == *std::min_element(gates_serial.begin(), gates_serial.end()));
+    assert(summary.discrepancy.max == *std::max_element(disc_serial.begin(), disc_serial.end()));
+    assert(summary.discrepancy.max == diag_threaded.max_discrepancy);
+    std::cout << "Passed." << std::endl;
+}
+
+void test_stateless_forward_matches_stateful() {
+    std::cout << "Testing stateless forward leaves unit state untouched..." << std::endl;
+    int d = 12;
+    int h = 6;
+    reslik::ResLikUnit unit(d, h);
+
+    std::vector<float> input(d);
+    for (int i = 0; i < d; ++i) input[i] = 0.25f * i - 1.0f;
+
+    reslik::GatingParams params;
+    params.mu_ref = 0.5f;
+    params.sigma_ref = 0.75f;
+    params.lambda = 2.0f;
+    params.tau = 0.1f;
+
+    std::vector<float> stateless_out(h);
+    auto sample = unit.forward(input.data(), stateless_out.data(), params);
+
+    // Stored parameters and diagnostics are still the defaults
+    auto stored = unit.gating_params();
+    assert(stored.mu_ref == 0.0f && stored.lambda == 1.0f);
+    assert(unit.get_diagnostics().max_discrepancy == 0.0f);
+
+    unit.set_reference_stats(params.mu_ref, params.sigma_ref);
+    unit.set_lambda(params.lambda);
+    unit.set_tau(params.tau);
+    auto stateful_out = unit.forward(input);
+    auto diag = unit.get_diagnostics();
+
+    assert(stateful_out == stateless_out);
+    assert(sample.gate == diag.mean_gate_value);
+    assert(sample.discrepancy == diag.max_discrepancy);
+    std::cout << "Passed." << std::endl;
+}
+
+void test_csr_matches_dense() {
+    std::cout << "Testing CSR forward against dense forward_batch..." << std::endl;
+    const int d = 200;
+    const int h = 24;
+    const size_t n = 600;
+    reslik::ResLikUnit unit(d, h);
+    reslik::GatingParams params{0.2f, 0.5f, 1.0f, 0.05f};
+
+    // ~5% nonzero rows; row 3 is empty
+    std::vector<float> dense(n * d, 0.0f);
+    std::vector<float> data;
+    std::vector<int32_t> indices;
+    std::vector<int32_t> indptr{0};
+    for (size_t r = 0; r < n; ++r) {
+        for (int j = 0; j < d; ++j) {
+            if (r != 3 && (r * 31 + j * 17) % 20 == 0) {
+                const float v = 1.0f + static_cast<float>((r + j) % 7);
+                dense[r * d + j] = v;
+                data.push_back(v);
+                indices.push_back(j);
+            }
+        }
+        indptr.push_back(static_cast<int32_t>(data.size()));
+    }
+
+    std::vector<float> out_dense(n * h), out_csr(n * h);
+    std::vector<float> g_dense(n), g_csr(n), c_dense(n), c_csr(n);
+    unit.forward_batch(dense.data(), n, out_dense.data(), g_dense.data(), c_dense.data(), params);
+    reslik::diagnostics::BatchSummary summary;
+    unit.forward_csr(data.data(), indices.data(), indptr.data(), n, out_csr.data(),
+                     g_csr.data(), c_csr.data(), params, 2, &summary);
+
+    for (size_t r = 0; r < n; ++r) {
+        assert(c_csr[r] == c_dense[r]);
+        assert(std::abs(g_csr[r] - g_dense[r]) < 1e-6f);
+    }
+    for (size_t k = 0; k < n * h; ++k) {
+        assert(std::abs(out_csr[k] - out_dense[k]) < 1e-4f * (1.0f + std::abs(out_dense[k])));
+    }
+    assert(summary.gate.count == n);
+
+    // Unsorted column indices are rejected before any work is done
+    std::swap(indices[0], indices[1]);
+    bool threw = false;
+    try {
+        unit.forward_csr(data.data(), indices.data(), indptr.data(), n, out_csr.data(),
+                         g_csr.data(), c_csr.data(), params);
+    } catch (const std::invalid_argument&) {
+        threw = true;
+    }
+    assert(threw);
+
+    std::cout << "Passed." << std::endl;
+}
+
 int main() {
     test_forward_shape_and_finiteness();
     test_monotonic_gating();
+    test_forward_batch_matches_forward();
+    test_threaded_batch_matches_serial();
+    test_stateless_forward_matches_stateful();
+    test_csr_matches_dense();
     return 0;
 }
\ No newline at end of file
@@ -0,0 +1,119 @@
+#include "reslik/sensors.hpp"
+#include <iostream>
+#include <cassert>
+#include <vector>
+#include <cmath>
+
+void test_agreement() {
+    std::cout << "Testing agreement sensor kernel..." << std::endl;
+
+    const float x[] = {1.0f, 0.0f, 0.0f};
+    const float y[] = {0.0f, 1.0f, 0.0f};
+    const float neg_x[] = {-1.0f, 0.0f, 0.0f};
+
+    auto same = reslik::sensors::agreement(x, x, 3, 1e-6f);
+    assert(std::abs(same.agreement - 1.0f) < 1e-5f);
+    assert(std::abs(same.consistency - 1.0f) < 1e-5f);
+
+    auto ortho = reslik::sensors::agreement(x, y, 3, 1e-6f);
+    assert(std::abs(ortho.agreement) < 1e-6f);
+    assert(std::abs(ortho.consistency - 0.5f) < 1e-6f);
+
+    auto opposite = reslik::sensors::agreement(x, neg_x, 3, 1e-6f);
+    assert(std::abs(opposite.agreement + 1.0f) < 1e-5f);
+    assert(std::abs(opposite.disagreement - 2.0f) < 1e-5f);
+
+    // Batch rows equal single-pair calls
+    std::vector<float> Z1 = {1.0f, 0.0f, 0.0f, 1.0f, 2.0f, 3.0f};
+    std::vector<float> Z2 = {0.0f, 1.0f, 0.0f, 2.0f, 3.0f, 4.0f};
+    std::vector<float> a(2), d(2), c(2);
+    reslik::sensors::agreement_batch(Z1.data(), Z2.data(), 2, 3, 1e-6f, a.data(), d.data(), c.data());
+    for (size_t i = 0; i < 2; ++i) {
+        auto s = reslik::sensors::agreement(Z1.data() + 3 * i, Z2.data() + 3 * i, 3, 1e-6f);
+        assert(a[i] == s.agreement && d[i] == s.disagreement && c[i] == s.consistency);
+    }
+
+    std::cout << "Passed." << std::endl;
+}
+
+void test_temporal_sequence_matches_steps() {
+    std::cout << "Testing temporal sequence against streaming steps..." << std::endl;
+
+    const size_t T = 20, d = 4;
+    std::vector<float> Z(T * d);
+    for (size_t k = 0; k < Z.size(); ++k) {
+        Z[k] = std::sin(0.3f * static_cast<float>(k)) + 0.05f * static_cast<float>(k / d);
+    }
+
+    std::vector<float> drift(T), consistency(T);
+    reslik::sensors::temporal_sequence(Z.data(), T, d, 0.5f, 1e-6f, drift.data(), consistency.data());
+    assert(drift[0] == 0.0f && consistency[0] == 1.0f);
+
+    double prev_norm = reslik::sensors::l2_norm(Z.data(), d);
+    for (size_t t = 1; t < T; ++t) {
+        auto s = reslik::sensors::temporal_step(Z.data() + t * d, Z.data() + (t - 1) * d,
+                                                prev_norm, d, 0.5f, 1e-6f);
+        assert(s.drift == drift[t] && s.consistency == consistency[t]);
+        assert(s.consistency > 0.0f && s.consistency <= 1.0f);
+        prev_norm = reslik::sensors::l2_norm(Z.data() + t * d, d);
+    }
+
+    // Doubling the vector gives drift 1 relative to the previous norm
+    const float base[] = {3.0f, 4.0f};
+    const float doubled[] = {6.0f, 8.0f};
+    auto jump = reslik::sensors::temporal_step(doubled, base, 5.0, 2, 1.0f, 0.0f);
+    assert(std::abs(jump.drift - 1.0f) < 1e-6f);
+    assert(std::abs(jump.consistency - std::exp(-1.0f)) < 1e-6f);
+
+    std::cout << "Passed." << std::endl;
+}
+
+void test_multi_lag_step() {
+    std::cout << "Testing multi-lag step against explicit history..." << std::endl;
+
+    const size_t T = 30, d = 3, k = 8, window = 5;
+    const int64_t lags[] = {1, 8};
+    std::vector<float> Z(T * d);
+    for (size_t i = 0; i < Z.size(); ++i) {
+        Z[i] = 1.0f + std::cos(0.2f * static_cast<float>(i));
+    }
+
+    std::vector<float> ring(k * d, 0.0f);
+    std::vector<double> ring_norm(k, 0.0), window_sum(d, 0.0), drift(3), consistency(3);
+    for (size_t t = 0; t < T; ++t) {
+        const float* z = Z.data() + t * d;
+        reslik::sensors::temporal_multi_lag_step(z, d, ring.data(), ring_norm.data(), k, t % k, t,
+                                                 lags, 2, window_sum.data(), window, 1.0f, 1e-6f,
+                                                 drift.data(), consistency.data());
+        // Lag 1 equals a plain streaming step
+        if (t >= 1) {
+            auto s = reslik::sensors::temporal_step(z, z - d, reslik::sensors::l2_norm(z - d, d),
+                                                    d, 1.0f, 1e-6f);
+            assert(std::abs(drift[0] - s.drift) < 1e-6);
+        } else {
+            assert(drift[0] == 0.0 && consistency[0] == 1.0);
+        }
+        assert(t >= 8 || drift[1] == 0.0);
+        assert(std::abs(consistency[2] - std::exp(-drift[2])) < 1e-12);
+
+        // After every full window the running sum is exact
+        if ((t + 1) % window == 0) {
+            for (size_t j = 0; j < d; ++j) {
+                double expected = 0.0;
+                for (size_t r = t + 1 - window; r <= t; ++r) {
+                    expected += Z[r * d + j];
+                }
+                assert(std::abs(window_sum[j] - expected) < 1e-12);
+            }
+        }
+    }
+
+    std::cout << "Passed." << std::endl;
+}
+
+int main() {
+    test_agreement();
+    test_temporal_sequence_matches_steps();
+    test_multi_lag_step();
+    return 0;
+}
@@ -1,14 +1,9 @@
-import sys
-from unittest.mock import MagicMock
-# Mock the C++ core extension to bypass linking errors
-sys.modules['reslik._core'] = MagicMock()
-
 import numpy as np
 from reslik.wrapper import ResLikUnit
 from reslik.sensors.temporal_consistency import TemporalConsistencySensor
 from reslik.sensors.agreement_sensor import AgreementSensor
 from reslik.diagnostics import ResLikDiagnostics
-from reslik.control_surface import ControlSurface, ControlAction
+from reslik.control_surface import ControlAction, ControlReason, MultiSensorControlSurface
 
 def run_multi_sensor_pipeline():
     print("--- Multi-Sensor AI Pipeline Demo ---")
@@ -24,10 +19,9 @@ def run_multi_sensor_pipeline():
     agreement = AgreementSensor()
     
     # 2. Initialize Control Surface
-    # We define a custom logic: If ANY sensor fails, we degrade.
-    # Note: The ControlSurface class in v1.0 only takes ResLikDiagnostics.
-    # In a real multi-sensor system, we would extend ControlSignal to aggregate them.
-    # Here, we demonstrate the LOGIC in the script.
+    # If ANY sensor fails, we degrade (conservative OR).
+    # agreement_threshold is on raw agreement A: consistency 0.6 <=> A = 0.2
+    control = MultiSensorControlSurface(tcs_consistency_threshold=0.5, agreement_threshold=0.2)
     
     print("Sensors Initialized: ResLik + TCS + Agreement")
     
@@ -59,17 +53,18 @@ def run_multi_sensor_pipeline():
     print(f"[Agreement] Consistency: {diag_agree['agreement_consistency']:.2f} ({agree_status})")
     
     # 4. Combined Control Logic (The "Conservative OR")
-    actions = []
-    if diag_reslik.mean_gate_value < 0.5: actions.append("ResLik_OOD")
-    if diag_tcs['temporal_consistency'] < 0.5: actions.append("TCS_Unstable")
-    if diag_agree['agreement_consistency'] < 0.6: actions.append("Agree_Conflict")
-    
-    final_action = ControlAction.PROCEED
-    if actions:
-        final_action = ControlAction.DEFER
+    # Arrays of length 1 here; the same call decides whole batches at once.
+    codes, reasons = control.evaluate(
+        np.array([diag_reslik.mean_gate_value]),
+        np.array([diag_reslik.max_discrepancy]),
+        temporal_consistency=np.array([diag_tcs['temporal_consistency']]),
+        agreement=np.array([diag_agree['agreement']])
+    )
+    final_action = ControlAction(int(codes[0]))
+    flags = [r.name for r in ControlReason if r and r & int(reasons[0])]
         
     print(f"\n[Control Surface] Final Recommendation: {final_action.name}")
-    print(f"Reasons: {actions}")
+    print(f"Reasons: {flags}")
     print(">> Logic: Although ResLik thought the input was valid, TCS and Agreement correctly flagged the anomaly.")
 
 if __name__ == "__main__":
@@ -3,38 +3,55 @@ Example: Applying ResLik to Mock RNA-seq Embeddings.
 
 Intent:
 - Show how ResLik fits into a gene expression workflow.
-- Input: Gene embeddings (e.g., from an Autoencoder or PCA).
+- Input: Gene embeddings (e.g., from an Autoencoder or PCA), stored as `.npy`.
 - Output: Gated embeddings + Quality Control diagnostics.
+
+The embedding file is memory-mapped and scored in row blocks
+(`reslik.storage.score_file`), so dumps larger than RAM work the same way.
+Rerunning after an interruption resumes from the last finished block.
 """
 
+import os
+import tempfile
 import numpy as np
 from reslik import ResLikUnit
+from reslik.storage import score_file
 
-def apply_reslik_rna():
+def apply_reslik_rna(embedding_path=None, output_dir=None):
     print("=== ResLik RNA-seq Example (Mock) ===")
     
     # Mock parameters
     n_genes = 2000 # Number of highly variable genes
     embedding_dim = 128
     
-    # Mock embeddings (e.g., latent space of a VAE)
-    embeddings = np.random.randn(n_genes, embedding_dim).astype(np.float32)
+    # Mock inputs and default outputs live in a scratch directory removed at the end
+    with tempfile.TemporaryDirectory(prefix="reslik_rna_") as workdir:
+        if embedding_path is None:
+            # Mock embeddings (e.g., latent space of a VAE), written as a real analysis would
+            embedding_path = os.path.join(workdir, "embeddings.npy")
+            np.save(embedding_path, np.random.randn(n_genes, embedding_dim).astype(np.float32))
+        if output_dir is None:
+            output_dir = os.path.join(workdir, "reslik")
     
-    # Initialize Unit
-    unit = ResLikUnit(input_dim=embedding_dim, latent_dim=64)
+        # Initialize Unit
+        unit = ResLikUnit(input_dim=embedding_dim, latent_dim=64)
     
-    # Apply ResLik
-    # In a real scenario, ref_mean/ref_std would come from a healthy reference atlas.
-    gated_embeddings, diagnostics = unit(
-        embeddings, 
-        ref_mean=0.0, 
-        ref_std=1.0, 
-        gating_lambda=1.5 # Stricter gating
-    )
+        # Apply ResLik block by block; outputs go straight to memory-mapped files.
+        # In a real scenario, ref_mean/ref_std would come from a healthy reference atlas.
+        diagnostics = score_file(
+            unit,
+            embedding_path,
+            output_dir,
+            block_rows=512,
+            ref_mean=0.0, 
+            ref_std=1.0, 
+            gating_lambda=1.5 # Stricter gating
+        )
+        gated_embeddings = np.load(os.path.join(output_dir, "outputs.npy"), mmap_mode="r")
     
-    print(f"Input Shape: {embeddings.shape}")
-    print(f"Output Shape: {gated_embeddings.shape}")
-    print(f"Diagnostics: {diagnostics.summary()}")
+        print(f"Input Shape: {np.load(embedding_path, mmap_mode='r').shape}")
+        print(f"Output Shape: {gated_embeddings.shape} ({output_dir})")
+        print(f"Diagnostics: {diagnostics.summary()}")
 
 if __name__ == "__main__":
-    apply_reslik_rna()
\ No newline at end of file
+    apply_reslik_rna()
@@ -1,7 +1,3 @@
-import sys
-from unittest.mock import MagicMock
-sys.modules['reslik._core'] = MagicMock()
-
 import numpy as np
 from reslik.sensors.temporal_consistency import TemporalConsistencySensor
 from reslik.sensors.agreement_sensor import AgreementSensor
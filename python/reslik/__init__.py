@@ -1,5 +1,6 @@
 from .version import __version__
 from .wrapper import ResLikUnit
 from .diagnostics import ResLikDiagnostics
+from .reference import ReferenceStats, merge_reference_stats
 
-__all__ = ["ResLikUnit", "ResLikDiagnostics", "__version__"]
+__all__ = ["ResLikUnit", "ResLikDiagnostics", "ReferenceStats", "merge_reference_stats", "__version__"]
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Protocol
+from typing import Any, Dict, Optional, Protocol
 from .diagnostics import ResLikDiagnostics
 
 class ControlPolicy(Protocol):
@@ -33,8 +33,35 @@ class ExecutionDecision:
     
     This class can be used to wrap the output of a ControlPolicy, 
     separating the reliability signal from the resulting action.
+
+    Instances are slotted, and the `metadata` dict is only allocated when a
+    decision actually carries or requests metadata.
     """
-    def __init__(self, action_id: str, confidence: float, metadata: Dict[str, Any] = None):
+    __slots__ = ("action_id", "confidence", "_metadata")
+
+    def __init__(self, action_id: str, confidence: float, metadata: Optional[Dict[str, Any]] = None):
         self.action_id = action_id
         self.confidence = confidence
-        self.metadata = metadata or {}
+        self._metadata = metadata or None
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        if self._metadata is None:
+            self._metadata = {}
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, value: Optional[Dict[str, Any]]) -> None:
+        self._metadata = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the decision to a standard dictionary."""
+        return {
+            "action_id": self.action_id,
+            "confidence": self.confidence,
+            "metadata": dict(self._metadata) if self._metadata else {}
+        }
+
+    def __repr__(self) -> str:
+        return (f"ExecutionDecision(action_id={self.action_id!r}, confidence={self.confidence!r}, "
+                f"metadata={self._metadata or {}!r})")
@@ -1,7 +1,8 @@
-from dataclasses import dataclass, field
-from enum import Enum, auto
-from typing import Dict, Any, Optional
-from .diagnostics import ResLikDiagnostics
+from dataclasses import dataclass
+from enum import Enum, IntFlag, auto
+from typing import Dict, Any, Optional, Tuple
+import numpy as np
+from .diagnostics import ResLikDiagnostics, SummaryStats, _slotted
 
 class ControlAction(Enum):
     """
@@ -18,6 +19,26 @@ class ControlAction(Enum):
     DEFER = auto()
     ABSTAIN = auto()
 
+class ControlReason(IntFlag):
+    """
+    Bitmask of sensor conditions behind a multi-sensor control decision.
+
+    Values:
+        NONE: No sensor raised a flag.
+        RESLIK_DISCREPANCY: ResLik discrepancy above threshold (ABSTAIN).
+        RESLIK_UNRELIABLE: ResLik gate at or below the low reliability threshold (DEFER).
+        RESLIK_MARGINAL: ResLik gate between the low and high thresholds (DOWNWEIGHT).
+        TCS_UNSTABLE: Temporal consistency below threshold (DEFER).
+        AGREEMENT_CONFLICT: Cross-view agreement below threshold (DEFER).
+    """
+    NONE = 0
+    RESLIK_DISCREPANCY = 1
+    RESLIK_UNRELIABLE = 2
+    RESLIK_MARGINAL = 4
+    TCS_UNSTABLE = 8
+    AGREEMENT_CONFLICT = 16
+
+@_slotted
 @dataclass
 class ControlSignal:
     """
@@ -28,8 +49,13 @@ class ControlSignal:
                                    Higher is better. Typically derived from mean gate value.
         mean_discrepancy (float): Average statistical deviation from the reference.
         max_discrepancy (float): Maximum statistical deviation observed in the input.
-        gate_summary (Dict[str, float]): Summary statistics of the gating mask (e.g., mean, min).
+        gate_summary (Dict[str, float]): Summary statistics of the gating mask: mean, plus
+                                         min, max and std when the core provided aggregates.
         recommended_action (ControlAction): The explicit action suggested by the control surface.
+
+    Instances are slotted (no per-instance `__dict__`). A signal can be reused
+    through `ControlSurface.evaluate(..., out=signal)`, which also refills its
+    `gate_summary` dict in place.
     """
     reliability_score: float
     mean_discrepancy: float
@@ -37,6 +63,16 @@ class ControlSignal:
     gate_summary: Dict[str, float]
     recommended_action: ControlAction
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the signal to a standard dictionary (action by name)."""
+        return {
+            "reliability_score": self.reliability_score,
+            "mean_discrepancy": self.mean_discrepancy,
+            "max_discrepancy": self.max_discrepancy,
+            "gate_summary": dict(self.gate_summary),
+            "recommended_action": self.recommended_action.name
+        }
+
 class ControlSurface:
     """
     Deterministic control logic that maps ResLik diagnostics to explicit control actions.
@@ -60,7 +96,8 @@ class ControlSurface:
         self.r_low = reliability_low
         self.d_max = max_discrepancy_threshold
         
-    def evaluate(self, diagnostics: ResLikDiagnostics) -> ControlSignal:
+    def evaluate(self, diagnostics: ResLikDiagnostics,
+                 out: Optional[ControlSignal] = None) -> ControlSignal:
         """
         Evaluate diagnostics to produce a ControlSignal.
         
@@ -72,37 +109,20 @@ class ControlSurface:
             
         Args:
             diagnostics (ResLikDiagnostics): The output from a ResLikUnit.
+            out (ControlSignal, optional): Signal to overwrite in place instead of
+                                           allocating a new one (e.g. in per-tick loops).
             
         Returns:
-            ControlSignal: Structured recommendation.
+            ControlSignal: Structured recommendation (`out` if given).
         """
         reliability = diagnostics.mean_gate_value
         max_disc = diagnostics.max_discrepancy
         
-        # Default mean discrepancy if not present (ResLikDiagnostics might evolve)
-        # Assuming ResLikDiagnostics has max_discrepancy and mean_gate_value as per definition.
-        # We'll use 0.0 for mean_discrepancy if not easily computable from current diagnostics,
-        # but the current definition of ResLikDiagnostics is simple. 
-        # Ideally we'd want mean_discrepancy in ResLikDiagnostics, but for now we rely on what is there.
-        # Wait, ResLikDiagnostics has `mean_gate_value` and `max_discrepancy`.
-        # It doesn't explicitly have `mean_discrepancy`. 
-        # Phase 6 spec says "ControlSignal... mean_discrepancy: float".
-        # We will set mean_discrepancy to 0.0 or same as max for now if not available,
-        # BUT strictly, let's look at `diagnostics.py` content again.
-        # It has `mean_gate_value` and `max_discrepancy`.
-        # We will infer or pass-through. Since we can't calculate mean discrepancy from just max and mean_gate
-        # without per-sample data, and we want to avoid large computation, we will set it to -1.0 
-        # or similar to indicate "not available" unless we update diagnostics.
-        # However, the constraint is "DO NOT modify ResLik core math/APIs".
-        # I will define mean_discrepancy in ControlSignal as optional or fill with a placeholder
-        # derived from available data if possible, or just set to 0.0 if unknown.
-        # Actually, let's check if we can get it from per_sample_details if available.
-        
-        mean_disc = 0.0
-        if diagnostics.per_sample_details:
-             # If batch details exist, we might try to extract, but that's O(N).
-             # Let's keep it cheap.
-             pass
+        # Aggregates accumulated by the core during the forward pass (O(1) here).
+        # Diagnostics built without them (e.g. by hand) report mean discrepancy 0.0.
+        gate_stats = diagnostics.gate_stats
+        disc_stats = diagnostics.discrepancy_stats
+        mean_disc = disc_stats.mean if disc_stats is not None and disc_stats.count else 0.0
 
         action = ControlAction.DEFER
         
@@ -115,13 +135,175 @@ class ControlSurface:
         else:
             action = ControlAction.DEFER
             
-        return ControlSignal(
-            reliability_score=reliability,
-            mean_discrepancy=mean_disc, # Placeholder as strictly not in minimal diagnostics
-            max_discrepancy=max_disc,
-            gate_summary={"mean": reliability},
-            recommended_action=action
-        )
+        if out is None:
+            return ControlSignal(reliability, mean_disc, max_disc,
+                                 self._fill_gate_summary({}, reliability, gate_stats), action)
+
+        out.reliability_score = reliability
+        out.mean_discrepancy = mean_disc
+        out.max_discrepancy = max_disc
+        out.recommended_action = action
+        out.gate_summary.clear()
+        self._fill_gate_summary(out.gate_summary, reliability, gate_stats)
+        return out
+
+    @staticmethod
+    def _fill_gate_summary(summary: Dict[str, float], reliability: float,
+                           gate_stats: Optional[SummaryStats]) -> Dict[str, float]:
+        """Mean gate value, plus min, max and std when the core provided aggregates."""
+        summary["mean"] = reliability
+        if gate_stats is not None and gate_stats.count:
+            summary["min"] = gate_stats.min
+            summary["max"] = gate_stats.max
+            summary["std"] = gate_stats.std
+        return summary
+
+    def evaluate_batch(self, gate_values: np.ndarray,
+                       discrepancy_values: np.ndarray) -> Tuple[np.ndarray, Dict[ControlAction, int]]:
+        """
+        Evaluate per-sample diagnostics to one action per sample.
+
+        Applies the same logic as `evaluate` to every sample (its gate value as
+        reliability, its discrepancy as max discrepancy) with vectorized
+        comparisons, without constructing diagnostics or signal objects.
+
+        Args:
+            gate_values (np.ndarray): Per-sample gate values, shape (n_samples,),
+                                      e.g. `ResLikDiagnostics.gate_values`.
+            discrepancy_values (np.ndarray): Per-sample discrepancies, shape (n_samples,).
+
+        Returns:
+            Tuple[np.ndarray, Dict[ControlAction, int]]:
+                - int8 action codes of shape (n_samples,); code c means `ControlAction(c)`.
+                - Number of samples assigned to each action.
+        """
+        gates = np.asarray(gate_values)
+        discs = np.asarray(discrepancy_values)
+
+        if gates.ndim != 1 or gates.shape != discs.shape:
+            raise ValueError(
+                f"Gate and discrepancy values must be 1D arrays of equal length. "
+                f"Got shapes {gates.shape} and {discs.shape}."
+            )
+
+        # Thresholds as float64 so float32 inputs compare exactly like `evaluate`
+        r_low, r_high, d_max = np.float64(self.r_low), np.float64(self.r_high), np.float64(self.d_max)
+
+        # Later assignments take priority, mirroring the if/elif order in `evaluate`
+        codes = np.full(gates.shape, ControlAction.DEFER.value, dtype=np.int8)
+        np.putmask(codes, gates > r_low, ControlAction.DOWNWEIGHT.value)
+        np.putmask(codes, gates > r_high, ControlAction.PROCEED.value)
+        np.putmask(codes, discs > d_max, ControlAction.ABSTAIN.value)
+
+        totals = np.bincount(codes, minlength=len(ControlAction) + 1)
+        counts = {action: int(totals[action.value]) for action in ControlAction}
+
+        return codes, counts
+
+
+class MultiSensorControlSurface:
+    """
+    Deterministic per-sample control logic over ResLik, TCS and Agreement signals.
+
+    Applies the conservative OR of the sensor composition rules: every sensor
+    can only make the decision more cautious, with precedence
+    ABSTAIN > DEFER > DOWNWEIGHT > PROCEED. All samples are decided with
+    vectorized comparisons, and the triggering conditions are reported as a
+    `ControlReason` bitmask per sample.
+
+    Stateless and inspection-friendly, like `ControlSurface`.
+    """
+
+    def __init__(self,
+                 reliability_high: float = 0.8,
+                 reliability_low: float = 0.5,
+                 max_discrepancy_threshold: float = 5.0,
+                 tcs_consistency_threshold: float = 0.2,
+                 agreement_threshold: float = 0.3):
+        """
+        Initialize the multi-sensor control surface with explicit thresholds.
+
+        Args:
+            reliability_high (float): ResLik gate above which ResLik alone says PROCEED.
+            reliability_low (float): ResLik gate at or below which the action is DEFER.
+                                     Between low and high is DOWNWEIGHT.
+            max_discrepancy_threshold (float): ResLik discrepancy above which the action
+                                               is ABSTAIN, regardless of other sensors.
+            tcs_consistency_threshold (float): Temporal consistency below which the action
+                                               is at least DEFER.
+            agreement_threshold (float): Raw cross-view agreement A in [-1, 1] below which
+                                         the action is at least DEFER.
+        """
+        self.r_high = reliability_high
+        self.r_low = reliability_low
+        self.d_max = max_discrepancy_threshold
+        self.tcs_min = tcs_consistency_threshold
+        self.agreement_min = agreement_threshold
+
+    def evaluate(self,
+                 gate_values: np.ndarray,
+                 discrepancy_values: np.ndarray,
+                 temporal_consistency: Optional[np.ndarray] = None,
+                 agreement: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Decide one action per sample from aligned sensor arrays.
+
+        Args:
+            gate_values (np.ndarray): ResLik per-sample gate values, shape (n_samples,).
+            discrepancy_values (np.ndarray): ResLik per-sample discrepancies, shape (n_samples,).
+            temporal_consistency (np.ndarray, optional): TCS consistency T_t per sample.
+            agreement (np.ndarray, optional): Raw agreement A per sample
+                                              (`AgreementSensor.evaluate_batch()["agreement"]`).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]:
+                - int8 action codes of shape (n_samples,); code c means `ControlAction(c)`.
+                - uint8 `ControlReason` bitmasks of shape (n_samples,).
+        """
+        gates = np.asarray(gate_values)
+        signals = [("discrepancy_values", np.asarray(discrepancy_values))]
+        if temporal_consistency is not None:
+            signals.append(("temporal_consistency", np.asarray(temporal_consistency)))
+        if agreement is not None:
+            signals.append(("agreement", np.asarray(agreement)))
+
+        if gates.ndim != 1:
+            raise ValueError(f"gate_values must be 1D, got shape {gates.shape}.")
+        for name, values in signals:
+            if values.shape != gates.shape:
+                raise ValueError(f"{name} has shape {values.shape}, expected {gates.shape}.")
+
+        # Thresholds as float64 so float32 inputs compare exactly like ControlSurface.evaluate
+        r_low, r_high, d_max = np.float64(self.r_low), np.float64(self.r_high), np.float64(self.d_max)
+
+        # Conditions are negated passes, so a NaN signal fails safe (as in ControlSurface.evaluate_batch)
+        reliable = gates > r_low
+        conditions = [
+            (np.asarray(discrepancy_values) > d_max, ControlReason.RESLIK_DISCREPANCY),
+            (~reliable, ControlReason.RESLIK_UNRELIABLE),
+            (reliable & ~(gates > r_high), ControlReason.RESLIK_MARGINAL),
+        ]
+        if temporal_consistency is not None:
+            conditions.append((~(np.asarray(temporal_consistency) >= np.float64(self.tcs_min)),
+                               ControlReason.TCS_UNSTABLE))
+        if agreement is not None:
+            conditions.append((~(np.asarray(agreement) >= np.float64(self.agreement_min)),
+                               ControlReason.AGREEMENT_CONFLICT))
+
+        reasons = np.zeros(gates.shape, dtype=np.uint8)
+        for mask, reason in conditions:
+            np.bitwise_or(reasons, np.uint8(reason), out=reasons, where=mask)
+
+        # Later assignments take priority: ABSTAIN > DEFER > DOWNWEIGHT > PROCEED
+        defer_mask = np.uint8(ControlReason.RESLIK_UNRELIABLE | ControlReason.TCS_UNSTABLE
+                              | ControlReason.AGREEMENT_CONFLICT)
+        codes = np.full(gates.shape, ControlAction.PROCEED.value, dtype=np.int8)
+        np.putmask(codes, reasons & np.uint8(ControlReason.RESLIK_MARGINAL), ControlAction.DOWNWEIGHT.value)
+        np.putmask(codes, reasons & defer_mask, ControlAction.DEFER.value)
+        np.putmask(codes, reasons & np.uint8(ControlReason.RESLIK_DISCREPANCY), ControlAction.ABSTAIN.value)
+
+        return codes, reasons
+
 
 def build_control_signal(reslik_output: Any, diagnostics: ResLikDiagnostics, control_surface: ControlSurface) -> ControlSignal:
     """
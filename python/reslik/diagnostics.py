@@ -1,20 +1,218 @@
-from dataclasses import dataclass, asdict, field
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, field, fields
+from typing import List, Dict, Any, Optional, Sequence, Union, Iterator
+import math
 import numpy as np
 
+def _slotted(cls: type) -> type:
+    """
+    Rebuild a dataclass with `__slots__` instead of a per-instance `__dict__`.
+
+    Equivalent to `@dataclass(slots=True)` (Python >= 3.10) for older
+    interpreters. Pickle support goes through `__getstate__`/`__setstate__`, so
+    frozen classes round-trip as well.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = {k: v for k, v in cls.__dict__.items() if k not in names + ("__dict__", "__weakref__")}
+    namespace["__slots__"] = names
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in names)
+
+    def __setstate__(self, state):
+        for name, value in zip(names, state):
+            object.__setattr__(self, name, value)
+
+    namespace["__getstate__"] = __getstate__
+    namespace["__setstate__"] = __setstate__
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+@_slotted
+@dataclass(frozen=True)
+class SummaryStats:
+    """
+    Streaming aggregate (count, sum, sum of squares, min, max) of one
+    per-sample diagnostic, as accumulated by the C++ core during the forward
+    pass. Mean, spread and range are then available in O(1).
+    """
+    count: int = 0
+    sum: float = 0.0
+    sum_sq: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    @property
+    def variance(self) -> float:
+        """Population variance (0.0 if empty)."""
+        if not self.count:
+            return 0.0
+        return max(0.0, self.sum_sq / self.count - self.mean ** 2)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def merge(self, other: "SummaryStats") -> "SummaryStats":
+        """Combine with another summary (e.g. from a different batch)."""
+        return SummaryStats(
+            count=self.count + other.count,
+            sum=self.sum + other.sum,
+            sum_sq=self.sum_sq + other.sum_sq,
+            min=min(self.min, other.min),
+            max=max(self.max, other.max)
+        )
+
+    def to_dict(self) -> Dict[str, float]:
+        return {"count": self.count, "mean": self.mean, "std": self.std, "min": self.min, "max": self.max}
+
+    @classmethod
+    def from_values(cls, values: np.ndarray) -> "SummaryStats":
+        """Summarize an array of per-sample values with vectorized reductions."""
+        values = np.asarray(values)
+        if values.size == 0:
+            return cls()
+        wide = values.astype(np.float64, copy=False).ravel()
+        return cls(
+            count=int(values.size),
+            sum=float(np.sum(wide)),
+            sum_sq=float(np.dot(wide, wide)),
+            min=float(np.min(values)),
+            max=float(np.max(values))
+        )
+
+    @classmethod
+    def _from_core(cls, summary: Any) -> "SummaryStats":
+        return cls(
+            count=int(summary.count),
+            sum=summary.sum,
+            sum_sq=summary.sum_sq,
+            min=summary.min,
+            max=summary.max
+        )
+
+class PerSampleDetails(Sequence):
+    """
+    Lazy, read-only view of per-sample diagnostics backed by columnar arrays.
+
+    Items are materialized as {"mean_gate", "max_discrepancy"} dicts only when
+    accessed, so large batches do not allocate one Python object per sample.
+    """
+    __slots__ = ("gate_values", "discrepancy_values")
+
+    def __init__(self, gate_values: np.ndarray, discrepancy_values: np.ndarray):
+        if len(gate_values) != len(discrepancy_values):
+            raise ValueError(
+                f"Gate and discrepancy columns must have the same length. "
+                f"Got {len(gate_values)} and {len(discrepancy_values)}."
+            )
+        self.gate_values = gate_values
+        self.discrepancy_values = discrepancy_values
+
+    def __len__(self) -> int:
+        return len(self.gate_values)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict[str, float], "PerSampleDetails"]:
+        if isinstance(index, slice):
+            return PerSampleDetails(self.gate_values[index], self.discrepancy_values[index])
+        return {
+            "mean_gate": float(self.gate_values[index]),
+            "max_discrepancy": float(self.discrepancy_values[index])
+        }
+
+    def __iter__(self) -> Iterator[Dict[str, float]]:
+        for g, c in zip(self.gate_values.tolist(), self.discrepancy_values.tolist()):
+            yield {"mean_gate": g, "max_discrepancy": c}
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, PerSampleDetails):
+            return (np.array_equal(self.gate_values, other.gate_values)
+                    and np.array_equal(self.discrepancy_values, other.discrepancy_values))
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"PerSampleDetails(n_samples={len(self)})"
+
+@_slotted
 @dataclass
 class ResLikDiagnostics:
     """
     Structured container for ResLik diagnostic outputs.
+
+    For batches, per-sample values are stored column-wise in `gate_values` and
+    `discrepancy_values` (contiguous float32 arrays). `per_sample_details` is
+    then a lazy view over those columns.
+
+    `gate_stats` and `discrepancy_stats` carry the aggregates accumulated by the
+    core during the forward pass, so means and ranges need no per-sample pass.
+
+    Instances are slotted (no per-instance `__dict__`).
     """
     mean_gate_value: float
     max_discrepancy: float
-    per_sample_details: Optional[List[Dict[str, float]]] = None
-    
+    per_sample_details: Optional[Sequence[Dict[str, float]]] = None
+    gate_values: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    discrepancy_values: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    gate_stats: Optional[SummaryStats] = field(default=None, repr=False, compare=False)
+    discrepancy_stats: Optional[SummaryStats] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.per_sample_details is None and self.gate_values is not None:
+            self.per_sample_details = PerSampleDetails(self.gate_values, self.discrepancy_values)
+
+    @property
+    def mean_discrepancy(self) -> Optional[float]:
+        """Mean discrepancy over the samples, if aggregates are available."""
+        if self.discrepancy_stats is None:
+            return None
+        return self.discrepancy_stats.mean
+
+    @classmethod
+    def from_arrays(cls, gate_values: np.ndarray, discrepancy_values: np.ndarray,
+                    gate_stats: Optional[SummaryStats] = None,
+                    discrepancy_stats: Optional[SummaryStats] = None) -> "ResLikDiagnostics":
+        """
+        Build batch diagnostics from per-sample columns.
+
+        Aggregates come from `gate_stats` / `discrepancy_stats` when given (as
+        accumulated by the core), otherwise from vectorized reductions.
+
+        Args:
+            gate_values (np.ndarray): Per-sample gate values, shape (n_samples,).
+            discrepancy_values (np.ndarray): Per-sample discrepancy scores, shape (n_samples,).
+            gate_stats (SummaryStats, optional): Precomputed gate aggregates.
+            discrepancy_stats (SummaryStats, optional): Precomputed discrepancy aggregates.
+        """
+        gate_values = np.ascontiguousarray(gate_values, dtype=np.float32)
+        discrepancy_values = np.ascontiguousarray(discrepancy_values, dtype=np.float32)
+
+        if gate_stats is None:
+            gate_stats = SummaryStats.from_values(gate_values)
+        if discrepancy_stats is None:
+            discrepancy_stats = SummaryStats.from_values(discrepancy_values)
+
+        return cls(
+            mean_gate_value=gate_stats.mean,
+            max_discrepancy=discrepancy_stats.max if discrepancy_stats.count else 0.0,
+            gate_values=gate_values,
+            discrepancy_values=discrepancy_values,
+            gate_stats=gate_stats,
+            discrepancy_stats=discrepancy_stats
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert diagnostics to a standard dictionary."""
-        return asdict(self)
-    
+        details = self.per_sample_details
+        return {
+            "mean_gate_value": self.mean_gate_value,
+            "max_discrepancy": self.max_discrepancy,
+            "per_sample_details": None if details is None else [dict(d) for d in details]
+        }
+
     def summary(self) -> str:
         """Return a human-readable summary string."""
         return (
@@ -30,5 +228,7 @@ def wrap_diagnostics(raw_dict: Dict[str, Any]) -> ResLikDiagnostics:
     return ResLikDiagnostics(
         mean_gate_value=raw_dict.get("mean_gate", 0.0),
         max_discrepancy=raw_dict.get("max_discrepancy", 0.0),
-        per_sample_details=raw_dict.get("per_sample")
-    )
\ No newline at end of file
+        per_sample_details=raw_dict.get("per_sample"),
+        gate_stats=raw_dict.get("gate_stats"),
+        discrepancy_stats=raw_dict.get("discrepancy_stats")
+    )
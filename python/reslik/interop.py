@@ -0,0 +1,77 @@
+"""
+Framework interop for ResLik inputs and outputs.
+
+Tensors from any library implementing the DLPack protocol (`__dlpack__`) are
+imported as NumPy views without copying when they live in CPU memory, and
+results are exported back to the caller's framework the same way.
+"""
+import sys
+import warnings
+from typing import Any, Callable, Optional, Tuple
+
+import numpy as np
+
+
+def _detach_if_required(obj: Any) -> Any:
+    """Detach autograd-tracked tensors (DLPack refuses to export them)."""
+    if getattr(obj, "requires_grad", False) and hasattr(obj, "detach"):
+        warnings.warn(
+            "ResLik received a tensor with requires_grad=True. "
+            "Gradients will NOT flow through ResLik (it is a C++ inference op). "
+            "Detaching tensor implicitly.",
+            UserWarning
+        )
+        return obj.detach()
+    return obj
+
+
+def _framework_from_dlpack(obj: Any) -> Optional[Callable[[Any], Any]]:
+    """Return the `from_dlpack` of the top-level package that defines type(obj), if any."""
+    package = type(obj).__module__.split(".")[0]
+    if package in ("numpy", "builtins"):
+        return None
+    module = sys.modules.get(package)
+    return getattr(module, "from_dlpack", None)
+
+
+def import_array(obj: Any) -> Tuple[Any, Optional[Callable[[np.ndarray], Any]]]:
+    """
+    Convert a framework tensor to something `np.asarray` reads without copying.
+
+    Args:
+        obj: NumPy array, DLPack-capable tensor (PyTorch, JAX, TensorFlow, ...)
+             or any array-like.
+
+    Returns:
+        Tuple of (array-like, export). `export` converts a NumPy result back to
+        the caller's tensor type through DLPack, or is None when results should
+        stay NumPy arrays.
+    """
+    if isinstance(obj, np.ndarray):
+        return obj, None
+
+    obj = _detach_if_required(obj)
+
+    if hasattr(obj, "__dlpack__") and hasattr(np, "from_dlpack"):
+        try:
+            # Zero-copy for CPU tensors; raises for device memory or unsupported dtypes
+            array = np.from_dlpack(obj)
+        except (BufferError, RuntimeError, TypeError, ValueError):
+            array = None
+        if array is not None:
+            return array, _framework_from_dlpack(obj)
+
+    # Device tensors (e.g. CUDA) or frameworks without DLPack: copy to host
+    if hasattr(obj, "cpu") and hasattr(obj, "numpy"):
+        return obj.cpu().numpy(), None
+    return obj, None
+
+
+def export_array(array: np.ndarray, export: Optional[Callable[[np.ndarray], Any]]) -> Any:
+    """Hand a NumPy result back through DLPack when the input came from a framework."""
+    if export is None:
+        return array
+    try:
+        return export(array)
+    except (BufferError, RuntimeError, TypeError, ValueError):
+        return array
@@ -0,0 +1,252 @@
+"""
+Process-pool sharding of large ResLik batches through shared memory.
+
+The input, output and per-sample diagnostic columns of a call live in
+memory-mapped files in shared memory (`/dev/shm` by default). Each worker
+process rebuilds the unit once (from its pickled parameters, see
+`ResLikUnit.__reduce__`), maps the files and gates a range of rows in place,
+so no matrix data is sent through pipes. Every row is computed exactly as in
+a single-process call, so outputs and per-sample diagnostics are identical.
+
+The returned outputs are the shared mappings themselves (no copy back). Their
+files are unlinked as soon as the call finishes, so the memory is released
+when the last reference to the arrays is dropped. Where a mapped file cannot be
+unlinked (Windows), it is removed once its mapping is closed.
+"""
+from concurrent.futures import ProcessPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple
+import os
+import tempfile
+import uuid
+import warnings
+import weakref
+
+import numpy as np
+
+from .diagnostics import ResLikDiagnostics, SummaryStats
+from .wrapper import ResLikUnit
+
+# Worker ranges start on multiples of this many rows (the core's summary block size)
+_ROW_ALIGN = 256
+
+# Unit rebuilt once per worker process by the pool initializer
+_worker_unit: Optional[ResLikUnit] = None
+
+
+def _init_worker(unit: ResLikUnit) -> None:
+    global _worker_unit
+    # Parallelism comes from the processes; core threads on top would oversubscribe
+    unit.n_threads = 1
+    _worker_unit = unit
+
+
+def _shared_dir() -> str:
+    """Default directory for the mapped files: tmpfs shared memory, else the temp dir."""
+    if os.path.isdir("/dev/shm"):
+        return "/dev/shm"
+    directory = tempfile.gettempdir()
+    warnings.warn(
+        f"/dev/shm is not available; SharedMemoryExecutor maps files in {directory}, "
+        "which may be disk-backed. Pass shared_dir= to choose a RAM-backed directory.",
+        UserWarning
+    )
+    return directory
+
+
+def _remove(path: str, mapping: Any = None) -> None:
+    """Unlink a mapped file; if it is still mapped where that is not allowed, wait for `mapping` to close."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except PermissionError:
+        # Windows refuses to delete files with open mappings
+        if mapping is None:
+            raise
+        weakref.finalize(mapping, _remove, path)
+
+
+def _score_rows(files: Tuple[Tuple[str, Tuple[int, ...]], ...], begin: int, end: int,
+                kwargs: Dict[str, Any]) -> Tuple[SummaryStats, SummaryStats]:
+    """Worker task: gate rows [begin, end) of the shared input into the shared outputs."""
+    (input_path, input_shape), (output_path, output_shape), (columns_path, columns_shape) = files
+    inputs = np.memmap(input_path, dtype=np.float32, mode="r", shape=input_shape)
+    outputs = np.memmap(output_path, dtype=np.float32, mode="r+", shape=output_shape)
+    columns = np.memmap(columns_path, dtype=np.float32, mode="r+", shape=columns_shape)
+    try:
+        _, diagnostics = _worker_unit(inputs[begin:end], out=outputs[begin:end], **kwargs)
+    except ValueError as e:
+        row = getattr(e.__cause__, "row", None)
+        if row is None:
+            raise
+        # Report the row within the whole batch (the cause does not survive pickling)
+        raise ValueError(
+            f"Input contains NaNs or Infinities (first at row {begin + row}). "
+            "ResLik requires clean, finite embeddings. "
+            "See docs/failure_modes.md for details on numerical stability."
+        ) from None
+    columns[0, begin:end] = diagnostics.gate_values
+    columns[1, begin:end] = diagnostics.discrepancy_values
+    return diagnostics.gate_stats, diagnostics.discrepancy_stats
+
+
+class SharedMemoryExecutor:
+    """
+    Score large batches with a pool of worker processes sharing memory.
+
+    Example:
+        with SharedMemoryExecutor(unit, n_workers=8) as pool:
+            batch = pool.empty(n_samples)        # optional: fill the input in place
+            batch[:] = load_embeddings()
+            outputs, diagnostics = pool(batch, ref_mean=0.0, ref_std=1.0)
+
+    The unit's dimensions and fitted reference statistics are captured when the
+    executor is created; later changes to `unit` are not seen by the workers.
+    Each worker runs the core with one thread.
+    """
+
+    def __init__(self, unit: ResLikUnit, n_workers: Optional[int] = None, mp_context: Any = None,
+                 shared_dir: Optional[str] = None):
+        """
+        Start the worker pool.
+
+        Args:
+            unit (ResLikUnit): Unit to replicate in every worker.
+            n_workers (int, optional): Number of worker processes. Defaults to os.cpu_count().
+            mp_context (optional): `multiprocessing` context for the pool (e.g.
+                                   `multiprocessing.get_context("spawn")`).
+            shared_dir (str, optional): Directory for the mapped files. Defaults to
+                                        `/dev/shm`; where that does not exist (macOS,
+                                        Windows) the temp directory is used with a
+                                        warning, as it may be disk-backed.
+        """
+        self.unit = unit
+        self.n_workers = int(n_workers or os.cpu_count() or 1)
+        if self.n_workers <= 0:
+            raise ValueError(f"n_workers must be positive, got {n_workers}.")
+        self._dir = shared_dir if shared_dir is not None else _shared_dir()
+        self._inputs: Dict[str, weakref.finalize] = {}
+        self._pool = ProcessPoolExecutor(max_workers=self.n_workers, mp_context=mp_context,
+                                         initializer=_init_worker, initargs=(unit,))
+
+    def _new_file(self, shape: Tuple[int, ...]) -> Tuple[str, np.memmap]:
+        path = os.path.join(self._dir, f"reslik-{uuid.uuid4().hex}.f32")
+        return path, np.memmap(path, dtype=np.float32, mode="w+", shape=shape)
+
+    def empty(self, n_samples: int) -> np.ndarray:
+        """
+        Allocate an (n_samples, input_dim) float32 input batch in shared memory.
+
+        Filling it and passing it to the executor avoids copying the batch into
+        shared memory. Its file is removed once the array (and every view of it)
+        is garbage-collected, or when the executor is closed.
+        """
+        if n_samples <= 0:
+            raise ValueError(f"n_samples must be positive, got {n_samples}.")
+        # Forget batches that were already collected
+        for old_path in [p for p, finalizer in self._inputs.items() if not finalizer.alive]:
+            del self._inputs[old_path]
+        path, batch = self._new_file((int(n_samples), self.unit.input_dim))
+        # Track the mapping rather than the array so the file outlives every view
+        self._inputs[path] = weakref.finalize(batch._mmap, _remove, path)
+        return batch
+
+    def _shared_input(self, z_in: np.ndarray) -> Optional[str]:
+        """Path of `z_in` if it is a whole batch from `empty()` (usable in place), else None."""
+        path = z_in.filename if isinstance(z_in, np.memmap) else None
+        if path not in self._inputs or not self._inputs[path].alive:
+            return None
+        if z_in.dtype != np.float32 or not z_in.flags.c_contiguous:
+            return None
+        # A C-contiguous array covering the whole file is the batch itself, not a sub-view
+        return path if z_in.nbytes == os.path.getsize(path) else None
+
+    def __call__(self,
+                 z_in: np.ndarray,
+                 ref_mean: Optional[float] = None,
+                 ref_std: Optional[float] = None,
+                 gating_lambda: float = 1.0,
+                 gating_tau: float = 0.05) -> Tuple[np.ndarray, ResLikDiagnostics]:
+        """
+        Apply ResLik gating to a (n_samples, input_dim) batch across the worker pool.
+
+        Args:
+            z_in (np.ndarray): Input matrix. A batch from `empty()` is read in
+                               place; anything else is converted to float32 once
+                               while it is copied into shared memory.
+            ref_mean, ref_std, gating_lambda, gating_tau: As in `ResLikUnit.__call__`.
+
+        Returns:
+            Tuple[np.ndarray, ResLikDiagnostics]: Same as `ResLikUnit.__call__` for a
+            batch. The output and the per-sample columns are float32 arrays mapped
+            from shared memory (not copied back); their memory is released when
+            they are dropped. They equal a single-process call; the aggregates
+            match up to floating-point summation order.
+        """
+        shared_input = self._shared_input(z_in)
+        z_in = np.asarray(z_in)
+        if z_in.ndim != 2 or z_in.shape[1] != self.unit.input_dim:
+            raise ValueError(
+                f"Input must have shape (n_samples, {self.unit.input_dim}), got {z_in.shape}."
+            )
+        n_samples = z_in.shape[0]
+        if n_samples == 0:
+            raise ValueError("Input array is empty. See docs/failure_modes.md.")
+
+        # Resolve the reference once in the parent so every worker uses the same values
+        ref_mean, ref_std = self.unit.resolve_reference(ref_mean, ref_std)
+        kwargs = dict(ref_mean=ref_mean, ref_std=ref_std, gating_lambda=gating_lambda, gating_tau=gating_tau)
+
+        # Files created for this call, with the mapping (if any) that stays open in the parent
+        created: Dict[str, Any] = {}
+        try:
+            input_path = shared_input
+            if input_path is None:
+                input_path, staged = self._new_file(z_in.shape)
+                created[input_path] = None
+                staged[...] = z_in
+                staged.flush()
+                del staged
+            output_path, outputs = self._new_file((n_samples, self.unit.latent_dim))
+            created[output_path] = outputs._mmap
+            columns_path, columns = self._new_file((2, n_samples))
+            created[columns_path] = columns._mmap
+            files = ((input_path, z_in.shape), (output_path, outputs.shape), (columns_path, columns.shape))
+
+            futures = [self._pool.submit(_score_rows, files, begin, end, kwargs)
+                       for begin, end in self._row_ranges(n_samples)]
+            # Let every range finish before the files can be removed, even on failure
+            wait(futures)
+            # Merge in row order; the first failed range re-raises here
+            gate_stats, discrepancy_stats = SummaryStats(), SummaryStats()
+            for future in futures:
+                gates_part, discrepancies_part = future.result()
+                gate_stats = gate_stats.merge(gates_part)
+                discrepancy_stats = discrepancy_stats.merge(discrepancies_part)
+        finally:
+            # The parent's mappings stay valid after the names are removed
+            for path, mapping in created.items():
+                _remove(path, mapping)
+
+        return outputs.view(np.ndarray), ResLikDiagnostics.from_arrays(
+            columns[0], columns[1], gate_stats=gate_stats, discrepancy_stats=discrepancy_stats
+        )
+
+    def _row_ranges(self, n_samples: int) -> List[Tuple[int, int]]:
+        """One contiguous, block-aligned row range per worker."""
+        per_worker = -(-n_samples // self.n_workers)
+        chunk = -(-per_worker // _ROW_ALIGN) * _ROW_ALIGN
+        return [(begin, min(begin + chunk, n_samples)) for begin in range(0, n_samples, chunk)]
+
+    def close(self) -> None:
+        """Shut down the worker processes and remove the files of batches from `empty()`."""
+        self._pool.shutdown()
+        for finalizer in self._inputs.values():
+            finalizer()
+        self._inputs.clear()
+
+    def __enter__(self) -> "SharedMemoryExecutor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
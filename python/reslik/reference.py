@@ -0,0 +1,131 @@
+"""
+Streaming reference statistics for ResLik gating.
+
+ResLik compares each embedding against a reference distribution summarized by
+two scalars, mu_ref and sigma_ref (docs/theory.md, Step 4). This module fits
+them from reference data in a single pass with bounded memory, as the mean and
+standard deviation of all embedding values pooled together (a design choice;
+the theory only requires two scalars).
+
+Expected Usage:
+    - Fit a reference atlas chunk by chunk: `stats.update(chunk)` per chunk.
+    - Fit shards in parallel workers, ship `to_dict()` states back, and
+      combine them with `merge_reference_stats`.
+    - Pass the result to `ResLikUnit.load_reference_stats`, or use
+      `ref_mean`/`ref_std` directly.
+"""
+
+from typing import Any, Dict, Iterable, Union
+import numpy as np
+from . import _core
+
+class ReferenceStats:
+    """
+    Mergeable streaming accumulator for mu_ref and sigma_ref.
+
+    Tracks count, mean and sum of squared deviations (M2) of every embedding
+    value seen (the pooled per-element distribution). Batches are folded in
+    with Welford/Chan updates in the C++ core, and two partial states merge
+    exactly, so shards can be fitted independently and combined afterwards.
+    """
+
+    def __init__(self, count: int = 0, mean: float = 0.0, m2: float = 0.0):
+        """
+        Initialize the accumulator, empty by default.
+
+        Args:
+            count (int): Number of values already accumulated.
+            mean (float): Mean of the accumulated values.
+            m2 (float): Sum of squared deviations from the mean.
+        """
+        if count < 0 or m2 < 0:
+            raise ValueError(f"Invalid reference state: count={count}, m2={m2}.")
+        self._state = _core.ReferenceStats(int(count), float(mean), float(m2))
+
+    @classmethod
+    def _from_core(cls, state: Any) -> "ReferenceStats":
+        return cls(state.count, state.mean, state.m2)
+
+    def update(self, batch: Union[np.ndarray, list]) -> "ReferenceStats":
+        """
+        Fold a batch of reference embeddings into the accumulator.
+
+        Args:
+            batch (np.ndarray or list): Values of any shape, typically (n_samples, input_dim).
+                                        float64 values are accumulated at full precision;
+                                        other dtypes are converted to float32.
+
+        Returns:
+            ReferenceStats: self, for chaining.
+        """
+        batch = np.asarray(batch)
+        if batch.dtype != np.float64:
+            batch = batch.astype(np.float32, copy=False)
+        self._state.update(batch)
+        return self
+
+    def merge(self, other: "ReferenceStats") -> "ReferenceStats":
+        """
+        Combine another partial state into this one.
+
+        Returns:
+            ReferenceStats: self, for chaining.
+        """
+        self._state.merge(other._state)
+        return self
+
+    @property
+    def count(self) -> int:
+        return int(self._state.count)
+
+    @property
+    def mean(self) -> float:
+        return float(self._state.mean)
+
+    @property
+    def m2(self) -> float:
+        return float(self._state.m2)
+
+    @property
+    def variance(self) -> float:
+        """Population variance of all values seen (0.0 if fewer than two)."""
+        return float(self._state.variance())
+
+    @property
+    def ref_mean(self) -> float:
+        """Fitted reference mean (mu_ref)."""
+        return self.mean
+
+    @property
+    def ref_std(self) -> float:
+        """Fitted reference standard deviation (sigma_ref)."""
+        return float(self._state.stddev())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the partial state to a JSON-compatible dictionary."""
+        return {"count": self.count, "mean": self.mean, "m2": self.m2}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "ReferenceStats":
+        """Restore a partial state produced by `to_dict()`."""
+        return cls(count=state["count"], mean=state["mean"], m2=state["m2"])
+
+    def __repr__(self) -> str:
+        return f"ReferenceStats(count={self.count}, ref_mean={self.ref_mean:.6g}, ref_std={self.ref_std:.6g})"
+
+def merge_reference_stats(states: Iterable[Union[ReferenceStats, Dict[str, Any]]]) -> ReferenceStats:
+    """
+    Merge partial states from several workers into one.
+
+    Args:
+        states: ReferenceStats objects or their `to_dict()` serializations.
+
+    Returns:
+        ReferenceStats: A new accumulator equivalent to fitting all shards at once.
+    """
+    merged = ReferenceStats()
+    for state in states:
+        if isinstance(state, dict):
+            state = ReferenceStats.from_dict(state)
+        merged.merge(state)
+    return merged
@@ -16,7 +16,8 @@ Common Misuse:
 """
 
 import numpy as np
-from typing import Dict, Union, List
+from typing import Dict, Union, List, Optional
+from .. import _core
 
 class AgreementSensor:
     """
@@ -58,30 +59,115 @@ class AgreementSensor:
                 - 'disagreement': 1 - A [0, 2].
                 - 'agreement_consistency': Normalized score C [0, 1].
         """
-        z1 = np.array(z1, dtype=np.float32)
-        z2 = np.array(z2, dtype=np.float32)
-        
-        if z1.ndim != 1 or z2.ndim != 1:
-            raise ValueError(f"Inputs must be 1D arrays. Got shapes {z1.shape} and {z2.shape}.")
-            
-        if z1.shape != z2.shape:
-             raise ValueError(f"Input shapes must match. Got {z1.shape} and {z2.shape}.")
-             
-        # Compute Cosine Similarity
-        dot_product = np.dot(z1, z2)
-        norm1 = np.linalg.norm(z1)
-        norm2 = np.linalg.norm(z2)
-        
-        agreement = dot_product / ((norm1 * norm2) + self.epsilon)
+        # Native kernel: validation, cosine similarity and clamping in one call
+        agreement, disagreement, consistency = _core.sensors.agreement(z1, z2, self.epsilon)
         
+        return {
+            "agreement": agreement,
+            "disagreement": disagreement,
+            "agreement_consistency": consistency
+        }
+
+    def evaluate_batch(self,
+                       Z1: np.ndarray,
+                       Z2: np.ndarray,
+                       out: Optional[np.ndarray] = None,
+                       chunk_size: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Evaluate row-wise agreement for a batch of representation pairs.
+
+        Row i of the result equals `evaluate(Z1[i], Z2[i])` exactly: both cast
+        the inputs to float32 and score them with the same native kernel. Rows
+        are written directly into the output arrays, so no (N, d) temporaries
+        are created for C-contiguous float32 input.
+
+        Args:
+            Z1 (np.ndarray): First representations, shape (N, d).
+            Z2 (np.ndarray): Second representations, shape (N, d).
+            out (np.ndarray, optional): Writeable, C-contiguous float32 buffer of shape (3, N).
+                Rows receive agreement, disagreement and consistency.
+            chunk_size (int, optional): Rows processed per step. Bounds the
+                float32 conversion copy for other dtypes and lets memory-mapped
+                inputs be streamed. Defaults to the whole batch.
+
+        Returns:
+            Dict[str, np.ndarray]: 'agreement', 'disagreement' and
+            'agreement_consistency', each a float32 array of shape (N,)
+            (views into `out` when given).
+        """
+        Z1 = np.asarray(Z1)
+        Z2 = np.asarray(Z2)
+
+        if Z1.ndim != 2 or Z2.ndim != 2:
+            raise ValueError(f"Inputs must be 2D arrays (N, d). Got shapes {Z1.shape} and {Z2.shape}.")
+
+        if Z1.shape != Z2.shape:
+            raise ValueError(f"Input shapes must match. Got {Z1.shape} and {Z2.shape}.")
+
+        n = Z1.shape[0]
+        if out is None:
+            out = np.empty((3, n), dtype=np.float32)
+        elif (not isinstance(out, np.ndarray) or out.dtype != np.float32 or out.shape != (3, n)
+                or not out.flags.c_contiguous or not out.flags.writeable):
+            raise ValueError(f"Output buffer must be a writeable, C-contiguous float32 array of shape {(3, n)}.")
+
+        if chunk_size is not None and chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}.")
+        step = max(n if chunk_size is None else int(chunk_size), 1)
+
+        agreement, disagreement, consistency = out
+
+        for start in range(0, n, step):
+            stop = min(start + step, n)
+            _core.sensors.agreement_batch(
+                Z1[start:stop], Z2[start:stop], self.epsilon,
+                agreement[start:stop], disagreement[start:stop], consistency[start:stop]
+            )
+
+        return {
+            "agreement": agreement,
+            "disagreement": disagreement,
+            "agreement_consistency": consistency
+        }
+
+    def evaluate_views(self, Z: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Evaluate all-pairs agreement between K views of the same input.
+
+        Views are converted to float64 once and all pairs come from one Gram
+        product Z @ Z.T; the per-view norms are read off its diagonal, so each
+        norm is computed once instead of once per pair. For float32 views,
+        entry [i, j] matches `evaluate(Z[i], Z[j])` up to float32 rounding.
+
+        Args:
+            Z (np.ndarray): Stacked views, shape (K, d), or a batch of stacks
+                            of shape (N, K, d).
+
+        Returns:
+            Dict[str, np.ndarray]: 'agreement', 'disagreement' and
+            'agreement_consistency' matrices of shape (K, K) (or (N, K, K)),
+            float32 and symmetric.
+        """
+        Z = np.asarray(Z, dtype=np.float64)
+
+        if Z.ndim not in (2, 3):
+            raise ValueError(f"Input must be (K, d) or (N, K, d). Got shape {Z.shape}.")
+
+        # Gram matrix of raw views; its diagonal holds the squared norms
+        agreement = np.matmul(Z, np.swapaxes(Z, -1, -2))
+        norms = np.sqrt(np.diagonal(agreement, axis1=-2, axis2=-1))
+        scale = norms[..., :, np.newaxis] * norms[..., np.newaxis, :]
+        scale += self.epsilon
+        agreement /= scale
+
         # Clamp agreement to [-1, 1] to handle float precision issues
-        agreement = np.clip(agreement, -1.0, 1.0)
-        
-        disagreement = 1.0 - agreement
+        np.clip(agreement, -1.0, 1.0, out=agreement)
+
+        disagreement = np.subtract(1.0, agreement, out=scale)
         consistency = (1.0 + agreement) / 2.0
-        
+
         return {
-            "agreement": float(agreement),
-            "disagreement": float(disagreement),
-            "agreement_consistency": float(consistency)
+            "agreement": agreement.astype(np.float32),
+            "disagreement": disagreement.astype(np.float32),
+            "agreement_consistency": consistency.astype(np.float32)
         }
@@ -1,5 +1,7 @@
 import numpy as np
-from typing import Dict, Optional, Union
+from typing import Dict, Hashable, List, Optional, Sequence, Union
+
+from .. import _core
 
 class TemporalConsistencySensor:
     """
@@ -34,6 +36,7 @@ class TemporalConsistencySensor:
         self.alpha = alpha
         self.epsilon = epsilon
         self._prev_z: Optional[np.ndarray] = None
+        self._prev_norm: Optional[float] = None
         
     def update(self, z_t: Union[np.ndarray, list]) -> Dict[str, float]:
         """
@@ -51,42 +54,315 @@ class TemporalConsistencySensor:
         Note:
             For the first update (t=0), drift is 0.0 and consistency is 1.0.
         """
-        z_t = np.array(z_t, dtype=np.float32)
-        
-        if z_t.ndim != 1:
-            raise ValueError(f"Input z_t must be 1D, got shape {z_t.shape}")
-            
         if self._prev_z is None:
+            z_t = np.array(z_t, dtype=np.float32)
+
+            if z_t.ndim != 1:
+                raise ValueError(f"Input z_t must be 1D, got shape {z_t.shape}")
+
             # First time step: no history to compare against.
             # Assume perfect consistency.
-            self._prev_z = z_t.copy()
+            self._prev_z = z_t
+            self._prev_norm = _core.sensors.l2_norm(z_t)
             return {
                 "temporal_drift": 0.0,
                 "temporal_consistency": 1.0
             }
             
-        # 1. Compute Raw Temporal Deviation
-        # delta_t = ||z_t - z_{t-1}||_2
-        diff = z_t - self._prev_z
-        delta_t = np.linalg.norm(diff)
-        
-        # 2. Compute Normalized Temporal Drift Score
-        # D_t = delta_t / (||z_{t-1}||_2 + epsilon)
-        norm_prev = np.linalg.norm(self._prev_z)
-        drift_score = delta_t / (norm_prev + self.epsilon)
-        
-        # 3. Compute Temporal Consistency Score
-        # T_t = exp(-alpha * D_t)
-        consistency_score = np.exp(-self.alpha * drift_score)
-        
-        # Update state for next step
-        self._prev_z = z_t.copy()
+        # Native kernel:
+        #   D_t = ||z_t - z_{t-1}||_2 / (||z_{t-1}||_2 + epsilon)
+        #   T_t = exp(-alpha * D_t)
+        # ||z_{t-1}||_2 was computed when z_{t-1} was observed; z_t overwrites
+        # the stored z_{t-1} in place and its norm is kept for the next step.
+        drift_score, consistency_score, self._prev_norm = _core.sensors.temporal_update(
+            z_t, self._prev_z, self._prev_norm, self.alpha, self.epsilon
+        )
         
         return {
-            "temporal_drift": float(drift_score),
-            "temporal_consistency": float(consistency_score)
+            "temporal_drift": drift_score,
+            "temporal_consistency": consistency_score
+        }
+
+    def evaluate_sequence(self, Z: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Compute the drift and consistency series of whole trajectories offline.
+
+        The result equals calling `update` on each timestep of a freshly reset
+        sensor, bit for bit (both use the same native step), but runs in one
+        native call: every step's norm is computed once and reused as the
+        next step's ||z_{t-1}||. The sensor's streaming state is not touched.
+
+        Args:
+            Z (np.ndarray): Trajectory of shape (T, d), or a batch of
+                            trajectories of shape (B, T, d).
+
+        Returns:
+            Dict[str, np.ndarray]: float32 arrays of shape (T,) or (B, T):
+                - 'temporal_drift': D_t per timestep (0.0 at t=0).
+                - 'temporal_consistency': T_t per timestep (1.0 at t=0).
+        """
+        drift, consistency = _core.sensors.temporal_sequence(Z, self.alpha, self.epsilon)
+
+        return {
+            "temporal_drift": drift,
+            "temporal_consistency": consistency
         }
     
     def reset(self):
         """Clear the sensor state (forget z_{t-1})."""
         self._prev_z = None
+        self._prev_norm = None
+
+
+class MultiStreamTemporalConsistencySensor:
+    """
+    Temporal Consistency Sensor for many independent streams (e.g. tracked entities).
+
+    Applies the same specification as `TemporalConsistencySensor` to each stream,
+    but keeps z_{t-1} of every stream in one preallocated (S, d) array indexed by
+    slot, so a tick over M streams is a single vectorized step instead of M
+    Python objects and M calls.
+
+    Streams are registered on first observation. Adding and evicting a stream is
+    O(1): slots are handed out from a free list and recycled on eviction. When
+    all slots are in use, the storage doubles (amortized O(1) per stream).
+    """
+
+    def __init__(self, dim: int, capacity: int = 1024, alpha: float = 1.0, epsilon: float = 1e-6):
+        """
+        Initialize the multi-stream sensor.
+
+        Args:
+            dim (int): Representation dimension d shared by all streams.
+            capacity (int): Initial number of stream slots S.
+            alpha (float): Sensitivity parameter > 0 (see `TemporalConsistencySensor`).
+            epsilon (float): Small constant for numerical stability during normalization.
+        """
+        if alpha <= 0:
+            raise ValueError("Alpha must be positive.")
+        if dim <= 0 or capacity <= 0:
+            raise ValueError("dim and capacity must be positive integers.")
+
+        self.dim = int(dim)
+        self.alpha = alpha
+        self.epsilon = epsilon
+        self._prev_z = np.zeros((int(capacity), self.dim), dtype=np.float32)
+        self._prev_norm = np.zeros(int(capacity), dtype=np.float64)
+        self._slots: Dict[Hashable, int] = {}
+        self._free: List[int] = list(range(int(capacity) - 1, -1, -1))
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, stream_id: Hashable) -> bool:
+        return stream_id in self._slots
+
+    @property
+    def capacity(self) -> int:
+        """Number of allocated stream slots."""
+        return self._prev_z.shape[0]
+
+    def _grow(self):
+        old = self.capacity
+        new = 2 * old
+        prev_z = np.zeros((new, self.dim), dtype=np.float32)
+        prev_z[:old] = self._prev_z
+        prev_norm = np.zeros(new, dtype=np.float64)
+        prev_norm[:old] = self._prev_norm
+        self._prev_z = prev_z
+        self._prev_norm = prev_norm
+        self._free.extend(range(new - 1, old - 1, -1))
+
+    def _slot_for(self, stream_id: Hashable) -> int:
+        if not self._free:
+            self._grow()
+        slot = self._free.pop()
+        self._slots[stream_id] = slot
+        return slot
+
+    def update_many(self, ids: Sequence[Hashable], Z: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Observe one representation per stream and compute their temporal consistency.
+
+        Args:
+            ids (Sequence[Hashable]): Stream ids, unique within the call, length M.
+            Z (np.ndarray): Current representations, shape (M, d). Row i belongs to ids[i].
+
+        Returns:
+            Dict[str, np.ndarray]: float32 arrays of shape (M,):
+                - 'temporal_drift': Normalized drift D_t per stream.
+                - 'temporal_consistency': Consistency T_t per stream.
+
+        Note:
+            Streams observed for the first time report drift 0.0 and consistency 1.0.
+        """
+        Z = np.asarray(Z, dtype=np.float32)
+        if Z.ndim != 2 or Z.shape[1] != self.dim:
+            raise ValueError(f"Z must have shape (M, {self.dim}), got {Z.shape}.")
+        if len(ids) != Z.shape[0]:
+            raise ValueError(f"Got {len(ids)} ids for {Z.shape[0]} representations.")
+
+        m = Z.shape[0]
+        if len(set(ids)) != m:
+            raise ValueError("Stream ids must be unique within one update_many call.")
+
+        slots = np.empty(m, dtype=np.int64)
+        is_new = np.zeros(m, dtype=bool)
+        lookup = self._slots.get
+        for i, stream_id in enumerate(ids):
+            slot = lookup(stream_id)
+            if slot is None:
+                slot = self._slot_for(stream_id)
+                is_new[i] = True
+            slots[i] = slot
+
+        # Native kernel: same per-stream step as TemporalConsistencySensor.update,
+        # then the state rows (and their cached norms) are replaced by Z
+        drift, consistency = _core.sensors.temporal_update_slots(
+            Z, slots, is_new, self._prev_z, self._prev_norm, self.alpha, self.epsilon
+        )
+
+        return {
+            "temporal_drift": drift,
+            "temporal_consistency": consistency
+        }
+
+    def evict(self, stream_id: Hashable) -> None:
+        """Forget a stream and recycle its slot (O(1))."""
+        slot = self._slots.pop(stream_id)
+        self._free.append(slot)
+
+    def reset(self):
+        """Forget all streams (capacity is kept)."""
+        self._slots.clear()
+        self._free = list(range(self.capacity - 1, -1, -1))
+
+
+class MultiLagTemporalConsistencySensor:
+    """
+    Temporal Consistency Sensor comparing z_t against several past horizons.
+
+    Slow drift can stay below the per-step threshold of the lag-1 TCS while
+    accumulating over many steps. This sensor keeps the last k representations
+    in a preallocated ring buffer (k = max(lags, window)) and on each update
+    emits the drift against z_{t-L} for every configured lag L, plus the drift
+    against the mean of the last `window` representations:
+
+        D_t^L      = ||z_t - z_{t-L}||_2 / (||z_{t-L}||_2 + epsilon)
+        D_t^window = ||z_t - m_t||_2 / (||m_t||_2 + epsilon)
+        T_t        = exp(-alpha * D_t)
+
+    Memory is fixed at construction. Norms are cached per slot and the window
+    mean is maintained as a running float64 sum, recomputed from the ring every
+    `window` steps so rounding error does not build up on long streams. Each
+    step runs in one native call, is O(d * n_lags) (amortized) regardless of k,
+    and `update_into` writes only into preallocated buffers; `update`
+    additionally builds a result dictionary.
+    """
+
+    def __init__(self,
+                 dim: int,
+                 lags: Sequence[int] = (1, 10, 100),
+                 window: Optional[int] = None,
+                 alpha: float = 1.0,
+                 epsilon: float = 1e-6):
+        """
+        Initialize the multi-lag sensor.
+
+        Args:
+            dim (int): Representation dimension d.
+            lags (Sequence[int]): Positive lags L to compare against.
+            window (int, optional): Length of the running-mean window. Defaults to max(lags).
+            alpha (float): Sensitivity parameter > 0 (see `TemporalConsistencySensor`).
+            epsilon (float): Small constant for numerical stability during normalization.
+        """
+        if alpha <= 0:
+            raise ValueError("Alpha must be positive.")
+        if dim <= 0:
+            raise ValueError("dim must be a positive integer.")
+        if len(lags) == 0 or min(lags) <= 0:
+            raise ValueError(f"lags must be a non-empty sequence of positive integers, got {lags}.")
+
+        self.dim = int(dim)
+        self.lags = tuple(sorted(set(int(lag) for lag in lags)))
+        self.window = int(window) if window is not None else self.lags[-1]
+        if self.window <= 0:
+            raise ValueError(f"window must be positive, got {window}.")
+        self.alpha = alpha
+        self.epsilon = epsilon
+
+        self.history = max(self.lags[-1], self.window)
+        self._ring = np.zeros((self.history, self.dim), dtype=np.float32)
+        self._ring_norm = np.zeros(self.history, dtype=np.float64)
+        self._window_sum = np.zeros(self.dim, dtype=np.float64)
+        self._head = 0   # slot that receives the next z_t
+        self._count = 0  # number of representations observed
+
+        self._lag_array = np.array(self.lags, dtype=np.int64)
+        self._scores = np.empty((2, len(self.lags) + 1), dtype=np.float64)
+
+        self._keys = [(f"temporal_drift_lag_{lag}", f"temporal_consistency_lag_{lag}") for lag in self.lags]
+        self._keys.append(("temporal_drift_window", "temporal_consistency_window"))
+
+    def update(self, z_t: Union[np.ndarray, list]) -> Dict[str, float]:
+        """
+        Observe z_t and compute drift against every configured lag and the window mean.
+
+        Args:
+            z_t (np.ndarray or list): Current representation vector (1D, length d).
+
+        Returns:
+            Dict[str, float]: for each lag L, 'temporal_drift_lag_L' and
+            'temporal_consistency_lag_L', plus 'temporal_drift_window' and
+            'temporal_consistency_window'.
+
+        Note:
+            Until L representations have been observed, the lag-L drift is 0.0 and
+            its consistency 1.0 (likewise for the window before the first step).
+        """
+        drifts, consistencies = self.update_into(z_t, self._scores)
+        result = {}
+        for (drift_key, consistency_key), drift, consistency in zip(self._keys, drifts, consistencies):
+            result[drift_key] = float(drift)
+            result[consistency_key] = float(consistency)
+        return result
+
+    def update_into(self, z_t: Union[np.ndarray, list], out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Same as `update`, but writes the scores into an array instead of a dictionary.
+
+        Args:
+            z_t (np.ndarray or list): Current representation vector (1D, length d).
+            out (np.ndarray, optional): float64 buffer of shape (2, n_lags + 1).
+                Row 0 receives the drifts, row 1 the consistencies; columns follow
+                `lags`, then the window. Defaults to an internal buffer that the
+                next update overwrites.
+
+        Returns:
+            np.ndarray: `out`.
+        """
+        z_t = np.asarray(z_t, dtype=np.float32)
+
+        if z_t.shape != (self.dim,):
+            raise ValueError(f"Input z_t must have shape ({self.dim},), got {z_t.shape}")
+        if out is None:
+            out = self._scores
+        elif (not isinstance(out, np.ndarray) or out.dtype != np.float64 or out.shape != self._scores.shape
+                or not out.flags.c_contiguous or not out.flags.writeable):
+            raise ValueError(f"Output buffer must be a writeable, C-contiguous float64 array of shape {self._scores.shape}.")
+
+        # Native kernel: all lags and the window, then the ring and window sum advance
+        _core.sensors.temporal_multi_lag(
+            z_t, self._ring, self._ring_norm, self._head, self._count, self._lag_array,
+            self._window_sum, self.window, self.alpha, self.epsilon, out
+        )
+        self._head = (self._head + 1) % self.history
+        self._count += 1
+
+        return out
+
+    def reset(self):
+        """Clear the history (buffers are kept)."""
+        self._window_sum.fill(0.0)
+        self._head = 0
+        self._count = 0
@@ -0,0 +1,224 @@
+"""
+Out-of-core scoring of embedding files.
+
+Inputs are memory-mapped read-only and processed in row blocks; gated outputs
+and per-sample gate/discrepancy columns are written straight into
+memory-mapped `.npy` files. Only one block is touched at a time, so the page
+cache, not process memory, bounds the working set. A progress file written
+after every flushed block lets an interrupted run resume where it stopped.
+"""
+import dataclasses
+import json
+import os
+import zipfile
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from .diagnostics import ResLikDiagnostics, SummaryStats
+from .wrapper import native_out_dtype
+
+OUTPUTS_FILE = "outputs.npy"
+GATES_FILE = "gate_values.npy"
+DISCREPANCIES_FILE = "discrepancy_values.npy"
+PROGRESS_FILE = "progress.json"
+
+
+def open_embeddings(path: str, key: Optional[str] = None) -> np.ndarray:
+    """
+    Memory-map a 2D embedding matrix from a `.npy` file or an uncompressed `.npz` member.
+
+    Args:
+        path (str): `.npy` or `.npz` file.
+        key (str, optional): Array name inside a `.npz` archive. Defaults to its
+                             only member.
+
+    Returns:
+        np.ndarray: Read-only memory map of the array.
+    """
+    if not zipfile.is_zipfile(path):
+        array = np.load(path, mmap_mode="r")
+    else:
+        array = _map_npz_member(path, key)
+
+    if array.ndim != 2:
+        raise ValueError(f"Embedding file must hold a 2D array, got shape {array.shape}.")
+    return array
+
+
+def _map_npz_member(path: str, key: Optional[str]) -> np.ndarray:
+    """Map an uncompressed (`np.savez`) archive member in place; members are plain `.npy` data."""
+    with zipfile.ZipFile(path) as archive:
+        names = [n[:-len(".npy")] for n in archive.namelist() if n.endswith(".npy")]
+        if key is None:
+            if len(names) != 1:
+                raise ValueError(f"Archive holds arrays {names}; pass `key` to choose one.")
+            key = names[0]
+        if key not in names:
+            raise KeyError(f"Array '{key}' not found in {path}. Available: {names}.")
+        info = archive.getinfo(key + ".npy")
+
+    if info.compress_type != zipfile.ZIP_STORED:
+        raise ValueError(
+            f"Array '{key}' in {path} is compressed (np.savez_compressed) and cannot be "
+            "memory-mapped. Save it with np.save or np.savez instead."
+        )
+
+    with open(path, "rb") as f:
+        # Local file header: 30 fixed bytes, then the file name and extra field
+        f.seek(info.header_offset + 26)
+        name_len, extra_len = np.frombuffer(f.read(4), dtype="<u2")
+        f.seek(info.header_offset + 30 + int(name_len) + int(extra_len))
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape,
+                     order="F" if fortran_order else "C")
+
+
+def score_file(unit: Any,
+               input_path: str,
+               output_dir: str,
+               block_rows: int = 16384,
+               key: Optional[str] = None,
+               ref_mean: Optional[float] = None,
+               ref_std: Optional[float] = None,
+               gating_lambda: float = 1.0,
+               gating_tau: float = 0.05,
+               out_dtype: Optional[Any] = None,
+               resume: bool = True) -> ResLikDiagnostics:
+    """
+    Score an embedding file that may not fit in memory.
+
+    Writes `outputs.npy` (n_samples, latent_dim), `gate_values.npy` and
+    `discrepancy_values.npy` (n_samples,) into `output_dir`, one block of rows
+    at a time. After each block is flushed, `progress.json` records the next
+    row and the running aggregates. With `resume=True`, a run with the same
+    input (path, size and modification time) and parameters continues from the
+    last finished block.
+
+    Args:
+        unit (ResLikUnit): Unit to apply.
+        input_path (str): `.npy` file or uncompressed `.npz` archive with a
+                          (n_samples, input_dim) matrix.
+        output_dir (str): Directory for the output files (created if missing).
+        block_rows (int): Rows per block. Peak memory is about one block of
+                          input and output.
+        key (str, optional): Array name inside a `.npz` archive.
+        ref_mean, ref_std, gating_lambda, gating_tau, out_dtype: As in `ResLikUnit.__call__`.
+        resume (bool): Continue a previous run found in `output_dir`. If False,
+                       existing outputs are overwritten.
+
+    Returns:
+        ResLikDiagnostics: Aggregates over the whole file, with the gate and
+                           discrepancy columns as read-only memory maps.
+    """
+    if block_rows <= 0:
+        raise ValueError(f"block_rows must be positive, got {block_rows}.")
+
+    embeddings = open_embeddings(input_path, key)
+    n_samples = embeddings.shape[0]
+    if n_samples == 0:
+        raise ValueError("Input array is empty. See docs/failure_modes.md.")
+    if embeddings.shape[1] != unit.input_dim:
+        raise ValueError(
+            f"Input feature dimension {embeddings.shape[1]} does not match initialized dimension {unit.input_dim}."
+        )
+
+    ref_mean, ref_std = unit.resolve_reference(ref_mean, ref_std)
+    out_dtype = native_out_dtype(np.float32 if out_dtype is None else out_dtype)
+    # Size and modification time tell a replaced input of the same shape apart
+    input_stat = os.stat(input_path)
+    run = {
+        "input_path": os.path.abspath(input_path),
+        "input_size": input_stat.st_size,
+        "input_mtime_ns": input_stat.st_mtime_ns,
+        "key": key,
+        "shape": [n_samples, unit.input_dim],
+        "latent_dim": unit.latent_dim,
+        "ref_mean": float(ref_mean),
+        "ref_std": float(ref_std),
+        "gating_lambda": float(gating_lambda),
+        "gating_tau": float(gating_tau),
+        "out_dtype": out_dtype.str
+    }
+
+    os.makedirs(output_dir, exist_ok=True)
+    paths = {name: os.path.join(output_dir, name)
+             for name in (OUTPUTS_FILE, GATES_FILE, DISCREPANCIES_FILE, PROGRESS_FILE)}
+
+    progress = _load_progress(paths[PROGRESS_FILE]) if resume else None
+    if progress is not None and progress["run"] != run:
+        raise ValueError(
+            f"{paths[PROGRESS_FILE]} belongs to a run with different input or parameters. "
+            "Use another output_dir or pass resume=False to overwrite it."
+        )
+
+    if progress is None:
+        # A stale record must not point into outputs that are about to be overwritten
+        if os.path.exists(paths[PROGRESS_FILE]):
+            os.remove(paths[PROGRESS_FILE])
+        mode = "w+"
+        next_row = 0
+        gate_stats, discrepancy_stats = SummaryStats(), SummaryStats()
+    else:
+        mode = "r+"
+        next_row = progress["next_row"]
+        gate_stats = SummaryStats(**progress["gate_stats"])
+        discrepancy_stats = SummaryStats(**progress["discrepancy_stats"])
+
+    outputs = np.lib.format.open_memmap(paths[OUTPUTS_FILE], mode=mode, dtype=out_dtype,
+                                        shape=(n_samples, unit.latent_dim))
+    gates = np.lib.format.open_memmap(paths[GATES_FILE], mode=mode, dtype=np.float32, shape=(n_samples,))
+    discrepancies = np.lib.format.open_memmap(paths[DISCREPANCIES_FILE], mode=mode,
+                                              dtype=np.float32, shape=(n_samples,))
+
+    for start in range(next_row, n_samples, block_rows):
+        stop = min(start + block_rows, n_samples)
+        # The kernel reads the mapped block in place and writes into the mapped output
+        _, diagnostics = unit(embeddings[start:stop], ref_mean=ref_mean, ref_std=ref_std,
+                              gating_lambda=gating_lambda, gating_tau=gating_tau,
+                              out=outputs[start:stop])
+        gates[start:stop] = diagnostics.gate_values
+        discrepancies[start:stop] = diagnostics.discrepancy_values
+        gate_stats = gate_stats.merge(diagnostics.gate_stats)
+        discrepancy_stats = discrepancy_stats.merge(diagnostics.discrepancy_stats)
+
+        # Outputs reach disk before the progress record that points past them
+        for mapped in (outputs, gates, discrepancies):
+            mapped.flush()
+        _save_progress(paths[PROGRESS_FILE], {
+            "run": run,
+            "next_row": stop,
+            "gate_stats": dataclasses.asdict(gate_stats),
+            "discrepancy_stats": dataclasses.asdict(discrepancy_stats)
+        })
+
+    del outputs, gates, discrepancies
+    return ResLikDiagnostics(
+        mean_gate_value=gate_stats.mean,
+        max_discrepancy=discrepancy_stats.max if discrepancy_stats.count else 0.0,
+        gate_values=np.load(paths[GATES_FILE], mmap_mode="r"),
+        discrepancy_values=np.load(paths[DISCREPANCIES_FILE], mmap_mode="r"),
+        gate_stats=gate_stats,
+        discrepancy_stats=discrepancy_stats
+    )
+
+
+def _load_progress(path: str) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def _save_progress(path: str, progress: Dict[str, Any]) -> None:
+    """Write atomically so an interruption never leaves a truncated record."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(progress, f)
+    os.replace(tmp_path, path)
@@ -1,8 +1,39 @@
 import numpy as np
-from typing import Tuple, Dict, Any, Optional, Union
-import warnings
+from typing import Tuple, Dict, Any, Iterable, Iterator, Optional, Union
 from . import _core
-from .diagnostics import ResLikDiagnostics, wrap_diagnostics
+from .diagnostics import ResLikDiagnostics, SummaryStats, wrap_diagnostics
+from .reference import ReferenceStats
+from .interop import import_array, export_array
+
+# Element types the C++ core reads and writes natively (no whole-array conversion)
+NATIVE_DTYPES = (np.dtype(np.float32), np.dtype(np.float64), np.dtype(np.float16))
+
+def native_out_dtype(out_dtype: Any) -> np.dtype:
+    """Validate an output dtype against NATIVE_DTYPES and return it as np.dtype."""
+    out_dtype = np.dtype(out_dtype)
+    if out_dtype not in NATIVE_DTYPES:
+        raise ValueError(f"out_dtype must be float32, float64 or float16, got {out_dtype}.")
+    return out_dtype
+
+def _csr_parts(obj: Any) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, Tuple[int, int]]]:
+    """
+    (data, indices, indptr, shape) of a CSR matrix, or None for anything else.
+
+    Duck-typed so scipy.sparse CSR matrices/arrays and plain containers with
+    `data`, `indices`, `indptr` and `shape` all qualify. Non-canonical scipy
+    matrices (unsorted or duplicate column indices) are canonicalized on a copy.
+    """
+    if isinstance(obj, np.ndarray) or getattr(obj, "format", "csr") != "csr":
+        return None
+    if not all(hasattr(obj, name) for name in ("data", "indices", "indptr", "shape")):
+        return None
+    if getattr(obj, "has_canonical_format", True) is False:
+        obj = obj.copy()
+        obj.sum_duplicates()
+    shape = tuple(int(n) for n in obj.shape)
+    if len(shape) != 2:
+        raise ValueError(f"Sparse input must be 2D, got shape {shape}.")
+    return np.asarray(obj.data), np.asarray(obj.indices), np.asarray(obj.indptr), shape
 
 class ResLikUnit:
     """
@@ -14,60 +45,91 @@ class ResLikUnit:
     It wraps the optimized C++ implementation.
     """
     
-    def __init__(self, input_dim: int, latent_dim: int = 64):
+    def __init__(self, input_dim: int, latent_dim: int = 64, n_threads: int = 1):
         """
         Initialize the ResLik Unit.
         
         Args:
             input_dim (int): Dimension of the input feature embeddings.
             latent_dim (int): Dimension of the internal projection layer.
+            n_threads (int): Worker threads used by the C++ core for batches.
+                             1 runs serially (default), 0 uses all hardware threads.
+                             Outputs are identical for every setting. Can be changed
+                             later through the `n_threads` attribute.
         """
         if input_dim <= 0 or latent_dim <= 0:
             raise ValueError("Dimensions must be positive integers.")
+        if n_threads < 0:
+            raise ValueError("n_threads must be >= 0 (0 = use all hardware threads).")
             
         self.input_dim = int(input_dim)
         self.latent_dim = int(latent_dim)
+        self.n_threads = int(n_threads)
         self._cpp_unit = _core.ResLikUnit(self.input_dim, self.latent_dim)
         
+    def __reduce__(self):
+        # The C++ object cannot be pickled; weights are deterministic given the
+        # dimensions, so dimensions plus the fitted reference state rebuild it.
+        return (_rebuild_unit, (self.input_dim, self.latent_dim, self.n_threads,
+                                self.reference_stats.to_dict()))
+
     def __call__(self, 
                  z_in: Union[np.ndarray, Any], 
-                 ref_mean: float = 0.0, 
-                 ref_std: float = 1.0, 
+                 ref_mean: Optional[float] = None, 
+                 ref_std: Optional[float] = None, 
                  gating_lambda: float = 1.0,
-                 gating_tau: float = 0.05) -> Tuple[np.ndarray, ResLikDiagnostics]:
+                 gating_tau: float = 0.05,
+                 out: Optional[np.ndarray] = None,
+                 out_dtype: Optional[Any] = None) -> Tuple[np.ndarray, ResLikDiagnostics]:
         """
         Apply ResLik gating to the input embeddings.
         
         Args:
             z_in (Union[np.ndarray, torch.Tensor]): Input feature matrix of shape (n_samples, input_dim) 
-                               or vector of shape (input_dim,).
-            ref_mean (float): Reference mean for the current feature set. 
+                               or vector of shape (input_dim,). float32, float64 and
+                               float16 inputs are processed natively; other dtypes
+                               are converted to float32. Tensors implementing
+                               `__dlpack__` are read in place when in CPU memory.
+            ref_mean (float, optional): Reference mean for the current feature set. 
                               (Currently shared scalar for Phase 2).
-            ref_std (float): Reference standard deviation. Must be > 0.
+                              Defaults to the mean fitted with `update_stats`, or 0.0.
+            ref_std (float, optional): Reference standard deviation. Must be > 0.
+                              Defaults to the std fitted with `update_stats`, or 1.0.
             gating_lambda (float): Sensitivity of the gating mechanism. Higher values
                                    mean stricter filtering of outliers.
             gating_tau (float): Dead-zone threshold. Discrepancy scores below this
                                 value are ignored (gate = 1.0). Helps preserve clean data.
+            out (np.ndarray, optional): Preallocated C-contiguous buffer of shape
+                                (n_samples, latent_dim) or (latent_dim,), dtype float32,
+                                float64 or float16. If given, the C++ core writes the
+                                gated output into it directly and it is returned as the
+                                output array.
+            out_dtype (dtype, optional): Output dtype (float32, float64 or float16) when
+                                `out` is not given. Defaults to float32. float16 halves
+                                the memory of the (n_samples, latent_dim) result. The
+                                projection runs in float32, so float64 adds no precision.
                                    
         Returns:
             Tuple[np.ndarray, ResLikDiagnostics]: 
-                - Gated output embeddings (n_samples, latent_dim) as NumPy array.
+                - Gated output embeddings (n_samples, latent_dim). A NumPy array, or a
+                  tensor of the input's framework (via DLPack) when a tensor was passed
+                  and `out` was not given.
                 - Structured diagnostics object.
         """
-        # Interop: Check for PyTorch Tensor
-        if hasattr(z_in, 'cpu') and hasattr(z_in, 'detach') and hasattr(z_in, 'numpy'):
-            # It looks like a PyTorch tensor
-            if z_in.requires_grad:
-                warnings.warn(
-                    "ResLik received a tensor with requires_grad=True. "
-                    "Gradients will NOT flow through ResLik (it is a C++ inference op). "
-                    "Detaching tensor implicitly.",
-                    UserWarning
-                )
-            z_in = z_in.detach().cpu().numpy()
+        # Sparse CSR input (scipy.sparse, anndata X, ...): cost scales with the nonzeros
+        csr = _csr_parts(z_in)
+        if csr is not None:
+            return self._forward_csr(csr, ref_mean, ref_std, gating_lambda, gating_tau, out, out_dtype)
+
+        # Interop: DLPack-capable tensors (PyTorch, JAX, ...) are viewed without a copy
+        z_in, export = import_array(z_in)
 
         # Input Validation
-        z_in = np.asarray(z_in, dtype=np.float32)
+        # No copy when the input is already C-contiguous in a native dtype; otherwise one converting pass.
+        z_in = np.asarray(z_in)
+        if z_in.dtype not in NATIVE_DTYPES:
+            z_in = z_in.astype(np.float32)
+        z_in = np.asarray(z_in, order="C")
         
         if z_in.size == 0:
             raise ValueError("Input array is empty. See docs/failure_modes.md.")
@@ -86,76 +148,284 @@ class ResLikUnit:
                 "Ensure your encoder output matches ResLik configuration."
             )
             
-        if not np.all(np.isfinite(z_in)):
+        params = self._gating_params(ref_mean, ref_std, gating_lambda, gating_tau)
+
+        if out_dtype is not None:
+            out_dtype = native_out_dtype(out_dtype)
+
+        if out is not None:
+            expected_shape = (z_in.shape[0], self.latent_dim) if is_batch else (self.latent_dim,)
+            if (not isinstance(out, np.ndarray) or out.dtype not in NATIVE_DTYPES
+                    or not out.flags.c_contiguous or not out.flags.writeable):
+                raise ValueError(
+                    "Output buffer must be a writeable, C-contiguous float32, float64 or float16 NumPy array."
+                )
+            if out.shape != expected_shape:
+                raise ValueError(f"Output buffer shape {out.shape} does not match expected {expected_shape}.")
+            if out_dtype is not None and out.dtype != out_dtype:
+                raise ValueError(f"Output buffer dtype {out.dtype} does not match out_dtype {out_dtype}.")
+
+        # Process Batch (single native call; C++ loops over rows with the GIL released)
+        # The input buffer is read in place when it is already C-contiguous float32.
+        out_2d = None if out is None else out.reshape(z_in.shape[0], self.latent_dim)
+        # Finiteness is checked inside the kernel while each row is read (no extra pass).
+        # Gate/discrepancy aggregates are accumulated by the kernel as rows are processed.
+        summary = _core.BatchSummary()
+        try:
+            outputs, gates, discrepancies = self._cpp_unit.forward_batch(
+                z_in, out=out_2d, n_threads=self.n_threads, params=params, out_dtype=out_dtype,
+                summary=summary
+            )
+        except _core.NonFiniteInputError as e:
             raise ValueError(
-                "Input contains NaNs or Infinities. ResLik requires clean, finite embeddings. "
+                f"Input contains NaNs or Infinities (first at row {e.row}). "
+                "ResLik requires clean, finite embeddings. "
                 "See docs/failure_modes.md for details on numerical stability."
+            ) from e
+
+        # Enforce Latent Dimensionality (RLCS Invariant)
+        if outputs.shape != (z_in.shape[0], self.latent_dim):
+            raise RuntimeError(
+                f"ResLik integrity violation: C++ core returned shape {outputs.shape}, "
+                f"expected {(z_in.shape[0], self.latent_dim)}. This implies a corrupted unit state."
+            )
+
+        if out is not None:
+            # Hand back the caller's own buffer (original shape), not a view of it
+            outputs = out
+        else:
+            if not is_batch:
+                outputs = outputs[0]
+            outputs = export_array(outputs, export)
+
+        gate_stats = SummaryStats._from_core(summary.gate)
+        discrepancy_stats = SummaryStats._from_core(summary.discrepancy)
+
+        if not is_batch:
+            diagnostics_obj = wrap_diagnostics({
+                "mean_gate": float(gates[0]),
+                "max_discrepancy": float(discrepancies[0]),
+                "gate_stats": gate_stats,
+                "discrepancy_stats": discrepancy_stats
+            })
+        else:
+            # Columnar per-sample diagnostics; aggregates come from the kernel (O(1) here)
+            diagnostics_obj = ResLikDiagnostics.from_arrays(
+                gates, discrepancies, gate_stats=gate_stats, discrepancy_stats=discrepancy_stats
             )
             
+        return outputs, diagnostics_obj
+
+    def stream(self,
+               chunks: Iterable[Union[np.ndarray, Any]],
+               ref_mean: Optional[float] = None,
+               ref_std: Optional[float] = None,
+               gating_lambda: float = 1.0,
+               gating_tau: float = 0.05,
+               out_dtype: Optional[Any] = None) -> "ResLikStream":
+        """
+        Apply ResLik gating to an iterable of chunks with bounded memory.
+
+        Chunks are pulled lazily, so peak memory depends on the chunk size, not
+        on the dataset size (e.g. chunks read from a memory-mapped file or a
+        database cursor). Reference statistics are resolved once, when the
+        stream is created, so every chunk is gated with the same parameters.
+
+        Args:
+            chunks (Iterable): Arrays or tensors of shape (n_i, input_dim).
+            ref_mean, ref_std, gating_lambda, gating_tau, out_dtype: As in `__call__`.
+
+        Returns:
+            ResLikStream: Iterator yielding `(outputs, diagnostics)` per chunk.
+                          Its `summary` holds the running aggregates over all
+                          chunks processed so far.
+        """
+        ref_mean, ref_std = self.resolve_reference(ref_mean, ref_std)
+        return ResLikStream(self, chunks, dict(
+            ref_mean=ref_mean, ref_std=ref_std, gating_lambda=gating_lambda,
+            gating_tau=gating_tau, out_dtype=out_dtype
+        ))
+
+    def _forward_csr(self, csr: Tuple[np.ndarray, np.ndarray, np.ndarray, Tuple[int, int]],
+                     ref_mean: Optional[float], ref_std: Optional[float],
+                     gating_lambda: float, gating_tau: float,
+                     out: Optional[np.ndarray], out_dtype: Optional[Any]) -> Tuple[np.ndarray, ResLikDiagnostics]:
+        """Sparse path of `__call__`: a CSR batch (data, indices, indptr, shape)."""
+        data, indices, indptr, shape = csr
+        if len(indptr) != shape[0] + 1:
+            raise ValueError(f"indptr has length {len(indptr)}, expected {shape[0] + 1} for shape {shape}.")
+        if shape[0] == 0:
+            raise ValueError("Input array is empty. See docs/failure_modes.md.")
+        if shape[1] != self.input_dim:
+            raise ValueError(
+                f"Input feature dimension {shape[1]} does not match initialized dimension {self.input_dim}. "
+                "Ensure your encoder output matches ResLik configuration."
+            )
+        if out_dtype is not None and np.dtype(out_dtype) != np.float32:
+            raise ValueError(f"Sparse input produces float32 output, got out_dtype {np.dtype(out_dtype)}.")
+        if out is not None and (not isinstance(out, np.ndarray) or out.dtype != np.float32
+                                or not out.flags.c_contiguous or out.shape != (shape[0], self.latent_dim)):
+            raise ValueError(
+                f"Output buffer for sparse input must be a C-contiguous float32 array of shape "
+                f"{(shape[0], self.latent_dim)}."
+            )
+
+        params = self._gating_params(ref_mean, ref_std, gating_lambda, gating_tau)
+        summary = _core.BatchSummary()
+        try:
+            outputs, gates, discrepancies = self._cpp_unit.forward_csr(
+                data, indices, indptr, params, out=out, n_threads=self.n_threads, summary=summary
+            )
+        except _core.NonFiniteInputError as e:
+            raise ValueError(
+                f"Input contains NaNs or Infinities (first at row {e.row}). "
+                "ResLik requires clean, finite embeddings. "
+                "See docs/failure_modes.md for details on numerical stability."
+            ) from e
+
+        return outputs, ResLikDiagnostics.from_arrays(
+            gates, discrepancies,
+            gate_stats=SummaryStats._from_core(summary.gate),
+            discrepancy_stats=SummaryStats._from_core(summary.discrepancy)
+        )
+
+    def _gating_params(self, ref_mean: Optional[float], ref_std: Optional[float],
+                       gating_lambda: float, gating_tau: float) -> Any:
+        """Validated per-call parameters (the shared C++ unit is never mutated)."""
+        ref_mean, ref_std = self.resolve_reference(ref_mean, ref_std)
+
         if ref_std <= 0:
             raise ValueError(
                 f"Reference standard deviation must be positive, got {ref_std}. "
                 "Invalid reference statistics will cause gating failure."
             )
 
-        # Set Unit State
-        self._cpp_unit.set_reference_stats(ref_mean, ref_std)
-        self._cpp_unit.set_lambda(gating_lambda)
-        self._cpp_unit.set_tau(gating_tau)
-        
-        # Process Batch (Looping in Python for Phase 2/3 simplicity, C++ handles single vector)
-        # Future optimization: Move batch loop to C++
-        outputs = []
-        diagnostics_list = []
-        
-        for i in range(z_in.shape[0]):
-            sample = z_in[i]
-            out_vec = self._cpp_unit.forward(sample)
-            
-            # Enforce Latent Dimensionality (RLCS Invariant)
-            if len(out_vec) != self.latent_dim:
-                raise RuntimeError(
-                    f"ResLik integrity violation: C++ core returned dimension {len(out_vec)}, "
-                    f"expected {self.latent_dim}. This implies a corrupted unit state."
-                )
-            
-            diag = self._cpp_unit.get_diagnostics()
-            
-            outputs.append(out_vec)
-            diagnostics_list.append({
-                "mean_gate": diag.mean_gate_value,
-                "max_discrepancy": diag.max_discrepancy
-            })
-            
-        if not outputs:
-             # Preserve latent dimension even for empty batches
-             outputs = np.zeros((0, self.latent_dim), dtype=np.float32)
-        else:
-             outputs = np.array(outputs, dtype=np.float32)
-        
-        if not is_batch:
-            outputs = outputs[0]
-            # In single-sample mode, diagnostics_list must have exactly 1 item if z_in check passed.
-            # We assume index 0 exists.
-            diagnostics_obj = wrap_diagnostics(diagnostics_list[0])
-        else:
-            # Aggregate diagnostics for batch
-            if not diagnostics_list:
-                # Handle empty batch case (though input validation should prevent it)
-                mean_gate = 0.0
-                max_disc = 0.0
-            else:
-                # Explicit float conversion enforces scalar contract and handles mocks if capable
-                mean_gate = float(np.mean([float(d["mean_gate"]) for d in diagnostics_list]))
-                max_disc = float(np.max([float(d["max_discrepancy"]) for d in diagnostics_list]))
-
-            agg_dict = {
-                "mean_gate": mean_gate,
-                "max_discrepancy": max_disc,
-                "per_sample": diagnostics_list
-            }
-            diagnostics_obj = wrap_diagnostics(agg_dict)
-            
-        return outputs, diagnostics_obj
-            
-        return outputs, diagnostics_obj
\ No newline at end of file
+        # Per-call parameters: the shared C++ unit is never mutated, so one
+        # ResLikUnit can be used from several threads concurrently.
+        return _core.GatingParams(
+            mu_ref=ref_mean, sigma_ref=ref_std, lambda_=gating_lambda, tau=gating_tau
+        )
+
+    def resolve_reference(self, ref_mean: Optional[float] = None,
+                          ref_std: Optional[float] = None) -> Tuple[float, float]:
+        """
+        Reference statistics a call with these arguments would use.
+
+        Missing values come from the fit (`update_stats`), or 0.0 / 1.0 if nothing
+        was fitted. Useful to pin the reference once for many calls or workers.
+
+        Returns:
+            Tuple[float, float]: (ref_mean, ref_std).
+        """
+        if ref_mean is None or ref_std is None:
+            fitted = self._cpp_unit.reference_stats()
+            has_fit = fitted.count >= 2
+            if ref_mean is None:
+                ref_mean = fitted.mean if has_fit else 0.0
+            if ref_std is None:
+                ref_std = fitted.stddev() if has_fit else 1.0
+        return ref_mean, ref_std
+
+    def update_stats(self, batch: Union[np.ndarray, Any]) -> "ResLikUnit":
+        """
+        Fold a batch of reference embeddings into the unit's reference statistics.
+
+        Single pass with O(1) memory, so a reference atlas can be streamed
+        through in chunks of any size. Once fitted, calls that omit `ref_mean`
+        or `ref_std` use the fitted values.
+
+        Args:
+            batch (np.ndarray): Reference embeddings of shape (n_samples, input_dim)
+                                or (input_dim,). float64 values are accumulated at
+                                full precision; other dtypes are converted to float32.
+
+        Returns:
+            ResLikUnit: self, for chaining.
+        """
+        batch, _ = import_array(batch)
+        batch = np.asarray(batch)
+        if batch.dtype != np.float64:
+            batch = batch.astype(np.float32, copy=False)
+        if batch.ndim == 1:
+            batch = batch[np.newaxis, :]
+        if batch.ndim != 2 or batch.shape[1] != self.input_dim:
+            raise ValueError(
+                f"Reference batch must have shape (n_samples, {self.input_dim}), got {batch.shape}."
+            )
+        self._cpp_unit.update_stats(batch)
+        return self
+
+    @property
+    def reference_stats(self) -> ReferenceStats:
+        """Copy of the running reference statistics fitted with `update_stats`."""
+        return ReferenceStats._from_core(self._cpp_unit.reference_stats())
+
+    def load_reference_stats(self, stats: ReferenceStats) -> None:
+        """
+        Replace the unit's reference statistics, e.g. with a state merged from
+        several workers via `reslik.reference.merge_reference_stats`.
+        """
+        self._cpp_unit.load_reference_stats(stats._state)
+
+    def reset_stats(self) -> None:
+        """Discard the fitted reference statistics (defaults revert to 0.0 / 1.0)."""
+        self._cpp_unit.reset_stats()
+
+
+def _rebuild_unit(input_dim: int, latent_dim: int, n_threads: int, reference_state: Dict[str, Any]) -> ResLikUnit:
+    """Unpickle a ResLikUnit (see `ResLikUnit.__reduce__`)."""
+    unit = ResLikUnit(input_dim, latent_dim, n_threads=n_threads)
+    unit.load_reference_stats(ReferenceStats.from_dict(reference_state))
+    return unit
+
+class ResLikStream:
+    """
+    Iterator over `(outputs, diagnostics)` for each chunk passed to `ResLikUnit.stream`.
+
+    Only the current chunk and its results are held. Gate and discrepancy
+    aggregates are merged as chunks are processed, so `summary` matches the
+    aggregates of a single full-batch call over the concatenated chunks (up to
+    floating-point summation order) without keeping per-sample values.
+    """
+
+    def __init__(self, unit: ResLikUnit, chunks: Iterable[Union[np.ndarray, Any]], call_kwargs: Dict[str, Any]):
+        self._unit = unit
+        self._chunks = iter(chunks)
+        self._call_kwargs = call_kwargs
+        self.n_chunks = 0
+        self.gate_stats = SummaryStats()
+        self.discrepancy_stats = SummaryStats()
+
+    def __iter__(self) -> Iterator[Tuple[np.ndarray, ResLikDiagnostics]]:
+        return self
+
+    def __next__(self) -> Tuple[np.ndarray, ResLikDiagnostics]:
+        chunk = next(self._chunks)
+        outputs, diagnostics = self._unit(chunk, **self._call_kwargs)
+
+        self.n_chunks += 1
+        self.gate_stats = self.gate_stats.merge(diagnostics.gate_stats)
+        self.discrepancy_stats = self.discrepancy_stats.merge(diagnostics.discrepancy_stats)
+        return outputs, diagnostics
+
+    @property
+    def n_samples(self) -> int:
+        """Number of samples processed so far."""
+        return self.gate_stats.count
+
+    @property
+    def summary(self) -> ResLikDiagnostics:
+        """Aggregate diagnostics over all chunks processed so far (no per-sample columns)."""
+        stats = self.discrepancy_stats
+        return ResLikDiagnostics(
+            mean_gate_value=self.gate_stats.mean,
+            max_discrepancy=stats.max if stats.count else 0.0,
+            gate_stats=self.gate_stats,
+            discrepancy_stats=stats
+        )
+
+    def run(self) -> ResLikDiagnostics:
+        """Consume the remaining chunks, discarding outputs, and return `summary`."""
+        for _ in self:
+            pass
+        return self.summary
@@ -67,5 +67,45 @@ class TestAgreementSensor(unittest.TestCase):
         
         self.assertAlmostEqual(metrics_small['agreement'], metrics_large['agreement'], places=5)
 
+    def test_batch_matches_single_evaluation(self):
+        """Batched evaluation equals per-pair evaluate(), with and without chunking"""
+        rng = np.random.default_rng(0)
+        Z1 = rng.standard_normal((50, 8))
+        Z2 = Z1 + 0.5 * rng.standard_normal((50, 8))
+        Z2[3] = -Z1[3]
+
+        batch = self.sensor.evaluate_batch(Z1, Z2)
+        out = np.empty((3, 50), dtype=np.float32)
+        chunked = self.sensor.evaluate_batch(Z1, Z2, out=out, chunk_size=7)
+        self.assertTrue(np.shares_memory(chunked["agreement"], out))
+
+        for key in ("agreement", "disagreement", "agreement_consistency"):
+            np.testing.assert_array_equal(batch[key], chunked[key])
+            single = [self.sensor.evaluate(a, b)[key] for a, b in zip(Z1, Z2)]
+            np.testing.assert_array_equal(batch[key], np.float32(single))
+
+        with self.assertRaises(ValueError):
+            self.sensor.evaluate_batch(Z1, Z2[:10])
+
+    def test_multi_view_matrices_match_pairwise(self):
+        """K-view agreement matrices equal pairwise evaluate() for (K, d) and (N, K, d)"""
+        rng = np.random.default_rng(1)
+        views = rng.standard_normal((3, 4, 16)).astype(np.float32)
+
+        batched = self.sensor.evaluate_views(views)
+        self.assertEqual(batched["agreement"].shape, (3, 4, 4))
+
+        for n in range(3):
+            single = self.sensor.evaluate_views(views[n])
+            np.testing.assert_allclose(single["agreement"], batched["agreement"][n], atol=1e-6)
+            for i in range(4):
+                for j in range(4):
+                    pair = self.sensor.evaluate(views[n, i], views[n, j])
+                    for key in ("agreement", "disagreement", "agreement_consistency"):
+                        self.assertAlmostEqual(float(single[key][i, j]), pair[key], places=5)
+
+        with self.assertRaises(ValueError):
+            self.sensor.evaluate_views(views[0, 0])
+
 if __name__ == '__main__':
     unittest.main()
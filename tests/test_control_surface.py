@@ -1,9 +1,12 @@
 import unittest
+import dataclasses
 import sys
+import numpy as np
 from unittest.mock import MagicMock
 
 from reslik.diagnostics import ResLikDiagnostics
-from reslik.control_surface import ControlSurface, ControlAction, build_control_signal
+from reslik.control_surface import (ControlSurface, ControlAction, ControlReason,
+                                    MultiSensorControlSurface, build_control_signal)
 
 class TestControlSurface(unittest.TestCase):
     
@@ -55,5 +58,133 @@ class TestControlSurface(unittest.TestCase):
         signal = build_control_signal(dummy_output, diag, self.cs)
         self.assertEqual(signal.recommended_action, ControlAction.PROCEED)
 
+    def test_batch_matches_per_sample_evaluate(self):
+        gates = np.array([0.9, 0.6, 0.4, 0.95, 0.8, 0.5, 0.81], dtype=np.float32)
+        discs = np.array([1.0, 1.0, 1.0, 10.0, 1.0, 1.0, 5.0], dtype=np.float32)
+
+        codes, counts = self.cs.evaluate_batch(gates, discs)
+        self.assertEqual(codes.dtype, np.int8)
+
+        for g, d, code in zip(gates, discs, codes):
+            diag = ResLikDiagnostics(mean_gate_value=float(g), max_discrepancy=float(d))
+            self.assertEqual(ControlAction(int(code)), self.cs.evaluate(diag).recommended_action)
+
+        # float32(0.8) is slightly above 0.8, so it proceeds exactly as in evaluate()
+        self.assertEqual(counts, {ControlAction.PROCEED: 3, ControlAction.DOWNWEIGHT: 1,
+                                  ControlAction.DEFER: 2, ControlAction.ABSTAIN: 1})
+
+        with self.assertRaises(ValueError):
+            self.cs.evaluate_batch(gates, discs[:3])
+
+    def test_signal_uses_core_aggregates(self):
+        from reslik import ResLikUnit
+        data = np.random.default_rng(0).standard_normal((700, 8)).astype(np.float32) * 3.0
+        _, diag = ResLikUnit(8, 4, n_threads=2)(data)
+
+        signal = self.cs.evaluate(diag)
+        self.assertAlmostEqual(signal.mean_discrepancy,
+                               float(np.mean(diag.discrepancy_values, dtype=np.float64)), places=6)
+        self.assertEqual(signal.gate_summary["min"], float(diag.gate_values.min()))
+        self.assertEqual(signal.gate_summary["max"], float(diag.gate_values.max()))
+        self.assertAlmostEqual(signal.gate_summary["std"], float(np.std(diag.gate_values, dtype=np.float64)), places=5)
+        self.assertEqual(diag.discrepancy_stats.count, 700)
+        self.assertEqual(diag.max_discrepancy, float(diag.discrepancy_values.max()))
+
+        # Hand-built diagnostics without aggregates keep the previous fallback
+        plain = self.cs.evaluate(ResLikDiagnostics(mean_gate_value=0.9, max_discrepancy=1.0))
+        self.assertEqual(plain.mean_discrepancy, 0.0)
+        self.assertEqual(plain.gate_summary, {"mean": 0.9})
+
+    def test_slotted_signal_reuse(self):
+        from reslik.control_policy import ExecutionDecision
+        from reslik.diagnostics import SummaryStats
+        stats = SummaryStats.from_values(np.array([0.7, 0.9, 1.0], dtype=np.float32))
+        diag = ResLikDiagnostics(mean_gate_value=0.9, max_discrepancy=1.0,
+                                 gate_stats=stats, discrepancy_stats=stats)
+
+        signal = self.cs.evaluate(diag)
+        for obj in (diag, signal, stats, ExecutionDecision("PROCEED", 0.9)):
+            self.assertFalse(hasattr(obj, "__dict__"))
+        self.assertEqual(signal.gate_summary,
+                         {"mean": 0.9, "min": stats.min, "max": stats.max, "std": stats.std})
+
+        # Still a dataclass: asdict, replace and fields keep working
+        self.assertEqual(dataclasses.asdict(signal)["gate_summary"], signal.gate_summary)
+        self.assertEqual(dataclasses.replace(signal, reliability_score=0.5).reliability_score, 0.5)
+        self.assertEqual([f.name for f in dataclasses.fields(signal)],
+                         ["reliability_score", "mean_discrepancy", "max_discrepancy",
+                          "gate_summary", "recommended_action"])
+
+        # Reusing the signal overwrites every field, including the cached summary
+        reused = self.cs.evaluate(ResLikDiagnostics(mean_gate_value=0.4, max_discrepancy=1.0), out=signal)
+        self.assertIs(reused, signal)
+        self.assertEqual(reused, self.cs.evaluate(ResLikDiagnostics(mean_gate_value=0.4, max_discrepancy=1.0)))
+        self.assertEqual(reused.to_dict(), {"reliability_score": 0.4, "mean_discrepancy": 0.0,
+                                            "max_discrepancy": 1.0, "gate_summary": {"mean": 0.4},
+                                            "recommended_action": "DEFER"})
+
+        decision = ExecutionDecision("DEFER", 0.4)
+        decision.metadata["source"] = "reslik"
+        self.assertEqual(decision.to_dict(), {"action_id": "DEFER", "confidence": 0.4,
+                                              "metadata": {"source": "reslik"}})
+
+class TestMultiSensorControlSurface(unittest.TestCase):
+
+    def setUp(self):
+        self.mcs = MultiSensorControlSurface()
+
+    def test_precedence_and_reasons(self):
+        gates = np.array([0.9, 0.6, 0.9, 0.9, 0.6, 0.4, 0.9], dtype=np.float32)
+        discs = np.array([1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 9.0], dtype=np.float32)
+        tcs = np.array([0.9, 0.9, 0.1, 0.9, 0.1, 0.9, 0.1], dtype=np.float32)
+        agree = np.array([0.9, 0.9, 0.9, -0.5, 0.9, 0.9, -0.5], dtype=np.float32)
+
+        codes, reasons = self.mcs.evaluate(gates, discs, tcs, agree)
+        self.assertEqual(codes.dtype, np.int8)
+        self.assertEqual(reasons.dtype, np.uint8)
+
+        actions = [ControlAction(int(c)) for c in codes]
+        self.assertEqual(actions, [ControlAction.PROCEED, ControlAction.DOWNWEIGHT, ControlAction.DEFER,
+                                   ControlAction.DEFER, ControlAction.DEFER, ControlAction.DEFER,
+                                   ControlAction.ABSTAIN])
+
+        self.assertEqual(ControlReason(int(reasons[0])), ControlReason.NONE)
+        self.assertEqual(ControlReason(int(reasons[4])),
+                         ControlReason.RESLIK_MARGINAL | ControlReason.TCS_UNSTABLE)
+        self.assertEqual(ControlReason(int(reasons[6])),
+                         ControlReason.RESLIK_DISCREPANCY | ControlReason.TCS_UNSTABLE
+                         | ControlReason.AGREEMENT_CONFLICT)
+
+    def test_reslik_only_matches_control_surface(self):
+        gates = np.array([0.9, 0.6, 0.4, 0.95, 0.8, 0.5, 0.81], dtype=np.float32)
+        discs = np.array([1.0, 1.0, 1.0, 10.0, 1.0, 1.0, 5.0], dtype=np.float32)
+
+        codes, _ = self.mcs.evaluate(gates, discs)
+        expected, _ = ControlSurface().evaluate_batch(gates, discs)
+        np.testing.assert_array_equal(codes, expected)
+
+        with self.assertRaises(ValueError):
+            self.mcs.evaluate(gates, discs, temporal_consistency=np.ones(3))
+
+    def test_nan_signals_fail_safe(self):
+        gates = np.array([np.nan, 0.9, 0.9, 0.6], dtype=np.float32)
+        discs = np.array([1.0, 1.0, 1.0, 1.0], dtype=np.float32)
+        tcs = np.array([0.9, np.nan, 0.9, 0.9], dtype=np.float32)
+        agree = np.array([0.9, 0.9, np.nan, 0.9], dtype=np.float32)
+
+        # A NaN gate defers exactly as in ControlSurface.evaluate_batch
+        codes, reasons = self.mcs.evaluate(gates, discs)
+        expected, _ = ControlSurface().evaluate_batch(gates, discs)
+        np.testing.assert_array_equal(codes, expected)
+        self.assertEqual(ControlAction(int(codes[0])), ControlAction.DEFER)
+        self.assertEqual(ControlReason(int(reasons[0])), ControlReason.RESLIK_UNRELIABLE)
+
+        codes, reasons = self.mcs.evaluate(gates, discs, tcs, agree)
+        self.assertEqual([ControlAction(int(c)) for c in codes],
+                         [ControlAction.DEFER, ControlAction.DEFER, ControlAction.DEFER,
+                          ControlAction.DOWNWEIGHT])
+        self.assertEqual(ControlReason(int(reasons[1])), ControlReason.TCS_UNSTABLE)
+        self.assertEqual(ControlReason(int(reasons[2])), ControlReason.AGREEMENT_CONFLICT)
+
 if __name__ == '__main__':
     unittest.main()
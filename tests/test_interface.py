@@ -1,4 +1,6 @@
+import pickle
 import pytest
+import sys
 import numpy as np
 from reslik import ResLikUnit
 
@@ -52,3 +54,251 @@ def test_diagnostics_structure():
     assert hasattr(diag, "max_discrepancy")
     assert isinstance(diag.to_dict(), dict)
     assert "Mean Gate Value" in diag.summary()
+
+def test_batch_matches_single_sample():
+    unit = ResLikUnit(12, 6)
+    data = np.random.randn(4, 12).astype(np.float32)
+
+    batch_out, batch_diag = unit(data, ref_mean=0.1, ref_std=0.8)
+
+    for i in range(data.shape[0]):
+        row_out, row_diag = unit(data[i], ref_mean=0.1, ref_std=0.8)
+        np.testing.assert_array_equal(batch_out[i], row_out)
+        assert batch_diag.per_sample_details[i]["mean_gate"] == row_diag.mean_gate_value
+        assert batch_diag.per_sample_details[i]["max_discrepancy"] == row_diag.max_discrepancy
+
+def test_output_buffer_is_written_in_place():
+    unit = ResLikUnit(8, 4)
+    data = np.random.randn(3, 8).astype(np.float32)
+    expected, _ = unit(data)
+
+    buf = np.empty((3, 4), dtype=np.float32)
+    output, _ = unit(data, out=buf)
+    assert output is buf
+    np.testing.assert_array_equal(buf, expected)
+
+    row_buf = np.empty(4, dtype=np.float32)
+    row_out, _ = unit(data[0], out=row_buf)
+    assert np.shares_memory(row_out, row_buf)
+    np.testing.assert_array_equal(row_buf, expected[0])
+
+    with pytest.raises(ValueError, match="C-contiguous"):
+        unit(data, out=np.empty((3, 4), dtype=np.int32))
+    with pytest.raises(ValueError, match="shape"):
+        unit(data, out=np.empty((2, 4), dtype=np.float32))
+
+def test_native_half_and_double_kernels():
+    unit = ResLikUnit(16, 8)
+    data = np.random.randn(64, 16).astype(np.float32)
+    ref_out, ref_diag = unit(data)
+
+    half = data.astype(np.float16)
+    half_out, _ = unit(half)
+    np.testing.assert_array_equal(half_out, unit(half.astype(np.float32))[0])
+
+    out16, diag16 = unit(data, out_dtype=np.float16)
+    assert out16.dtype == np.float16
+    np.testing.assert_array_equal(out16, ref_out.astype(np.float16))
+    np.testing.assert_array_equal(diag16.gate_values, ref_diag.gate_values)
+
+    out64, _ = unit(data.astype(np.float64), out_dtype=np.float64)
+    assert out64.dtype == np.float64
+    np.testing.assert_allclose(out64, ref_out, rtol=1e-4, atol=1e-5)
+
+    with pytest.raises(ValueError, match="out_dtype"):
+        unit(data, out=np.empty((64, 8), dtype=np.float32), out_dtype=np.float16)
+
+def test_threaded_batch_matches_serial():
+    data = np.random.randn(3000, 16).astype(np.float32)
+    serial_out, serial_diag = ResLikUnit(16, 8, n_threads=1)(data)
+    threaded_out, threaded_diag = ResLikUnit(16, 8, n_threads=4)(data)
+
+    np.testing.assert_array_equal(serial_out, threaded_out)
+    assert serial_diag.mean_gate_value == threaded_diag.mean_gate_value
+    assert serial_diag.max_discrepancy == threaded_diag.max_discrepancy
+
+    with pytest.raises(ValueError, match="n_threads"):
+        ResLikUnit(16, 8, n_threads=-1)
+
+def test_shared_unit_is_thread_safe():
+    from concurrent.futures import ThreadPoolExecutor
+
+    unit = ResLikUnit(16, 8)
+    data = np.random.randn(512, 16).astype(np.float32)
+    settings = [(0.0, 1.0, 1.0), (2.0, 0.5, 3.0), (-1.0, 2.0, 0.1), (0.5, 1.5, 0.5)] * 8
+
+    expected = [unit(data, ref_mean=m, ref_std=s, gating_lambda=lam) for m, s, lam in settings]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda p: unit(data, ref_mean=p[0], ref_std=p[1], gating_lambda=p[2]), settings))
+
+    for (exp_out, exp_diag), (out, diag) in zip(expected, results):
+        np.testing.assert_array_equal(out, exp_out)
+        assert diag.mean_gate_value == exp_diag.mean_gate_value
+        assert diag.max_discrepancy == exp_diag.max_discrepancy
+
+def test_columnar_diagnostics():
+    unit = ResLikUnit(10, 5)
+    data = np.random.randn(6, 10).astype(np.float32)
+    data[2] += 4.0
+
+    _, diag = unit(data)
+
+    assert diag.gate_values.dtype == np.float32 and diag.gate_values.shape == (6,)
+    assert diag.discrepancy_values.dtype == np.float32 and diag.discrepancy_values.shape == (6,)
+    assert diag.mean_gate_value == pytest.approx(float(np.mean(diag.gate_values, dtype=np.float64)))
+    assert diag.max_discrepancy == float(diag.discrepancy_values[2])
+
+    # Dict-style access is materialized lazily from the columns
+    details = diag.per_sample_details
+    assert len(details) == 6
+    assert details[2] == {
+        "mean_gate": float(diag.gate_values[2]),
+        "max_discrepancy": float(diag.discrepancy_values[2]),
+    }
+    assert [d["max_discrepancy"] for d in details] == diag.discrepancy_values.tolist()
+
+    as_dict = diag.to_dict()
+    assert set(as_dict) == {"mean_gate_value", "max_discrepancy", "per_sample_details"}
+    assert as_dict["per_sample_details"] == list(details)
+
+    # Slotted container: no per-instance dict, still picklable
+    assert not hasattr(diag, "__dict__")
+    restored = pickle.loads(pickle.dumps(diag))
+    assert restored == diag and restored.discrepancy_stats == diag.discrepancy_stats
+
+def test_non_finite_row_is_reported():
+    data = np.random.randn(600, 10).astype(np.float32)
+    data[417, 3] = np.inf
+    data[523, 0] = np.nan
+
+    for n_threads in (1, 2):
+        unit = ResLikUnit(10, 5, n_threads=n_threads)
+        with pytest.raises(ValueError, match="first at row 417"):
+            unit(data)
+
+class _DLPackTensor:
+    """Minimal CPU tensor type exporting its storage through DLPack."""
+    def __init__(self, data, requires_grad=False):
+        self.data = data
+        self.requires_grad = requires_grad
+
+    def __dlpack__(self, **kwargs):
+        return self.data.__dlpack__(**kwargs)
+
+    def __dlpack_device__(self):
+        return self.data.__dlpack_device__()
+
+    def detach(self):
+        return _DLPackTensor(self.data)
+
+def test_dlpack_tensors_round_trip(monkeypatch):
+    import types
+    from reslik.interop import import_array
+
+    framework = types.ModuleType("fakeframework")
+    framework.from_dlpack = lambda x: _DLPackTensor(np.from_dlpack(x))
+    monkeypatch.setitem(sys.modules, "fakeframework", framework)
+    monkeypatch.setattr(_DLPackTensor, "__module__", "fakeframework")
+
+    data = np.random.randn(10, 6).astype(np.float32)
+    viewed, export = import_array(_DLPackTensor(data))
+    assert np.shares_memory(viewed, data)
+    assert export is framework.from_dlpack
+
+    unit = ResLikUnit(6, 4)
+    expected, _ = unit(data)
+    output, _ = unit(_DLPackTensor(data))
+    assert isinstance(output, _DLPackTensor)
+    np.testing.assert_array_equal(output.data, expected)
+
+    with pytest.warns(UserWarning, match="requires_grad"):
+        output, _ = unit(_DLPackTensor(data, requires_grad=True))
+    np.testing.assert_array_equal(output.data, expected)
+
+def test_stream_matches_full_batch():
+    unit = ResLikUnit(12, 6)
+    rng = np.random.default_rng(3)
+    data = rng.standard_normal((1000, 12)).astype(np.float32)
+    data[777] += 6.0
+    unit.update_stats(data[:200])
+
+    full_out, full_diag = unit(data)
+
+    # Generator input: chunks are pulled one at a time
+    stream = unit.stream(data[i:i + 300] for i in range(0, len(data), 300))
+    outputs = []
+    for out, diag in stream:
+        assert out.shape == (len(diag.gate_values), 6)
+        outputs.append(out)
+    assert stream.n_chunks == 4 and stream.n_samples == 1000
+    np.testing.assert_array_equal(np.concatenate(outputs), full_out)
+
+    summary = stream.summary
+    assert summary.max_discrepancy == full_diag.max_discrepancy
+    assert summary.mean_gate_value == pytest.approx(full_diag.mean_gate_value, rel=1e-12)
+    assert summary.gate_stats.min == full_diag.gate_stats.min
+    assert summary.discrepancy_stats.std == pytest.approx(full_diag.discrepancy_stats.std, rel=1e-9)
+
+    # Summary-only scoring; reference stats are fixed when the stream is created
+    fixed = unit.stream(np.array_split(data, 7))
+    unit.reset_stats()
+    assert fixed.run().mean_gate_value == pytest.approx(full_diag.mean_gate_value, rel=1e-12)
+
+class _CSR:
+    """Plain CSR container (no scipy needed)."""
+    def __init__(self, dense):
+        rows, cols = np.nonzero(dense)
+        self.data = dense[rows, cols]
+        self.indices = cols.astype(np.int32)
+        self.indptr = np.concatenate([[0], np.cumsum(np.count_nonzero(dense, axis=1))]).astype(np.int32)
+        self.shape = dense.shape
+
+def test_sparse_input_matches_dense():
+    rng = np.random.default_rng(11)
+    dense = np.where(rng.random((700, 120)) < 0.05, rng.poisson(4.0, (700, 120)) + 1.0, 0.0).astype(np.float32)
+    dense[10] = 0.0
+    dense[20, 5] = 60.0
+    unit = ResLikUnit(120, 16, n_threads=2)
+
+    expected_out, expected = unit(dense, ref_mean=0.1, ref_std=0.4)
+    out, diag = unit(_CSR(dense), ref_mean=0.1, ref_std=0.4)
+
+    np.testing.assert_allclose(out, expected_out, rtol=1e-4, atol=1e-5)
+    np.testing.assert_array_equal(diag.discrepancy_values, expected.discrepancy_values)
+    np.testing.assert_allclose(diag.gate_values, expected.gate_values, rtol=1e-6)
+    assert diag.gate_stats.count == 700
+
+    sparse = pytest.importorskip("scipy.sparse")
+    # Non-canonical matrices (duplicates summed on a copy) and wide indices also work
+    coo = sparse.coo_matrix(dense)
+    doubled = sparse.csr_matrix((np.concatenate([coo.data, coo.data]),
+                                 (np.concatenate([coo.row, coo.row]), np.concatenate([coo.col, coo.col]))),
+                                shape=dense.shape)
+    doubled.has_canonical_format = False
+    out2, _ = unit(doubled, ref_mean=0.1, ref_std=0.4)
+    np.testing.assert_allclose(out2, unit(2 * dense, ref_mean=0.1, ref_std=0.4)[0], rtol=1e-4, atol=1e-5)
+
+    with pytest.raises(ValueError, match="float32 output"):
+        unit(_CSR(dense), out_dtype=np.float16)
+
+def test_sparse_float64_overflow_rows_match_dense():
+    # Finite values whose sums of squares overflow double are rescaled, not rejected
+    dense = np.zeros((4, 8))
+    dense[0, [0, 2, 4, 5]] = [1e200, -1e200, 3e199, -3e199]
+    dense[1, [1, 6]] = [1.7e308, -1.7e308]
+    dense[2, [0, 3]] = [0.5, -2.0]
+    dense[3, [2, 5]] = [1.5e308, 1.5e308]  # the row sum itself overflows
+    unit = ResLikUnit(8, 6)
+
+    expected_out, expected = unit(dense, ref_mean=0.0, ref_std=1.0)
+    out, diag = unit(_CSR(dense), ref_mean=0.0, ref_std=1.0)
+
+    assert np.all(np.isfinite(out)) and np.any(out[:2] != 0.0)
+    np.testing.assert_allclose(out, expected_out, rtol=1e-4, atol=1e-5)
+    np.testing.assert_array_equal(diag.discrepancy_values, expected.discrepancy_values)
+    np.testing.assert_allclose(diag.gate_values, expected.gate_values, rtol=1e-6)
+
+    dense[2, 3] = np.nan
+    with pytest.raises(ValueError, match="row 2"):
+        unit(_CSR(dense))
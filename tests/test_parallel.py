@@ -0,0 +1,68 @@
+import gc
+import os
+import pickle
+import numpy as np
+import pytest
+from reslik import ResLikUnit, parallel
+from reslik.parallel import SharedMemoryExecutor
+
+def _worker_n_threads(_):
+    return parallel._worker_unit.n_threads
+
+def test_unit_pickles_with_reference_state():
+    unit = ResLikUnit(8, 4, n_threads=2)
+    unit.update_stats(np.random.default_rng(1).standard_normal((50, 8)))
+    clone = pickle.loads(pickle.dumps(unit))
+
+    data = np.random.default_rng(2).standard_normal((20, 8)).astype(np.float32)
+    np.testing.assert_array_equal(clone(data)[0], unit(data)[0])
+    assert clone.reference_stats.to_dict() == unit.reference_stats.to_dict()
+    assert clone.n_threads == 2
+
+def test_shared_memory_executor_matches_single_process():
+    rng = np.random.default_rng(3)
+    data = rng.standard_normal((1500, 24)).astype(np.float32)
+    data[1234] += 7.0
+    unit = ResLikUnit(24, 12)
+    unit.update_stats(data[:300])
+
+    expected_out, expected = unit(data, gating_lambda=1.5)
+    with SharedMemoryExecutor(unit, n_workers=3) as pool:
+        out, diag = pool(data, gating_lambda=1.5)
+
+        bad = data.copy()
+        bad[1100, 2] = np.nan
+        with pytest.raises(ValueError, match="first at row 1100"):
+            pool(bad)
+
+    np.testing.assert_array_equal(out, expected_out)
+    np.testing.assert_array_equal(diag.gate_values, expected.gate_values)
+    np.testing.assert_array_equal(diag.discrepancy_values, expected.discrepancy_values)
+    assert diag.max_discrepancy == expected.max_discrepancy
+    assert diag.mean_gate_value == pytest.approx(expected.mean_gate_value, rel=1e-12)
+
+def test_shared_input_batch_is_used_in_place(tmp_path):
+    data = np.random.default_rng(4).standard_normal((700, 16)).astype(np.float32)
+    unit = ResLikUnit(16, 8, n_threads=0)
+    n_threads = unit.n_threads
+
+    with SharedMemoryExecutor(unit, n_workers=2, shared_dir=str(tmp_path)) as pool:
+        batch = pool.empty(len(data))
+        batch[:] = data
+        view = batch[10:20]
+        out, diag = pool(batch)
+        # Only the caller's input file remains; outputs are mapped from unlinked files
+        assert os.listdir(tmp_path) == [os.path.basename(batch.filename)]
+        np.testing.assert_array_equal(out, unit(data)[0])
+
+        # The file lives as long as any view of the batch
+        del batch
+        gc.collect()
+        assert len(os.listdir(tmp_path)) == 1
+        del view
+        gc.collect()
+        assert os.listdir(tmp_path) == []
+
+        # Workers run the core single-threaded whatever the parent unit uses
+        assert pool._pool.submit(_worker_n_threads, None).result() == 1
+    assert unit.n_threads == n_threads
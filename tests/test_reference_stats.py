@@ -0,0 +1,82 @@
+import json
+import pytest
+import numpy as np
+from reslik import ResLikUnit, ReferenceStats, merge_reference_stats
+
+def test_streaming_fit_matches_full_pass():
+    data = np.random.normal(0.7, 2.5, (1000, 16)).astype(np.float32)
+
+    stats = ReferenceStats()
+    for chunk in np.array_split(data, 7):
+        stats.update(chunk)
+
+    assert stats.count == data.size
+    assert stats.ref_mean == pytest.approx(float(data.astype(np.float64).mean()), rel=1e-9)
+    assert stats.ref_std == pytest.approx(float(data.astype(np.float64).std()), rel=1e-9)
+
+def test_float64_reference_keeps_precision():
+    # Offsets below float32 resolution around 1.0 must survive accumulation
+    data = 1.0 + 1e-9 * np.arange(1000, dtype=np.float64)
+    stats = ReferenceStats().update(data)
+
+    assert stats.ref_mean == pytest.approx(float(data.mean()), rel=1e-14)
+    assert stats.ref_std == pytest.approx(float(data.std()), rel=1e-6)
+
+def test_shard_states_merge_exactly():
+    data = np.random.normal(-1.0, 0.5, (900, 8)).astype(np.float32)
+    full = ReferenceStats().update(data)
+
+    # Serialize shard states as parallel workers would, then merge
+    shards = [json.dumps(ReferenceStats().update(part).to_dict()) for part in np.array_split(data, 3)]
+    merged = merge_reference_stats(json.loads(s) for s in shards)
+
+    assert merged.count == full.count
+    assert merged.mean == pytest.approx(full.mean, rel=1e-12)
+    assert merged.m2 == pytest.approx(full.m2, rel=1e-9)
+
+def test_unit_uses_fitted_reference():
+    unit = ResLikUnit(10, 5)
+    reference = np.random.normal(3.0, 2.0, (500, 10)).astype(np.float32)
+    for chunk in np.array_split(reference, 5):
+        unit.update_stats(chunk)
+
+    fitted = unit.reference_stats
+    assert fitted.count == reference.size
+
+    data = np.random.normal(3.0, 2.0, (20, 10)).astype(np.float32)
+    out_default, diag_default = unit(data)
+    out_explicit, diag_explicit = unit(data, ref_mean=fitted.ref_mean, ref_std=fitted.ref_std)
+    np.testing.assert_array_equal(out_default, out_explicit)
+    assert diag_default.max_discrepancy == diag_explicit.max_discrepancy
+
+    # Loading a merged state from elsewhere replaces the fit
+    other = ResLikUnit(10, 5)
+    other.load_reference_stats(fitted)
+    assert other.reference_stats.to_dict() == fitted.to_dict()
+
+    unit.reset_stats()
+    assert unit.reference_stats.count == 0
+
+def test_unit_fits_large_mean_float64_reference():
+    # float32 spacing at 1e6 is 0.0625, far above the spread of this reference
+    data = 1e6 + np.random.default_rng(0).normal(0.0, 1e-3, (500, 10))
+    unit = ResLikUnit(10, 5)
+    unit.update_stats(data)
+
+    fitted = unit.reference_stats
+    assert fitted.ref_mean == pytest.approx(float(data.mean()), rel=1e-14)
+    assert fitted.ref_std == pytest.approx(float(data.std()), rel=1e-6)
+
+    # The fitted default is usable
+    out, _ = unit(data[:20].astype(np.float32))
+    assert np.all(np.isfinite(out))
+
+def test_update_stats_validation():
+    unit = ResLikUnit(4, 2)
+    with pytest.raises(ValueError, match="shape"):
+        unit.update_stats(np.zeros((3, 5)))
+    bad = np.zeros((2, 4))
+    bad[1, 2] = np.inf
+    with pytest.raises(ValueError, match="Non-finite"):
+        unit.update_stats(bad)
+    assert unit.reference_stats.count == 0
@@ -0,0 +1,71 @@
+import json
+import os
+import numpy as np
+import pytest
+from reslik import ResLikUnit
+from reslik.storage import score_file, open_embeddings, PROGRESS_FILE
+
+class _InterruptedUnit(ResLikUnit):
+    """Same weights as ResLikUnit, but fails after a fixed number of blocks."""
+    def __init__(self, *args, fail_after, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.remaining = fail_after
+
+    def __call__(self, *args, **kwargs):
+        if self.remaining == 0:
+            raise KeyboardInterrupt
+        self.remaining -= 1
+        return super().__call__(*args, **kwargs)
+
+def test_score_file_matches_in_memory(tmp_path):
+    data = np.random.default_rng(5).standard_normal((1000, 16)).astype(np.float32)
+    data[640] += 8.0
+    np.save(tmp_path / "emb.npy", data)
+    unit = ResLikUnit(16, 8)
+
+    diag = score_file(unit, str(tmp_path / "emb.npy"), str(tmp_path / "out"), block_rows=300)
+    expected_out, expected = unit(data)
+
+    np.testing.assert_array_equal(np.load(tmp_path / "out" / "outputs.npy"), expected_out)
+    np.testing.assert_array_equal(diag.gate_values, expected.gate_values)
+    np.testing.assert_array_equal(diag.discrepancy_values, expected.discrepancy_values)
+    assert isinstance(diag.gate_values, np.memmap)
+    assert diag.max_discrepancy == expected.max_discrepancy
+    assert diag.mean_gate_value == pytest.approx(expected.mean_gate_value, rel=1e-12)
+
+    # Uncompressed .npz members are mapped in place as well
+    np.savez(tmp_path / "emb.npz", other=np.zeros(3), emb=data)
+    mapped = open_embeddings(str(tmp_path / "emb.npz"), key="emb")
+    assert isinstance(mapped, np.memmap)
+    np.testing.assert_array_equal(mapped, data)
+
+def test_score_file_resumes_after_interruption(tmp_path):
+    data = np.random.default_rng(6).standard_normal((1000, 16)).astype(np.float32)
+    path, out_dir = str(tmp_path / "emb.npy"), str(tmp_path / "out")
+    np.save(path, data)
+
+    with pytest.raises(KeyboardInterrupt):
+        score_file(_InterruptedUnit(16, 8, fail_after=2), path, out_dir, block_rows=300)
+    with open(os.path.join(out_dir, PROGRESS_FILE)) as f:
+        assert json.load(f)["next_row"] == 600
+
+    # Only the two remaining blocks are processed on resume
+    resumed = _InterruptedUnit(16, 8, fail_after=2)
+    diag = score_file(resumed, path, out_dir, block_rows=300)
+    assert resumed.remaining == 0
+
+    expected_out, expected = ResLikUnit(16, 8)(data)
+    np.testing.assert_array_equal(np.load(os.path.join(out_dir, "outputs.npy")), expected_out)
+    np.testing.assert_array_equal(diag.discrepancy_values, expected.discrepancy_values)
+    assert diag.gate_stats.count == 1000
+
+    with pytest.raises(ValueError, match="different input or parameters"):
+        score_file(ResLikUnit(16, 8), path, out_dir, gating_lambda=2.0)
+
+    # A different file of the same shape at the same path must not be resumed
+    with pytest.raises(KeyboardInterrupt):
+        score_file(_InterruptedUnit(16, 8, fail_after=1), path, out_dir, block_rows=300, resume=False)
+    np.save(path, data[::-1].copy())
+    os.utime(path, ns=(0, 0))
+    with pytest.raises(ValueError, match="different input or parameters"):
+        score_file(ResLikUnit(16, 8), path, out_dir, block_rows=300)
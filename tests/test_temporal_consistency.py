@@ -3,7 +3,9 @@ import numpy as np
 import sys
 from unittest.mock import MagicMock
 
-from reslik.sensors.temporal_consistency import TemporalConsistencySensor
+from reslik.sensors.temporal_consistency import (
+    TemporalConsistencySensor, MultiStreamTemporalConsistencySensor, MultiLagTemporalConsistencySensor
+)
 
 class TestTemporalConsistencySensor(unittest.TestCase):
     
@@ -102,5 +104,104 @@ class TestTemporalConsistencySensor(unittest.TestCase):
         self.assertAlmostEqual(metrics_small['temporal_drift'], metrics_big['temporal_drift'], places=5,
                                msg="Sensor should be scale-invariant due to normalization")
 
+    def test_multi_stream_matches_independent_sensors(self):
+        """Multi-stream storage gives the same scores as one sensor per stream"""
+        rng = np.random.default_rng(0)
+        multi = MultiStreamTemporalConsistencySensor(dim=6, capacity=2, alpha=0.7)
+        singles = {}
+
+        ticks = [["a", "b"], ["b", "c", "a"], ["c", "d", "e"], ["a", "e"]]
+        for ids in ticks:
+            Z = rng.standard_normal((len(ids), 6)).astype(np.float32)
+            result = multi.update_many(ids, Z)
+            for i, stream_id in enumerate(ids):
+                sensor = singles.setdefault(stream_id, TemporalConsistencySensor(alpha=0.7))
+                expected = sensor.update(Z[i])
+                self.assertEqual(float(result['temporal_drift'][i]), expected['temporal_drift'])
+                self.assertEqual(float(result['temporal_consistency'][i]), expected['temporal_consistency'])
+
+        self.assertEqual(len(multi), 5)
+        self.assertGreaterEqual(multi.capacity, 5)
+
+        # Evicted streams restart from scratch and their slot is reused
+        capacity = multi.capacity
+        multi.evict("a")
+        self.assertNotIn("a", multi)
+        result = multi.update_many(["a"], np.ones((1, 6), dtype=np.float32))
+        self.assertEqual(float(result['temporal_drift'][0]), 0.0)
+        self.assertEqual(multi.capacity, capacity)
+
+        with self.assertRaises(ValueError):
+            multi.update_many(["b", "b"], np.ones((2, 6), dtype=np.float32))
+
+    def test_sequence_matches_streaming_updates(self):
+        """Offline (T, d) and (B, T, d) evaluation equals step-by-step update() exactly"""
+        rng = np.random.default_rng(3)
+        trajectories = np.cumsum(rng.standard_normal((3, 40, 12)), axis=1).astype(np.float32)
+        sensor = TemporalConsistencySensor(alpha=0.5)
+
+        batched = sensor.evaluate_sequence(trajectories)
+        self.assertEqual(batched['temporal_drift'].shape, (3, 40))
+
+        for b in range(3):
+            series = sensor.evaluate_sequence(trajectories[b])
+            sensor.reset()
+            for t in range(40):
+                step = sensor.update(trajectories[b, t])
+                self.assertEqual(float(series['temporal_drift'][t]), step['temporal_drift'])
+                self.assertEqual(float(series['temporal_consistency'][t]), step['temporal_consistency'])
+                self.assertEqual(float(batched['temporal_drift'][b, t]), step['temporal_drift'])
+
+    def test_multi_lag_matches_explicit_history(self):
+        """Ring-buffer lags and window mean agree with a brute-force history"""
+        rng = np.random.default_rng(4)
+        sequence = np.cumsum(0.1 * rng.standard_normal((60, 5)), axis=0).astype(np.float32) + 1.0
+        sensor = MultiLagTemporalConsistencySensor(dim=5, lags=(1, 4, 16), window=8, alpha=2.0)
+        lag1 = TemporalConsistencySensor(alpha=2.0)
+        self.assertEqual(sensor.history, 16)
+
+        for t, z in enumerate(sequence):
+            metrics = sensor.update(z)
+            self.assertAlmostEqual(metrics['temporal_drift_lag_1'], lag1.update(z)['temporal_drift'], places=5)
+            for lag in (4, 16):
+                expected = 0.0
+                if t >= lag:
+                    past = sequence[t - lag].astype(np.float64)
+                    expected = np.linalg.norm(z - past) / (np.linalg.norm(past) + 1e-6)
+                self.assertAlmostEqual(metrics[f'temporal_drift_lag_{lag}'], expected, places=5)
+                self.assertAlmostEqual(metrics[f'temporal_consistency_lag_{lag}'], np.exp(-2.0 * expected), places=5)
+            if t > 0:
+                mean = sequence[max(0, t - 8):t].astype(np.float64).mean(axis=0)
+                expected = np.linalg.norm(z - mean) / (np.linalg.norm(mean) + 1e-6)
+                self.assertAlmostEqual(metrics['temporal_drift_window'], expected, places=5)
+
+        sensor.reset()
+        self.assertEqual(sensor.update(sequence[0])['temporal_drift_window'], 0.0)
+
+    def test_multi_lag_update_into_and_window_resync(self):
+        """update_into matches update, and the window sum is exact after each full window"""
+        rng = np.random.default_rng(5)
+        sequence = (100.0 + rng.standard_normal((70, 6))).astype(np.float32)
+        for window in (5, 10):
+            sensor = MultiLagTemporalConsistencySensor(dim=6, lags=(1, 10), window=window)
+            twin = MultiLagTemporalConsistencySensor(dim=6, lags=(1, 10), window=window)
+            out = np.empty((2, 3))
+
+            for t, z in enumerate(sequence):
+                metrics = sensor.update(z)
+                self.assertIs(twin.update_into(z, out), out)
+                np.testing.assert_array_equal(out[0], [metrics['temporal_drift_lag_1'],
+                                                       metrics['temporal_drift_lag_10'],
+                                                       metrics['temporal_drift_window']])
+                np.testing.assert_array_equal(out[1], [metrics['temporal_consistency_lag_1'],
+                                                       metrics['temporal_consistency_lag_10'],
+                                                       metrics['temporal_consistency_window']])
+                if (t + 1) % window == 0:
+                    expected = sequence[t + 1 - window:t + 1].astype(np.float64).sum(axis=0)
+                    np.testing.assert_allclose(sensor._window_sum, expected, rtol=1e-12)
+
+            with self.assertRaises(ValueError):
+                sensor.update_into(sequence[0], np.empty((2, 2)))
+
 if __name__ == '__main__':
     unittest.main()